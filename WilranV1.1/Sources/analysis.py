@@ -0,0 +1,243 @@
+from distributions import damage_distribution, distribution_stats, halve, mean_of, mix
+from engine import (ABILITY_NAMES, PokemonInstance, as_instance, best_power_ability,
+                    damage_bonuses, get_move_mechanics, parse_dice, type_chart)
+from rng import derive_seed
+
+try:
+    import numpy as np
+except ImportError:  # optional - only the Monte Carlo analyzer needs it
+    np = None
+
+DEFAULT_SAMPLES = 1_000_000
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def require_numpy():
+    if np is None:
+        raise RuntimeError(
+            "The damage analyzer needs NumPy (pip install numpy)")
+
+
+def move_id_from_name(move_name):
+    return move_name.lower().replace(" ", "-")
+
+
+def pokemon_at_level(species, level):
+    """A species at a level with its base attributes and every move it can know
+
+    No nature, ASIs or move sampling - the point is a stable baseline for balancing.
+    """
+    attributes = species.data.get("attributes", {})
+    level_stats = species.at_level(level)
+    return PokemonInstance(
+        species.name.upper(), level,
+        [attributes.get(ability, 10) for ability in ABILITY_NAMES],
+        level_stats.proficiency_bonus, species.types,
+        moves=[m.replace("-", " ").title() for m in level_stats.move_pool])
+
+
+def roll_dice_batch(np_rng, count, sides, samples):
+    """Sum of count dice with the given sides, samples times"""
+    total = np.zeros(samples, dtype=np.int64)
+    for _ in range(count):
+        total += np_rng.integers(1, sides + 1, size=samples)
+    return total
+
+
+def move_setup(pokemon, move_id):
+    """(mechanics, dice, ability mod, proficiency, flat bonus), or None if the move deals no damage"""
+    mechanics = get_move_mechanics(move_id)
+    if not mechanics:
+        return None
+    dice_str = mechanics.dice_for_level(pokemon.level)
+    if not dice_str or not parse_dice(dice_str):
+        return None
+
+    _, ability_mod = best_power_ability(mechanics.power_abilities, pokemon)
+    prof = pokemon.proficiency_bonus
+    flat_bonus = sum(damage_bonuses(mechanics, pokemon, ability_mod))
+    return mechanics, dice_str, ability_mod, prof, flat_bonus
+
+
+def simulate_move(pokemon, move_id, np_rng, samples=DEFAULT_SAMPLES,
+                  target_ac=13, save_bonus=0, target_hp=None):
+    """Monte Carlo damage statistics for one move, or None if it deals no damage
+
+    Follows the attack_roll/calculate_move_damage rules: best power ability,
+    level-scaled dice, crits on a natural 20 double the dice, ability and STAB
+    bonuses. Attack rolls hit on total >= AC (natural 1 misses, natural 20 hits);
+    save moves deal full damage on a failed save and half on a success when
+    the description says so.
+    """
+    require_numpy()
+    setup = move_setup(as_instance(pokemon), move_id)
+    if not setup:
+        return None
+    mechanics, dice_str, ability_mod, prof, flat_bonus = setup
+    count, sides = parse_dice(dice_str)
+
+    dice = roll_dice_batch(np_rng, count, sides, samples)
+    crit_dice = np.zeros(samples, dtype=np.int64)
+    if mechanics.has_attack:
+        kind = "attack"
+        d20 = np_rng.integers(1, 21, size=samples)
+        is_crit = d20 == 20
+        success = is_crit | ((d20 != 1) & (d20 + ability_mod + prof >= target_ac))
+        crit_dice = np.where(is_crit, roll_dice_batch(
+            np_rng, count, sides, samples), 0)
+        damage = np.where(success, dice + crit_dice + flat_bonus, 0)
+    elif mechanics.has_save:
+        kind = "save"
+        is_crit = np.zeros(samples, dtype=bool)
+        save_dc = 8 + ability_mod + prof
+        success = np_rng.integers(1, 21, size=samples) + save_bonus < save_dc
+        full = dice + flat_bonus
+        damage = np.where(success, full, full // 2 if mechanics.half_on_save else 0)
+    else:
+        # No attack roll or save - the damage just happens
+        kind = "auto"
+        is_crit = np.zeros(samples, dtype=bool)
+        success = np.ones(samples, dtype=bool)
+        damage = dice + flat_bonus
+
+    mean = float(damage.mean())
+    crit_mean = float(crit_dice.mean())
+    result = {
+        "move": mechanics.move_id,
+        "kind": kind,
+        "dice": dice_str,
+        "flat_bonus": flat_bonus,
+        "samples": samples,
+        "success_rate": float(success.mean()),
+        "crit_rate": float(is_crit.mean()),
+        "mean": mean,
+        "variance": float(damage.var()),
+        "std": float(damage.std()),
+        "percentiles": dict(zip(PERCENTILES, (float(v) for v in np.percentile(damage, PERCENTILES)))),
+        "crit_contribution": crit_mean,
+        "crit_share": crit_mean / mean if mean else 0.0,
+    }
+    if target_hp is not None:
+        result["kill_probability"] = float((damage >= target_hp).mean())
+    return result
+
+
+def exact_move(pokemon, move_id, target_ac=13, save_bonus=0, target_hp=None):
+    """Same statistics as simulate_move, computed exactly from the dice distributions"""
+    setup = move_setup(as_instance(pokemon), move_id)
+    if not setup:
+        return None
+    mechanics, dice_str, ability_mod, prof, flat_bonus = setup
+
+    normal = damage_distribution(dice_str, flat_bonus)
+    miss = ((0, 1.0),)
+    crit_rate = crit_mean = 0.0
+    if mechanics.has_attack:
+        kind = "attack"
+        crit_rate = 1 / 20
+        # Natural 1 always misses, natural 20 is the crit
+        hit_rate = sum(1 for d20 in range(2, 20)
+                       if d20 + ability_mod + prof >= target_ac) / 20
+        success_rate = hit_rate + crit_rate
+        crit = damage_distribution(dice_str, flat_bonus, True)
+        dist = mix([(hit_rate, normal), (crit_rate, crit),
+                   (1 - success_rate, miss)])
+        crit_mean = crit_rate * (mean_of(crit) - mean_of(normal))
+    elif mechanics.has_save:
+        kind = "save"
+        save_dc = 8 + ability_mod + prof
+        success_rate = sum(1 for d20 in range(1, 21)
+                           if d20 + save_bonus < save_dc) / 20
+        on_success = halve(normal) if mechanics.half_on_save else miss
+        dist = mix([(success_rate, normal), (1 - success_rate, on_success)])
+    else:
+        kind = "auto"
+        success_rate = 1.0
+        dist = normal
+
+    stats = distribution_stats(dist, PERCENTILES, target_hp)
+    result = {
+        "move": mechanics.move_id,
+        "kind": kind,
+        "dice": dice_str,
+        "flat_bonus": flat_bonus,
+        "samples": "exact",
+        "success_rate": success_rate,
+        "crit_rate": crit_rate,
+        "mean": stats["mean"],
+        "variance": stats["variance"],
+        "std": stats["std"],
+        "percentiles": stats["percentiles"],
+        "crit_contribution": crit_mean,
+        "crit_share": crit_mean / stats["mean"] if stats["mean"] else 0.0,
+    }
+    if target_hp is not None:
+        result["kill_probability"] = stats["kill_probability"]
+    return result
+
+
+def analyze_pokemon(pokemon, samples=DEFAULT_SAMPLES, target_ac=13, save_bonus=0,
+                    target_hp=None, seed=None, exact=False):
+    """simulate_move (or exact_move) for every damaging move the Pokémon knows"""
+    pokemon = as_instance(pokemon)
+    if not exact:
+        require_numpy()
+        np_rng = np.random.default_rng(
+            None if seed is None else derive_seed(seed, "analysis"))
+    results = []
+    for move_name in pokemon.moves:
+        move_id = move_id_from_name(move_name)
+        if exact:
+            result = exact_move(pokemon, move_id, target_ac,
+                                save_bonus, target_hp)
+        else:
+            result = simulate_move(pokemon, move_id, np_rng, samples,
+                                   target_ac, save_bonus, target_hp)
+        if result:
+            results.append(result)
+    return results
+
+
+def best_moves(results, defenders):
+    """Best move against each defender's typing, by mean damage times type effectiveness
+
+    results comes from analyze_pokemon; defenders is a list of type lists.
+    Returns one (move, multiplier, expected damage) per defender, or None
+    when the Pokémon has no damaging moves. Works without NumPy (--exact).
+    """
+    if not results:
+        return [None] * len(defenders)
+    move_types = [get_move_mechanics(r["move"]).move_type for r in results]
+    if np is None:
+        chart = type_chart()
+        best = []
+        for types in defenders:
+            profile = chart.profile(types).multipliers
+            scored = [(multiplier, multiplier * r["mean"]) for r, multiplier in zip(
+                results, (profile[chart.codes[t]] if t in chart.codes else 1.0
+                          for t in move_types))]
+            m = max(range(len(results)), key=lambda i: scored[i][1])
+            best.append((results[m]["move"], float(scored[m][0]), float(scored[m][1])))
+        return best
+    means = np.array([r["mean"] for r in results])
+    multipliers = type_chart().matchups(move_types, defenders)
+    expected = multipliers * means[:, None]
+    best = expected.argmax(axis=0)
+    return [(results[m]["move"], float(multipliers[m, d]), float(expected[m, d]))
+            for d, m in enumerate(best)]
+
+
+def format_results_text(pokemon, results, target_hp=None):
+    lines = [f"{pokemon['name']} (Lv {pokemon['level']})"]
+    if not results:
+        lines.append("  No damaging moves.")
+    for r in results:
+        pct = r["percentiles"]
+        line = (f"  {r['move']:<20} {r['kind']:<6} {r['dice']:>5}{r['flat_bonus']:+d}  "
+                f"hit {r['success_rate']:6.1%}  mean {r['mean']:6.2f}  sd {r['std']:5.2f}  "
+                f"p5/p50/p95 {pct[5]:.0f}/{pct[50]:.0f}/{pct[95]:.0f}  "
+                f"crit {r['crit_share']:5.1%}")
+        if target_hp is not None:
+            line += f"  kill@{target_hp} {r['kill_probability']:6.1%}"
+        lines.append(line)
+    return "\n".join(lines)
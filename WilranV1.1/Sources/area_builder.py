@@ -1,7 +1,13 @@
-import json
+import copy
 import os
 import sys
 
+from area_store import AreaStore
+from data_bundle import load_game_data
+from pokemon_index import PokemonIndex
+from sampling import RARITY_WEIGHTS
+from species_search import filter_species, is_filter_query
+
 # Fix for PyInstaller - get the directory where the executable is located
 if getattr(sys, 'frozen', False):
     # Running as PyInstaller executable
@@ -11,48 +17,14 @@ else:
     SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 POKEMON_FILE = os.path.join(SCRIPT_DIR, "pokemon.json")
-AREA_FILE = os.path.join(SCRIPT_DIR, "areas.json")
-
-
-def load_pokemon():
-    """Load all Pokémon from pokemon.json"""
-    if not os.path.exists(POKEMON_FILE):
-        print(f"❌ {POKEMON_FILE} not found!")
-        return []
 
-    with open(POKEMON_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get("items", [])
+# Optional per-entry encounter fields, written after the levels when present
+WEIGHT_FIELDS = ("weight", "rarity", "modifiers")
 
 
-def load_areas():
-    """Load areas from areas.json"""
-    if not os.path.exists(AREA_FILE):
-        return {}
-    with open(AREA_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def save_areas(areas):
-    """Save areas to areas.json with each Pokémon on one line"""
-    with open(AREA_FILE, "w", encoding="utf-8") as f:
-        f.write("{\n")
-        area_count = len(areas)
-        for i, (area_name, data) in enumerate(areas.items()):
-            f.write(f'    "{area_name}": {{\n')
-            f.write(f'        "name": "{data["name"]}",\n')
-            f.write(f'        "pokemon": [\n')
-
-            for j, p in enumerate(data["pokemon"]):
-                # Single line per Pokémon
-                comma = "," if j < len(data["pokemon"]) - 1 else ""
-                f.write(
-                    f'            {{"name": "{p["name"]}", "min_level": {p["min_level"]}, "max_level": {p["max_level"]}}}{comma}\n')
-
-            f.write("        ]\n")
-            comma = "," if i < area_count - 1 else ""
-            f.write(f'    }}{comma}\n')
-        f.write("}\n")
+def load_pokemon():
+    """Load all Pokémon from pokemon.json into a PokemonIndex"""
+    return PokemonIndex(load_game_data(SCRIPT_DIR)["pokemon"])
 
 
 def get_level(prompt):
@@ -68,42 +40,161 @@ def get_level(prompt):
             print("❌ Invalid input. Please enter a number.")
 
 
-def select_pokemon(pokemon_list):
+def get_level_range():
+    """Prompt for a minimum and maximum level until min <= max"""
+    while True:
+        min_level = get_level("Minimum level (1-20): ")
+        max_level = get_level("Maximum level (1-20): ")
+        if min_level <= max_level:
+            return min_level, max_level
+        print("❌ Minimum level cannot be higher than maximum level. Try again.")
+
+
+def get_weight():
+    """Prompt for an encounter weight or rarity tier; {} keeps the default weight of 1"""
+    tiers = "/".join(RARITY_WEIGHTS)
+    while True:
+        answer = input(
+            f"Encounter weight (a number or {tiers}, Enter for normal): ").strip().lower()
+        if not answer:
+            return {}
+        if answer in RARITY_WEIGHTS:
+            return {"rarity": answer}
+        try:
+            weight = float(answer)
+        except ValueError:
+            weight = -1
+        if weight >= 0:
+            return {"weight": int(weight) if weight.is_integer() else weight}
+        print(f"❌ Enter a number of 0 or more, or one of {tiers}.")
+
+
+def get_modifiers():
+    """Prompt for condition multipliers like "night=2, rain=0.5"; {} for none"""
+    while True:
+        answer = input(
+            "Condition modifiers, e.g. night=2, rain=0.5 (Enter for none): ").strip().lower()
+        if not answer:
+            return {}
+        modifiers = {}
+        try:
+            for part in answer.split(","):
+                condition, value = part.split("=")
+                value = float(value)
+                if not condition.strip() or value < 0:
+                    raise ValueError
+                modifiers[condition.strip()] = int(value) if value.is_integer() else value
+            return {"modifiers": modifiers}
+        except ValueError:
+            print("❌ Use condition=multiplier pairs separated by commas.")
+
+
+def format_weight(p):
+    """Listing suffix like " - weight 3, night x2", empty for a normal entry"""
+    parts = []
+    if "weight" in p:
+        parts.append(f"weight {p['weight']}")
+    elif "rarity" in p:
+        parts.append(p["rarity"])
+    parts.extend(f"{c} x{m}" for c, m in p.get("modifiers", {}).items())
+    return f" - {', '.join(parts)}" if parts else ""
+
+
+def print_level_preview(species, min_level, max_level):
+    """What the species gets at both ends of its level range, before any rolls"""
+    for level in dict.fromkeys((min_level, max_level)):
+        stats = species.at_level(level)
+        print(f"   Lv {level}: proficiency +{stats.proficiency_bonus}, "
+              f"{stats.asi_points} ASI points, {len(stats.move_pool)} moves to pick from, "
+              f"HP {stats.hp(0)} (+{stats.hp_levels} per CON modifier)")
+
+
+def choose_suggestion(suggestions):
+    """Offer numbered close matches for a misspelt name; the chosen species or None"""
+    print("❌ Pokémon not found in pokemon.json. Did you mean:")
+    for number, species in enumerate(suggestions, start=1):
+        print(f"  {number}. {species.name}")
+    answer = input("Number to pick, or Enter to type again: ").strip()
+    if answer.isdigit() and 1 <= int(answer) <= len(suggestions):
+        return suggestions[int(answer) - 1]
+    return None
+
+
+def bulk_select(pokemon_index, query):
+    """Entries for every species matching filters, sharing one level range and weight"""
+    try:
+        matches = filter_species(pokemon_index, query)
+    except ValueError as e:
+        print(f"❌ {e}. Filters look like type:grass, sr<=2 or line:bulbasaur.")
+        return []
+    if not matches:
+        print("❌ No Pokémon match those filters.")
+        return []
+
+    names = ", ".join(species.name for species in matches[:20])
+    more = f" and {len(matches) - 20} more" if len(matches) > 20 else ""
+    print(f"Found {len(matches)} Pokémon: {names}{more}")
+    if input("Add them all? (yes/no): ").strip().lower() != "yes":
+        print("Bulk add cancelled.")
+        return []
+
+    min_level, max_level = get_level_range()
+    extra = get_weight()
+    extra.update(get_modifiers())
+    entries = []
+    for species in matches:
+        entry = {"name": species.name, "min_level": min_level, "max_level": max_level}
+        entry.update(copy.deepcopy(extra))
+        entries.append(entry)
+    print(f"✅ Added {len(entries)} Pokémon (Lv {min_level}-{max_level}){format_weight(entries[0])}")
+    return entries
+
+
+def select_pokemon(pokemon_index):
     """Prompt user to select Pokémon and levels"""
     selected = []
 
     while True:
-        print("\nType the name of the Pokémon you want to add, or 'done' to finish.")
+        print("\nType the name of the Pokémon you want to add, filters to add many at once")
+        print("(e.g. type:grass sr<=2, line:bulbasaur), or 'done' to finish.")
         name_input = input("Pokémon name: ").strip()
         if name_input.lower() == "done":
             break
 
-        # Find Pokémon in the list
-        match = next(
-            (p for p in pokemon_list if p["name"].lower() == name_input.lower()), None)
-        if not match:
-            print("❌ Pokémon not found in pokemon.json. Try again.")
+        if is_filter_query(name_input):
+            selected.extend(bulk_select(pokemon_index, name_input))
             continue
 
-        min_level = get_level("Minimum level (1-20): ")
-        max_level = get_level("Maximum level (1-20): ")
-
-        if min_level > max_level:
-            print("❌ Minimum level cannot be higher than maximum level. Try again.")
-            continue
-
-        selected.append({
-            "name": match["name"],
+        # Find Pokémon by name, id or number, then by prefix or a close spelling
+        match = pokemon_index.find(name_input)
+        if not match:
+            suggestions = pokemon_index.search.suggest(name_input)
+            if not suggestions:
+                print("❌ Pokémon not found in pokemon.json. Try again.")
+                continue
+            match = choose_suggestion(suggestions)
+            if not match:
+                continue
+
+        min_level, max_level = get_level_range()
+        print_level_preview(match, min_level, max_level)
+
+        entry = {
+            "name": match.name,
             "min_level": min_level,
             "max_level": max_level
-        })
-        print(f"✅ Added {match['name']} (Lv {min_level}-{max_level})")
+        }
+        entry.update(get_weight())
+        entry.update(get_modifiers())
+        selected.append(entry)
+        print(f"✅ Added {match.name} (Lv {min_level}-{max_level}){format_weight(entry)}")
 
     return selected
 
 
-def create_area(areas, pokemon_list):
+def create_area(store, pokemon_index):
     """Create a new area"""
+    areas = store.areas
     while True:
         area_name = input("Enter the name of the new area: ").strip()
         if not area_name:
@@ -115,13 +206,12 @@ def create_area(areas, pokemon_list):
             continue
         break
 
-    area_pokemon = select_pokemon(pokemon_list)
+    area_pokemon = select_pokemon(pokemon_index)
     if not area_pokemon:
         print("No Pokémon added. Exiting.")
         return
 
-    areas[area_name] = {"name": area_name, "pokemon": area_pokemon}
-    save_areas(areas)
+    store.put(area_name, {"name": area_name, "pokemon": area_pokemon})
     print(f"💾 Area '{area_name}' saved successfully!")
 
 
@@ -135,18 +225,18 @@ def list_areas(areas):
         if not data["pokemon"]:
             print("  No Pokémon in this area.")
         for p in data["pokemon"]:
-            print(f"  - {p['name']} (Lv {p['min_level']}-{p['max_level']})")
+            print(
+                f"  - {p['name']} (Lv {p['min_level']}-{p['max_level']}){format_weight(p)}")
 
 
-def delete_area(areas):
+def delete_area(store):
     """Delete an existing area"""
     area_name = input("Enter the name of the area to delete: ").strip()
-    if area_name in areas:
+    if area_name in store.areas:
         confirm = input(
             f"Are you sure you want to delete '{area_name}'? (yes/no): ").strip().lower()
         if confirm == "yes":
-            del areas[area_name]
-            save_areas(areas)
+            store.delete(area_name)
             print(f"❌ Area '{area_name}' deleted.")
         else:
             print("Deletion cancelled.")
@@ -154,18 +244,19 @@ def delete_area(areas):
         print("❌ Area not found.")
 
 
-def edit_area(areas, pokemon_list):
+def edit_area(store, pokemon_index):
     """Edit an existing area"""
     area_name = input("Enter the name of the area to edit: ").strip()
-    if area_name not in areas:
+    if area_name not in store.areas:
         print("❌ Area not found.")
         return
 
-    area = areas[area_name]
+    area = store.areas[area_name]
     print(f"\nEditing Area: {area_name}")
     print("Current Pokémon in area:")
     for p in area["pokemon"]:
-        print(f"  - {p['name']} (Lv {p['min_level']}-{p['max_level']})")
+        print(
+            f"  - {p['name']} (Lv {p['min_level']}-{p['max_level']}){format_weight(p)}")
 
     while True:
         action = input(
@@ -173,16 +264,19 @@ def edit_area(areas, pokemon_list):
         if action == "done":
             break
         elif action == "add":
-            new_pokemon = select_pokemon(pokemon_list)
+            new_pokemon = select_pokemon(pokemon_index)
             area["pokemon"].extend(new_pokemon)
         elif action == "edit":
             p_name = input("Enter the name of the Pokémon to edit: ").strip()
             match = next(
                 (p for p in area["pokemon"] if p["name"].lower() == p_name.lower()), None)
             if match:
-                match["min_level"] = get_level("New minimum level (1-20): ")
-                match["max_level"] = get_level("New maximum level (1-20): ")
-                print(f"✅ Updated {match['name']} levels.")
+                match["min_level"], match["max_level"] = get_level_range()
+                for key in WEIGHT_FIELDS:
+                    match.pop(key, None)
+                match.update(get_weight())
+                match.update(get_modifiers())
+                print(f"✅ Updated {match['name']} levels and weight.")
             else:
                 print("❌ Pokémon not found in this area.")
         elif action == "remove":
@@ -193,20 +287,29 @@ def edit_area(areas, pokemon_list):
         else:
             print("❌ Invalid action. Type add, edit, remove, or done.")
 
-    areas[area_name] = area
-    save_areas(areas)
+    store.put(area_name, area)
     print(f"💾 Area '{area_name}' updated successfully!")
 
 
 def main_menu():
     """Main menu for area manager"""
-    pokemon_list = load_pokemon()
-    if not pokemon_list:
+    pokemon_index = load_pokemon()
+    if not pokemon_index:
         return
 
-    areas = load_areas()
+    store = AreaStore()
+    try:
+        area_menu(store, pokemon_index)
+    finally:
+        # Leave a single compact areas.json for editors and version control
+        store.compact()
+
 
+def area_menu(store, pokemon_index):
+    """Menu loop; every change is logged to the store as soon as it is made"""
     while True:
+        # Pick up edits from other area managers before showing anything
+        store.refresh()
         print("\n--- Area Manager ---")
         print("1. Create a new area")
         print("2. List existing areas")
@@ -216,13 +319,13 @@ def main_menu():
         choice = input("Choose an option (1-5): ").strip()
 
         if choice == "1":
-            create_area(areas, pokemon_list)
+            create_area(store, pokemon_index)
         elif choice == "2":
-            list_areas(areas)
+            list_areas(store.areas)
         elif choice == "3":
-            edit_area(areas, pokemon_list)
+            edit_area(store, pokemon_index)
         elif choice == "4":
-            delete_area(areas)
+            delete_area(store)
         elif choice == "5":
             print("Exiting Area Manager. Goodbye!")
             break
@@ -0,0 +1,233 @@
+import contextlib
+import json
+import os
+import sys
+
+from perf import timed
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# Fix for PyInstaller - get the directory where the executable is located
+if getattr(sys, 'frozen', False):
+    # Running as PyInstaller executable
+    SCRIPT_DIR = os.path.dirname(sys.executable)
+else:
+    # Running as Python script
+    SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+AREA_FILE = os.path.join(SCRIPT_DIR, "areas.json")
+# Folded back into areas.json after this many logged changes
+COMPACT_EVERY = 200
+
+# Entry fields in the order they are written; anything else follows them
+ENTRY_FIELDS = ("name", "min_level", "max_level", "weight", "rarity", "modifiers")
+
+
+def change_log_path(path):
+    return os.path.splitext(path)[0] + ".changes.jsonl"
+
+
+def lock_path(path):
+    return os.path.splitext(path)[0] + ".lock"
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """Exclusive lock on path (created if missing) for the with block, across processes"""
+    with open(path, "a+b") as f:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def format_entry(entry):
+    ordered = {key: entry[key] for key in ENTRY_FIELDS if key in entry}
+    ordered.update(entry)
+    return json.dumps(ordered, ensure_ascii=False)
+
+
+def format_areas(areas):
+    """areas.json text with each Pokémon on one line, every string JSON-escaped"""
+    lines = ["{"]
+    for i, (area_name, data) in enumerate(areas.items()):
+        lines.append(f"    {json.dumps(area_name, ensure_ascii=False)}: {{")
+        fields = [(key, value) for key, value in data.items() if key != "pokemon"]
+        fields.append(("pokemon", data.get("pokemon", [])))
+        for j, (key, value) in enumerate(fields):
+            comma = "," if j < len(fields) - 1 else ""
+            if key != "pokemon":
+                lines.append(f"        {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}{comma}")
+                continue
+            lines.append('        "pokemon": [')
+            lines.extend(f"            {format_entry(p)}{',' if k < len(value) - 1 else ''}"
+                         for k, p in enumerate(value))
+            lines.append(f"        ]{comma}")
+        lines.append("    }," if i < len(areas) - 1 else "    }")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def write_atomic(path, text):
+    """Replace path with text so readers see either the old or the new file"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class AreaStore:
+    """areas.json plus an append-only change log
+
+    Each edit appends one {"op": "put"|"delete", "area": ...} line to the
+    change log, so saving costs the size of the changed area rather than
+    the whole file. The log is folded into areas.json (temp file +
+    os.replace) every COMPACT_EVERY changes and by compact(). Readers call
+    refresh() to pick up edits made by another process; it only reads the
+    bytes appended to the log since the last call. Writers (appends and
+    compaction) hold a lock file, so two managers never lose each other's edits.
+    """
+
+    def __init__(self, path=AREA_FILE):
+        self.path = path
+        self.log_path = change_log_path(path)
+        self.lock_path = lock_path(path)
+        self.areas = {}
+        self.pending = 0  # changes in the log not yet folded into areas.json
+        self._snapshot_stat = None
+        self._log_offset = 0
+        self.reload()
+
+    def exists(self):
+        return os.path.exists(self.path) or os.path.exists(self.log_path)
+
+    @timed("load.areas")
+    def reload(self):
+        """Read areas.json and replay the whole change log"""
+        snapshot_stat = _stat(self.path)
+        areas = {}
+        if snapshot_stat:
+            with open(self.path, "r", encoding="utf-8") as f:
+                areas = json.load(f)
+        # Only now, so a file that failed to parse is tried again by refresh()
+        self._snapshot_stat = snapshot_stat
+        self.areas = areas
+        self._log_offset = 0
+        self.pending = 0
+        self._read_log()
+
+    def refresh(self):
+        """Pick up changes written since the last read; True if anything changed"""
+        if _stat(self.path) != self._snapshot_stat:
+            self.reload()
+            return True
+        log_stat = _stat(self.log_path)
+        log_size = log_stat[1] if log_stat else 0
+        if log_size < self._log_offset:
+            # Compacted by another process between our two stat calls
+            self.reload()
+            return True
+        return self._read_log() > 0
+
+    def _read_log(self):
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(self._log_offset)
+                data = f.read()
+        except OSError:
+            return 0
+        # A writer may be mid-line; leave the partial line for the next call
+        end = data.rfind(b"\n") + 1
+        applied = 0
+        for line in data[:end].splitlines():
+            try:
+                change = json.loads(line)
+            except ValueError:
+                continue
+            self._apply(change)
+            applied += 1
+        self._log_offset += end
+        self.pending += applied
+        return applied
+
+    def _apply(self, change):
+        if change.get("op") == "put":
+            self.areas[change["area"]] = change["data"]
+        elif change.get("op") == "delete":
+            self.areas.pop(change["area"], None)
+
+    def _log(self, change):
+        with file_lock(self.lock_path):
+            # Catch up first; with the lock held nobody else can append before
+            # our line, so the offset below skips only our own line
+            self.refresh()
+            self._apply(change)
+            with open(self.log_path, "ab") as f:
+                f.write((json.dumps(change, ensure_ascii=False) + "\n").encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+                self._log_offset = f.tell()
+            self.pending += 1
+            if self.pending >= COMPACT_EVERY:
+                self._compact()
+
+    def put(self, area_name, data):
+        """Create or replace one area"""
+        self._log({"op": "put", "area": area_name, "data": data})
+
+    def delete(self, area_name):
+        self._log({"op": "delete", "area": area_name})
+
+    def compact(self):
+        """Fold the change log into areas.json"""
+        with file_lock(self.lock_path):
+            # Include changes other managers logged since our last read
+            self.refresh()
+            self._compact()
+
+    def _compact(self):
+        # Callers hold the lock, so nothing is appended to the log we remove
+        if not self.pending and os.path.exists(self.path):
+            return
+        write_atomic(self.path, format_areas(self.areas))
+        # areas.json already holds every logged change, so replaying a log
+        # left behind by a crash right here is harmless
+        try:
+            os.remove(self.log_path)
+        except OSError:
+            pass
+        self._snapshot_stat = _stat(self.path)
+        self._log_offset = 0
+        self.pending = 0
+
+
+def load_areas(path=AREA_FILE):
+    """Current areas, including changes still in the change log"""
+    store = AreaStore(path)
+    if not store.exists():
+        print(f"❌ {path} not found!", file=sys.stderr)
+    return store.areas
@@ -0,0 +1,174 @@
+import contextlib
+import hashlib
+import io
+import json
+import os
+import re
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+
+from area_store import load_areas
+from rng import RandomStreams, derive_seed
+
+try:
+    import numpy as np
+except ImportError:  # optional - only --fast-asi needs it
+    np = None
+
+# Encounters per output file
+DEFAULT_SHARD_SIZE = 10_000
+MANIFEST_NAME = "manifest.json"
+
+# Per-worker state, filled once by init_worker - never pickled per task
+_areas = None
+_pokemon_index = None
+
+
+def init_worker():
+    """Load areas and the species index once in each worker process"""
+    global _areas, _pokemon_index
+    from engine import load_pokemon_index
+
+    _areas = load_areas()
+    _pokemon_index = load_pokemon_index()
+
+
+def area_slug(area_name):
+    return re.sub(r"[^a-z0-9]+", "_", area_name.lower()).strip("_")
+
+
+def area_prefixes(area_names):
+    """{area name: shard file prefix}; areas sharing a slug ("Route 1", "Route-1") get a name hash"""
+    slugs = {}
+    for area_name in area_names:
+        slugs.setdefault(area_slug(area_name), []).append(area_name)
+    prefixes = {}
+    for slug, names in slugs.items():
+        for area_name in names:
+            if len(names) > 1:
+                digest = hashlib.sha1(area_name.encode("utf-8")).hexdigest()[:8]
+                prefixes[area_name] = f"{slug}_{digest}"
+            else:
+                prefixes[area_name] = slug
+    return prefixes
+
+
+def shard_path(out_dir, prefix, shard):
+    return os.path.join(out_dir, f"{prefix}-{shard:05d}.jsonl")
+
+
+def plan_shards(area_names, count, shard_size=DEFAULT_SHARD_SIZE):
+    """[(area name, shard number, encounters in the shard), ...] covering count per area"""
+    tasks = []
+    for area_name in area_names:
+        for shard, start in enumerate(range(0, count, shard_size)):
+            tasks.append((area_name, shard, min(shard_size, count - start)))
+    return tasks
+
+
+def distribute_asi_batch(np_rng, scores, points):
+    """engine.distribute_asi for many Pokémon at once
+
+    scores is an (N, 6) array of ability scores and points the N ASI budgets.
+    Each round is one multinomial draw per row over its stats below the cap;
+    points pushed past the cap are drawn again in the next round.
+    """
+    from engine import ASI_CAP
+
+    scores = np.array(scores, dtype=np.int64)
+    points = np.array(points, dtype=np.int64)
+    while True:
+        uncapped = scores < ASI_CAP
+        rows = np.flatnonzero((points > 0) & uncapped.any(axis=1))
+        if not len(rows):
+            return scores
+        open_stats = uncapped[rows]
+        drawn = scores[rows] + np_rng.multinomial(
+            points[rows], open_stats / open_stats.sum(axis=1, keepdims=True))
+        overflow = np.maximum(drawn - ASI_CAP, 0) * open_stats
+        scores[rows] = drawn - overflow
+        points[:] = 0
+        points[rows] = overflow.sum(axis=1)
+
+
+def apply_asi_batch(np_rng, encounters):
+    """Draw the ASIs of encounters rolled with asi=False, in one batch"""
+    from engine import ABILITY_NAMES
+
+    if not encounters:
+        return
+    scores = distribute_asi_batch(
+        np_rng,
+        [[e.attributes[ability] for ability in ABILITY_NAMES] for e in encounters],
+        [e.level_stats.asi_points for e in encounters])
+    for encounter, row in zip(encounters, scores.tolist()):
+        encounter.attributes = dict(encounter.attributes, **dict(zip(ABILITY_NAMES, row)))
+
+
+def generate_shard(task):
+    """Write one shard of encounters and return (path, written, skipped)
+
+    Every shard has its own RNG streams derived from (seed, area, shard), so
+    the output does not depend on the number of workers or task order. With
+    fast_asi the ASIs of the whole shard come from one NumPy batch on a
+    stream of their own: equally distributed, but different scores for the
+    same seed than without it.
+    """
+    from engine import roll_encounter
+
+    area_name, prefix, shard, count, seed, out_dir, conditions, fast_asi = task
+    rng = RandomStreams(derive_seed(seed, "bulk", area_name, shard)).encounter
+    area = _areas[area_name]
+    path = shard_path(out_dir, prefix, shard)
+    tmp_path = path + ".tmp"
+    # Missing species are reported once in the summary, not once per roll
+    with contextlib.redirect_stderr(io.StringIO()):
+        encounters = [roll_encounter(area, _pokemon_index, rng, conditions, asi=not fast_asi)
+                      for _ in range(count)]
+    rolled = [e for e in encounters if e]
+    if fast_asi:
+        apply_asi_batch(np.random.default_rng(derive_seed(seed, "bulk-asi", area_name, shard)),
+                        rolled)
+    with open(tmp_path, "w", encoding="utf-8") as out:
+        for encounter in rolled:
+            out.write(json.dumps(encounter.build().to_dict(), ensure_ascii=False) + "\n")
+    os.replace(tmp_path, path)
+    return path, len(rolled), count - len(rolled)
+
+
+def generate_all(out_dir, count, area_names=None, seed=None, workers=None,
+                 shard_size=DEFAULT_SHARD_SIZE, conditions=frozenset(), fast_asi=False):
+    """Generate count encounters per area into sharded JSONL files plus a manifest
+
+    Returns the manifest dict. area_names defaults to every area in areas.json.
+    fast_asi draws the ASIs in NumPy batches (see generate_shard).
+    """
+    if fast_asi and np is None:
+        raise RuntimeError("--fast-asi needs NumPy (pip install numpy)")
+    if count < 1 or shard_size < 1:
+        raise ValueError(f"count and shard_size must be at least 1, got {count} and {shard_size}")
+    areas = load_areas()
+    area_names = list(area_names or areas)
+    seed = secrets.randbits(64) if seed is None else seed
+    os.makedirs(out_dir, exist_ok=True)
+
+    # Prefixes come from every area, so a name keeps its files whatever --area picks
+    prefixes = area_prefixes(dict.fromkeys(list(areas) + area_names))
+    tasks = [(area_name, prefixes[area_name], shard, shard_count, seed, out_dir, conditions,
+              fast_asi)
+             for area_name, shard, shard_count in plan_shards(area_names, count, shard_size)]
+    manifest = {"seed": seed, "count": count, "shard_size": shard_size,
+                "conditions": sorted(conditions),
+                "fast_asi": fast_asi,
+                "areas": {area_name: {"written": 0, "skipped": 0, "shards": []}
+                          for area_name in area_names}}
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        for task, (path, written, skipped) in zip(tasks, executor.map(generate_shard, tasks)):
+            entry = manifest["areas"][task[0]]
+            entry["written"] += written
+            entry["skipped"] += skipped
+            entry["shards"].append(os.path.basename(path))
+
+    with open(os.path.join(out_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
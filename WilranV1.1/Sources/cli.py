@@ -0,0 +1,263 @@
+import argparse
+import cProfile
+import json
+import pstats
+import sys
+
+import perf
+from area_store import load_areas
+from engine import load_pokemon_index, pick_random_pokemon
+from rng import RandomStreams
+
+
+def find_area(areas, name):
+    """Case-insensitive area lookup, or None"""
+    area_key = next(
+        (area_name for area_name in areas if area_name.lower() == name.lower()), None)
+    return areas[area_key] if area_key else None
+
+
+def parse_conditions(text):
+    """Condition names from text like "night,rain" """
+    return frozenset(c.strip().lower() for c in (text or "").split(",") if c.strip())
+
+
+def positive_int(text):
+    """argparse type for counts and sizes that must be at least 1"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{text}'")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def format_pokemon_text(pokemon):
+    """Plain-text stat block for one generated Pokémon"""
+    shiny_text = " 🌟 Shiny! 🌟" if pokemon.get("shiny") else ""
+    lines = [
+        f"{pokemon['name']} (Lv {pokemon['level']}) - {pokemon['gender']}{shiny_text}",
+        f"Type: {pokemon['types']} | Size: {pokemon['size']} | Nature: {pokemon['nature']}",
+        f"AC: {pokemon['ac']} | HP: {pokemon['hp']} | Speed: {pokemon['speed']}",
+        pokemon["ability_scores"].replace("\n", " | "),
+        f"Skills: {pokemon['skills']} | Saving Throws: {pokemon['saving_throws']}",
+        f"Moves: {', '.join(pokemon['moves'])}",
+        f"Held Item: {pokemon['held_item']}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def generate(args):
+    areas = load_areas()
+    area = find_area(areas, args.area)
+    if not area:
+        print(f"❌ Area '{args.area}' not found.", file=sys.stderr)
+        return 1
+    pokemon_index = load_pokemon_index()
+    rng = RandomStreams(args.seed).encounter
+    conditions = parse_conditions(args.when)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for _ in range(args.count):
+            pokemon = pick_random_pokemon(area, pokemon_index, rng, conditions)
+            if not pokemon:
+                continue
+            if args.format == "jsonl":
+                out.write(json.dumps(pokemon.to_dict(), ensure_ascii=False) + "\n")
+            else:
+                out.write(format_pokemon_text(pokemon) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def bulk(args):
+    from bulk import generate_all
+
+    areas = load_areas()
+    area_names = []
+    for name in args.area or []:
+        area_key = next((a for a in areas if a.lower() == name.lower()), None)
+        if not area_key:
+            print(f"❌ Area '{name}' not found.", file=sys.stderr)
+            return 1
+        area_names.append(area_key)
+
+    try:
+        manifest = generate_all(args.output, args.count, area_names, args.seed, args.workers,
+                                args.shard_size, parse_conditions(args.when), args.fast_asi)
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    written = sum(a["written"] for a in manifest["areas"].values())
+    shards = sum(len(a["shards"]) for a in manifest["areas"].values())
+    print(f"💾 {written} encounters in {shards} files in {args.output} "
+          f"(seed {manifest['seed']})")
+    for area_name, entry in manifest["areas"].items():
+        if entry["skipped"]:
+            print(f"❌ {area_name}: {entry['skipped']} rolls skipped "
+                  f"(species missing from pokemon.json)", file=sys.stderr)
+    return 0
+
+
+def gui(args):
+    from wilran import main_gui
+
+    main_gui(seed=args.seed, fresh=args.fresh)
+    return 0
+
+
+def analyze(args):
+    from analysis import analyze_pokemon, best_moves, format_results_text, pokemon_at_level
+
+    defenders = []
+    for name in args.vs or []:
+        species = load_pokemon_index().find(name)
+        if not species:
+            print(f"❌ {name} not found in pokemon.json!", file=sys.stderr)
+            return 1
+        defenders.append(species)
+
+    if args.input:
+        with open(args.input, "r", encoding="utf-8") as f:
+            pokemon_list = [json.loads(line) for line in f if line.strip()]
+    else:
+        species = load_pokemon_index().find(args.pokemon)
+        if not species:
+            print(f"❌ {args.pokemon} not found in pokemon.json!", file=sys.stderr)
+            return 1
+        pokemon_list = [pokemon_at_level(species, args.level)]
+
+    for pokemon in pokemon_list:
+        try:
+            results = analyze_pokemon(pokemon, args.samples, args.ac, args.save_bonus,
+                                      args.hp, args.seed, args.exact)
+            matchups = best_moves(results, [s.types for s in defenders]) if defenders else []
+        except RuntimeError as e:
+            print(f"❌ {e} - or use --exact", file=sys.stderr)
+            return 1
+        if args.format == "json":
+            record = {"pokemon": pokemon["name"], "level": pokemon["level"],
+                      "moves": results}
+            if defenders:
+                record["best_moves"] = {
+                    s.name: dict(zip(("move", "multiplier", "expected"), best)) if best else None
+                    for s, best in zip(defenders, matchups)}
+            print(json.dumps(record, ensure_ascii=False))
+        else:
+            print(format_results_text(pokemon, results, args.hp))
+            for species, best in zip(defenders, matchups):
+                if best:
+                    move, multiplier, expected = best
+                    print(f"  Best vs {species.name}: {move} (x{multiplier:g}, {expected:.2f} expected)")
+    return 0
+
+
+def list_areas(args):
+    for area_name, data in load_areas().items():
+        print(f"{area_name} ({len(data.get('pokemon', []))} Pokémon)")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="wilran", description="Wilran wild Pokémon randomizer (headless)")
+    parser.add_argument(
+        "--profile", metavar="PATH",
+        help="Profile the command with cProfile, write the stats to PATH and "
+             "print the hottest functions and perf timers to stderr")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    gen = subparsers.add_parser(
+        "generate", help="Generate random Pokémon from an area")
+    gen.add_argument("--area", required=True, help="Area name from areas.json")
+    gen.add_argument("--count", type=int, default=1,
+                     help="How many Pokémon to generate (default 1)")
+    gen.add_argument("--format", choices=["jsonl", "text"], default="jsonl",
+                     help="One JSON object per line, or readable stat blocks")
+    gen.add_argument("--output", "-o",
+                     help="File to write to instead of stdout")
+    gen.add_argument("--seed", type=int,
+                     help="Seed for reproducible output (random if omitted)")
+    gen.add_argument("--when", metavar="CONDITIONS",
+                     help="Active conditions for weight modifiers, e.g. night,rain")
+    gen.set_defaults(func=generate)
+
+    blk = subparsers.add_parser(
+        "bulk", help="Pre-roll encounters for every area into sharded JSONL files")
+    blk.add_argument("--count", type=positive_int, required=True,
+                     help="Encounters per area")
+    blk.add_argument("--output", "-o", required=True,
+                     help="Directory for the shards and manifest.json")
+    blk.add_argument("--area", action="append",
+                     help="Only this area (repeatable, default all areas)")
+    blk.add_argument("--workers", type=positive_int,
+                     help="Worker processes (default: one per CPU)")
+    blk.add_argument("--shard-size", type=positive_int, default=10_000,
+                     help="Encounters per file (default 10,000)")
+    blk.add_argument("--seed", type=int,
+                     help="Seed for reproducible output (random if omitted)")
+    blk.add_argument("--when", metavar="CONDITIONS",
+                     help="Active conditions for weight modifiers, e.g. night,rain")
+    blk.add_argument("--fast-asi", action="store_true",
+                     help="Draw ASIs in NumPy batches (faster; the same seed gives "
+                          "different files than without this flag)")
+    blk.set_defaults(func=bulk)
+
+    ana = subparsers.add_parser(
+        "analyze", help="Monte Carlo damage statistics for a Pokémon's moves")
+    source = ana.add_mutually_exclusive_group(required=True)
+    source.add_argument("--pokemon", help="Species name, id or number")
+    source.add_argument("--input", help="JSONL file from 'generate'")
+    ana.add_argument("--level", type=int, default=1,
+                     help="Level for --pokemon (default 1)")
+    ana.add_argument("--ac", type=int, default=13, help="Target AC (default 13)")
+    ana.add_argument("--save-bonus", type=int, default=0,
+                     help="Target saving throw bonus (default 0)")
+    ana.add_argument("--hp", type=int, help="Target HP, for kill probability")
+    ana.add_argument("--samples", type=int, default=1_000_000,
+                     help="Uses simulated per move (default 1,000,000)")
+    ana.add_argument("--seed", type=int, help="Seed for reproducible numbers")
+    ana.add_argument("--vs", action="append", metavar="POKEMON",
+                     help="Also pick the best move against this species (repeatable)")
+    ana.add_argument("--exact", action="store_true",
+                     help="Compute exact probabilities instead of sampling")
+    ana.add_argument("--format", choices=["text", "json"], default="text")
+    ana.set_defaults(func=analyze)
+
+    gui_parser = subparsers.add_parser("gui", help="Launch the Tk app")
+    gui_parser.add_argument("--seed", type=int,
+                            help="Session seed, to replay a previous session")
+    gui_parser.add_argument("--fresh", action="store_true",
+                            help="Start with an empty tracker instead of the saved session")
+    gui_parser.set_defaults(func=gui)
+
+    areas = subparsers.add_parser("areas", help="List the areas in areas.json")
+    areas.set_defaults(func=list_areas)
+    return parser
+
+
+def run_profiled(args):
+    """Run the command under cProfile and print where the time went"""
+    perf.enable()
+    profiler = cProfile.Profile()
+    result = profiler.runcall(args.func, args)
+    profiler.dump_stats(args.profile)
+    print(f"💾 Profile written to {args.profile}", file=sys.stderr)
+    pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(15)
+    print(perf.format_table(perf.snapshot()), file=sys.stderr)
+    return result
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.profile:
+        return run_profiled(args)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import pickle
+import sys
+
+from perf import timed
+
+
+# Fix for PyInstaller - get the directory where the executable is located
+if getattr(sys, 'frozen', False):
+    # Running as PyInstaller executable
+    SCRIPT_DIR = os.path.dirname(sys.executable)
+else:
+    # Running as Python script
+    SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+BUNDLE_NAME = "wilran_data.bundle"
+# Bump whenever the bundle layout or the slimming below changes
+BUNDLE_FORMAT = 1
+
+# name -> (source file, top-level key holding the data or None for the whole file)
+SOURCES = {
+    "typechart": ("typechart.json", None),
+    "abilities": ("abilities.json", "items"),
+    "moves": ("moves.json", "moves"),
+    "pokemon": ("pokemon.json", "items"),
+}
+
+# Only the pokemon.json fields the randomizer, tracker and area builder read
+POKEMON_FIELDS = ("name", "id", "number", "type", "size", "ac", "hp", "hitDice",
+                  "minLevel", "sr", "speed", "senses", "attributes", "skills",
+                  "savingThrows", "abilities", "gender", "evolution", "description")
+POKEMON_MOVE_KEYS = ("start", "level2", "level6",
+                     "level10", "level14", "level18")
+POKEMON_MEDIA_KEYS = ("main", "mainShiny")
+
+# Strings longer than this are descriptions, not worth interning
+INTERN_MAX_LEN = 64
+
+
+def _intern(value):
+    """Recursively intern dict keys and short strings so repeats share one object"""
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) <= INTERN_MAX_LEN else value
+    if isinstance(value, dict):
+        return {sys.intern(k) if isinstance(k, str) else k: _intern(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_intern(v) for v in value]
+    return value
+
+
+def _slim_pokemon(pokemon):
+    slim = {k: pokemon[k] for k in POKEMON_FIELDS if k in pokemon}
+    moves = pokemon.get("moves", {})
+    slim["moves"] = {k: moves[k] for k in POKEMON_MOVE_KEYS if k in moves}
+    media = pokemon.get("media", {})
+    slim["media"] = {k: media[k] for k in POKEMON_MEDIA_KEYS if k in media}
+    return slim
+
+
+def source_checksums(data_dir=SCRIPT_DIR):
+    """SHA-1 of every source JSON file (None for missing files)"""
+    checksums = {}
+    for name, (file_name, _) in SOURCES.items():
+        path = os.path.join(data_dir, file_name)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                checksums[name] = hashlib.sha1(f.read()).hexdigest()
+        else:
+            checksums[name] = None
+    return checksums
+
+
+def _load_sources(data_dir):
+    data = {}
+    for name, (file_name, key) in SOURCES.items():
+        path = os.path.join(data_dir, file_name)
+        if not os.path.exists(path):
+            print(f"❌ {path} not found!", file=sys.stderr)
+            raw = {}
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        data[name] = raw.get(key, []) if key else raw
+
+    data["pokemon"] = [_slim_pokemon(p) for p in data["pokemon"]]
+    return _intern(data)
+
+
+def write_bundle(bundle_path, checksums, data):
+    """Write parsed data to the bundle, tagged with the checksums it was built from"""
+    header = {"format": BUNDLE_FORMAT, "sources": checksums}
+
+    # Write to a temp file first so a crash never leaves a half-written bundle
+    tmp_path = bundle_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, bundle_path)
+
+
+def build_bundle(data_dir=SCRIPT_DIR):
+    """Parse the source JSON files into the bundle, returning the data"""
+    data = _load_sources(data_dir)
+    write_bundle(os.path.join(data_dir, BUNDLE_NAME),
+                 source_checksums(data_dir), data)
+    return data
+
+
+def load_bundle(bundle_path, checksums):
+    """Load the bundle if it exists and matches the source checksums, else None"""
+    if not os.path.exists(bundle_path):
+        return None
+    try:
+        with open(bundle_path, "rb") as f:
+            header = pickle.load(f)
+            if header.get("format") != BUNDLE_FORMAT or header.get("sources") != checksums:
+                return None
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return None
+
+
+@timed("load.game_data")
+def load_game_data(data_dir=SCRIPT_DIR):
+    """Typechart, abilities, moves and pokemon, from the bundle when it is fresh
+
+    A missing or stale bundle is rebuilt from the JSON sources. If the bundle
+    can't be written (read-only install), the parsed JSON is used as-is.
+    """
+    bundle_path = os.path.join(data_dir, BUNDLE_NAME)
+    checksums = source_checksums(data_dir)
+    data = load_bundle(bundle_path, checksums)
+    if data is not None:
+        return data
+
+    data = _load_sources(data_dir)
+    if any(checksums.values()):
+        try:
+            write_bundle(bundle_path, checksums, data)
+        except OSError:
+            pass
+    return data
+
+
+if __name__ == "__main__":
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else SCRIPT_DIR
+    data = build_bundle(data_dir)
+    bundle_path = os.path.join(data_dir, BUNDLE_NAME)
+    print(f"💾 Wrote {bundle_path} ({os.path.getsize(bundle_path)} bytes, "
+          f"{len(data['pokemon'])} Pokémon, {len(data['moves'])} moves, "
+          f"{len(data['abilities'])} abilities)")
@@ -0,0 +1,102 @@
+import math
+from functools import lru_cache
+
+from engine import (as_instance, best_power_ability, damage_bonuses, get_move_mechanics,
+                    parse_dice)
+
+# Exact damage distributions by convolving dice faces - no sampling noise,
+# cheap enough for tooltips. A distribution is a tuple of (damage, probability).
+
+
+def convolve(a, b):
+    """Probabilities of the sum of two independent outcomes, each indexed from 0"""
+    out = [0.0] * (len(a) + len(b) - 1)
+    for i, pa in enumerate(a):
+        if pa:
+            for j, pb in enumerate(b):
+                out[i + j] += pa * pb
+    return out
+
+
+@lru_cache(maxsize=None)
+def dice_sum_probabilities(count, sides):
+    """Probabilities of totals count..count*sides when rolling count dice"""
+    die = [1.0 / sides] * sides
+    probs = [1.0]
+    for _ in range(count):
+        probs = convolve(probs, die)
+    return tuple(probs)
+
+
+@lru_cache(maxsize=None)
+def damage_distribution(dice_str, flat_bonus=0, crit=False):
+    """Distribution of dice_str + flat_bonus, with the dice rolled twice on a crit"""
+    parsed = parse_dice(dice_str)
+    if parsed is None:
+        return ((int(dice_str) + flat_bonus, 1.0),)
+    count, sides = parsed
+    if crit:
+        count *= 2
+    return tuple((count + i + flat_bonus, p)
+                 for i, p in enumerate(dice_sum_probabilities(count, sides)))
+
+
+def mix(weighted):
+    """Combine [(weight, distribution), ...] into one distribution"""
+    combined = {}
+    for weight, dist in weighted:
+        if weight:
+            for value, p in dist:
+                combined[value] = combined.get(value, 0.0) + weight * p
+    return tuple(sorted(combined.items()))
+
+
+def halve(dist):
+    """Half damage (rounded down), as on a successful save"""
+    return mix([(1.0, tuple((value // 2, p) for value, p in dist))])
+
+
+def mean_of(dist):
+    return sum(value * p for value, p in dist)
+
+
+def distribution_stats(dist, percentiles=(5, 25, 50, 75, 95), target_hp=None):
+    mean = mean_of(dist)
+    variance = sum((value - mean) ** 2 * p for value, p in dist)
+    stats = {
+        "mean": mean,
+        "variance": variance,
+        "std": math.sqrt(variance),
+        "percentiles": {},
+    }
+    # Lowest damage whose cumulative probability reaches each percentile
+    cumulative = 0.0
+    pending = list(percentiles)
+    for value, p in dist:
+        cumulative += p
+        while pending and cumulative >= pending[0] / 100 - 1e-12:
+            stats["percentiles"][pending.pop(0)] = float(value)
+    for pct in pending:
+        stats["percentiles"][pct] = float(dist[-1][0])
+    if target_hp is not None:
+        stats["kill_probability"] = sum(p for value, p in dist if value >= target_hp)
+    return stats
+
+
+def move_damage_summary(pokemon, move_id):
+    """Tooltip line with the average damage of a move for this Pokémon, or None"""
+    mechanics = get_move_mechanics(move_id)
+    if not mechanics:
+        return None
+    pokemon = as_instance(pokemon)
+    dice_str = mechanics.dice_for_level(pokemon.level)
+    if not dice_str:
+        return None
+
+    _, ability_mod = best_power_ability(mechanics.power_abilities, pokemon)
+    flat_bonus = sum(damage_bonuses(mechanics, pokemon, ability_mod))
+    summary = (f"Damage: {dice_str}{flat_bonus:+d} {mechanics.damage_type} "
+               f"(avg {mean_of(damage_distribution(dice_str, flat_bonus)):.1f}")
+    if mechanics.has_attack:
+        summary += f", crit avg {mean_of(damage_distribution(dice_str, flat_bonus, True)):.1f}"
+    return summary + ")"
@@ -0,0 +1,962 @@
+import json
+import os
+import random
+import re
+import sys
+import threading
+from functools import lru_cache
+
+from data_bundle import load_game_data
+from held_items import load_held_items
+from levels import asi_points
+from perf import timed
+from pokemon_index import PokemonIndex
+from sampling import AliasSampler, area_sampler
+from type_chart import TypeChart
+
+# GUI-free game logic shared by the Tk app (wilran.py) and the command line (cli.py)
+
+
+if getattr(sys, 'frozen', False):
+    # Running as PyInstaller executable
+    SCRIPT_DIR = os.path.dirname(sys.executable)
+else:
+    # Running as Python script
+    SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+AREA_FILE = os.path.join(SCRIPT_DIR, "areas.json")
+POKEMON_FILE = os.path.join(SCRIPT_DIR, "pokemon.json")
+TYPECHART_FILE = os.path.join(SCRIPT_DIR, "typechart.json")
+ABILITIES_FILE = os.path.join(SCRIPT_DIR, "abilities.json")
+MOVES_FILE = os.path.join(SCRIPT_DIR, "moves.json")
+HELDITEMS_FILE = os.path.join(SCRIPT_DIR, "helditems.json")
+
+
+# ---------------- NATURE TABLE ----------------
+natures_table = [
+    {"name": "Hardy", "increase": None,
+        "decrease": None, "range": range(1, 5)},
+    {"name": "Lonely", "increase": "str",
+        "decrease": "con", "range": range(5, 9)},
+    {"name": "Brave", "increase": "str",
+        "decrease": "dex", "range": range(9, 13)},
+    {"name": "Adamant", "increase": "str",
+        "decrease": "wis", "range": range(13, 17)},
+    {"name": "Naughty", "increase": "str",
+        "decrease": "cha", "range": range(17, 21)},
+    {"name": "Bold", "increase": "con",
+        "decrease": "str", "range": range(21, 25)},
+    {"name": "Docile", "increase": None,
+        "decrease": None, "range": range(25, 29)},
+    {"name": "Relaxed", "increase": "con",
+        "decrease": "dex", "range": range(29, 33)},
+    {"name": "Impish", "increase": "con",
+        "decrease": "wis", "range": range(33, 37)},
+    {"name": "Lax", "increase": "con",
+        "decrease": "cha", "range": range(37, 41)},
+    {"name": "Timid", "increase": "dex",
+        "decrease": "str", "range": range(41, 45)},
+    {"name": "Hasty", "increase": "dex",
+        "decrease": "con", "range": range(45, 49)},
+    {"name": "Serious", "increase": None,
+        "decrease": None, "range": range(49, 53)},
+    {"name": "Jolly", "increase": "dex",
+        "decrease": "wis", "range": range(53, 57)},
+    {"name": "Naive", "increase": "dex",
+        "decrease": "cha", "range": range(57, 61)},
+    {"name": "Modest", "increase": "wis",
+        "decrease": "str", "range": range(61, 65)},
+    {"name": "Mild", "increase": "wis",
+        "decrease": "con", "range": range(65, 69)},
+    {"name": "Quiet", "increase": "wis",
+        "decrease": "dex", "range": range(69, 73)},
+    {"name": "Bashful", "increase": None,
+        "decrease": None, "range": range(73, 77)},
+    {"name": "Rash", "increase": "wis",
+        "decrease": "cha", "range": range(77, 81)},
+    {"name": "Calm", "increase": "cha",
+        "decrease": "str", "range": range(81, 85)},
+    {"name": "Gentle", "increase": "cha",
+        "decrease": "con", "range": range(85, 89)},
+    {"name": "Sassy", "increase": "cha",
+        "decrease": "dex", "range": range(89, 93)},
+    {"name": "Careful", "increase": "cha",
+        "decrease": "wis", "range": range(93, 97)},
+    {"name": "Quirky", "increase": None,
+        "decrease": None, "range": range(97, 101)},
+]
+# One outcome per d100 face, so a nature costs one O(1) draw
+NATURE_SAMPLER = AliasSampler(
+    [1] * 100, [nature for nature in natures_table for _ in nature["range"]])
+
+# ---------------- JSON LOAD ----------------
+
+
+def load_json(file_path):
+    if not os.path.exists(file_path):
+        print(f"❌ {file_path} not found!", file=sys.stderr)
+        return {}
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ---------------- GAME DATA LOAD ----------------
+# typechart, abilities, moves and pokemon - from the prebuilt bundle when it is fresh.
+# Nothing is read at import: the first caller loads it (the GUI does so on a
+# background thread while its window is already up).
+_game_data = None
+_game_data_lock = threading.Lock()
+
+
+def game_data():
+    global _game_data
+    if _game_data is None:
+        with _game_data_lock:
+            if _game_data is None:
+                _game_data = load_game_data(SCRIPT_DIR)
+    return _game_data
+
+
+# ---------------- TYPE CLASS ----------------
+@lru_cache(maxsize=None)
+def type_chart():
+    return TypeChart(game_data()["typechart"])
+
+
+# ---------------- ABILITIES LOAD ----------------
+@lru_cache(maxsize=None)
+def ability_lookup():
+    return {a["id"]: a for a in game_data()["abilities"]}
+
+
+# ---------------- MOVES LOAD ----------------
+@lru_cache(maxsize=None)
+def move_lookup():
+    return {m["id"]: m for m in game_data()["moves"]}
+
+
+# The old module constants, built on first access: engine.MOVE_LOOKUP and
+# "from engine import MOVE_LOOKUP" keep working, they just load the data then
+_LAZY_CONSTANTS = {
+    "GAME_DATA": game_data,
+    "POKEMON_TYPE_CHART": lambda: game_data()["typechart"],
+    "POKEMON_TYPES": lambda: list(game_data()["typechart"]),
+    "TYPE_CHART": type_chart,
+    "ABILITIES_DATA": lambda: game_data()["abilities"],
+    "ABILITY_LOOKUP": ability_lookup,
+    "MOVES_DATA": lambda: game_data()["moves"],
+    "MOVE_LOOKUP": move_lookup,
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_CONSTANTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = _LAZY_CONSTANTS[name]()
+    return value
+
+
+def load_pokemon_index():
+    """PokemonIndex over the pokemon in the game data"""
+    return PokemonIndex(game_data()["pokemon"])
+
+
+@lru_cache(maxsize=None)
+def parse_dice(dice_str):
+    """Split an NdM dice string into (count, sides), or None for a flat number"""
+    match = re.match(r"(\d+)d(\d+)", dice_str)
+    if not match:
+        return None
+    return tuple(map(int, match.groups()))
+
+
+def roll_dice(dice_str, rng=random):
+    parsed = parse_dice(dice_str)
+    if parsed is None:
+        return int(dice_str)  # fallback if just a number
+    n, m = parsed
+    return sum(rng.randint(1, m) for _ in range(n))
+
+
+def parse_damage_from_description(description_text, move_data):
+    """Extract damage dice and type from move description"""
+    # Patterns for moves WITH ability modifier (+ MOVE)
+    move_modifier_patterns = [
+        r'(\d+d\d+(?:\s*\+\s*\d+)?)\s*\+?\s*MOVE\s+(\w+)\s+damage',
+        r'(\d+d\d+)\s*\+?\s*MOVE\s+(\w+)\s+damage',
+        r'takes\s+(\d+d\d+(?:\s*\+\s*\d+)?)\s*\+?\s*MOVE\s+(\w+)\s+damage',
+        r'deals?\s+(\d+d\d+(?:\s*\+\s*\d+)?)\s*\+?\s*MOVE\s+(\w+)\s+damage'
+    ]
+
+    # First, try to match patterns with MOVE modifier
+    for pattern in move_modifier_patterns:
+        match = re.search(pattern, description_text, re.IGNORECASE)
+        if match:
+            dice_str = match.group(1).strip()
+            damage_type = match.group(2).strip().lower()
+            return dice_str, damage_type  # Will include ability mod
+
+    # If no MOVE found, try patterns for flat damage (no ability modifier)
+    flat_damage_patterns = [
+        r'doing\s+(\d+d\d+)\s+(\w+)\s+damage',
+        r'takes\s+(\d+d\d+)\s+(\w+)\s+damage',
+        r'deals?\s+(\d+d\d+)\s+(\w+)\s+damage',
+        r'(\d+d\d+)\s+(\w+)\s+damage'
+    ]
+
+    for pattern in flat_damage_patterns:
+        match = re.search(pattern, description_text, re.IGNORECASE)
+        if match:
+            dice_str = match.group(1).strip()
+            damage_type = match.group(2).strip().lower()
+            return dice_str, damage_type  # Will NOT include ability mod
+
+    return None, None
+
+
+def parse_level_scalings(higher_levels):
+    """Return the (level, dice) pairs from a higherLevels text, highest level first"""
+    # Example: "The damage dice roll for this move changes to 2d4 at level 5, 1d12 at level 10, and 4d4 at level 17."
+    scalings = [(int(level), dice)
+                for dice, level in re.findall(r'(\d+d\d+) at level (\d+)', higher_levels or "")]
+    scalings.sort(reverse=True)  # Highest level first
+    return scalings
+
+
+# ---------------- MOVE MECHANICS ----------------
+MOVE_MODIFIER_PATTERN = re.compile(r'\+?\s*MOVE\s+\w+\s+damage', re.IGNORECASE)
+
+# Looked up in this order, the first match wins
+SAVE_PATTERNS = [
+    (re.compile(r'\b(str|strength)\s+save', re.IGNORECASE), 'STR'),
+    (re.compile(r'\b(dex|dexterity)\s+save', re.IGNORECASE), 'DEX'),
+    (re.compile(r'\b(con|constitution)\s+save', re.IGNORECASE), 'CON'),
+    (re.compile(r'\b(int|intelligence)\s+save', re.IGNORECASE), 'INT'),
+    (re.compile(r'\b(wis|wisdom)\s+save', re.IGNORECASE), 'WIS'),
+    (re.compile(r'\b(cha|charisma)\s+save', re.IGNORECASE), 'CHA'),
+]
+
+ATTACK_PHRASES = ("make a melee attack",
+                  "make a ranged attack", "make an attack")
+
+HALF_ON_SAVE_PATTERN = re.compile(
+    r'half (?:as much|damage|that damage|the damage|on (?:a )?success)')
+
+
+def move_description_text(move_data):
+    """Lowercase description text of a move, skipping tables"""
+    description_text = ""
+    for d in move_data.get("description", []):
+        if isinstance(d, str):
+            description_text += d.lower() + " "
+    return description_text
+
+
+class MoveMechanics:
+    """Everything needed to resolve a move, parsed once from its description"""
+    __slots__ = ("move_id", "move_type", "power_abilities", "has_attack", "has_save",
+                 "save_type", "half_on_save", "has_move_modifier", "base_dice", "damage_type",
+                 "scalings")
+
+    def __init__(self, move_data):
+        description_text = move_description_text(move_data)
+        power = move_data.get("power")
+
+        self.move_id = move_data.get("id")
+        self.move_type = move_data.get("type", "").lower()
+        # None for status moves ("none") and other non-list powers ("varies", "any")
+        self.power_abilities = tuple(
+            power) if isinstance(power, list) and power else None
+        self.has_move_modifier = bool(
+            MOVE_MODIFIER_PATTERN.search(description_text))
+
+        # Moves like Vice Grip have both an attack roll and a save
+        self.has_save = "save" in description_text
+        self.save_type = None
+        if self.has_save:
+            self.save_type = next(
+                (save for pattern, save in SAVE_PATTERNS if pattern.search(description_text)), None)
+        self.has_attack = self.power_abilities is not None and any(
+            phrase in description_text for phrase in ATTACK_PHRASES)
+        self.half_on_save = self.has_save and bool(
+            HALF_ON_SAVE_PATTERN.search(description_text))
+
+        self.base_dice, self.damage_type = parse_damage_from_description(
+            description_text, move_data)
+        self.scalings = tuple(parse_level_scalings(
+            move_data.get("higherLevels", "")))
+
+    def dice_for_level(self, pokemon_level):
+        """Best damage dice available at a level, or None if the move deals no damage"""
+        if not self.base_dice:
+            return None
+        for level_req, dice in self.scalings:
+            if pokemon_level >= level_req:
+                return dice
+        return self.base_dice
+
+
+MOVE_MECHANICS = {}
+
+
+def get_move_mechanics(move):
+    """Return the MoveMechanics for a move id or move dict, compiling it on first use"""
+    move_data = move_lookup().get(move) if isinstance(move, str) else move
+    if not move_data:
+        return None
+    move_id = move_data.get("id")
+    mechanics = MOVE_MECHANICS.get(move_id)
+    if mechanics is None:
+        mechanics = MoveMechanics(move_data)
+        if move_id is not None:
+            MOVE_MECHANICS[move_id] = mechanics
+    return mechanics
+
+
+def compile_move_mechanics():
+    """Compile every move up front (for batch work)"""
+    for move_data in move_lookup().values():
+        get_move_mechanics(move_data)
+    return MOVE_MECHANICS
+
+
+def damage_bonuses(mechanics, pokemon, ability_mod):
+    """(ability bonus, STAB bonus) added on top of a move's damage dice"""
+    # Calculate STAB bonus - ALWAYS check for type matching
+    stab_bonus = 0
+    if mechanics.move_type in pokemon.type_list:
+        # STAB applies differently based on whether move uses modifiers
+        if mechanics.has_move_modifier:
+            stab_bonus = ability_mod  # STAB doubles the Move Power Mod
+        else:
+            # For flat damage moves, STAB still adds the ability modifier once
+            stab_bonus = ability_mod
+
+    # Only moves with "+ MOVE" add the ability modifier itself
+    ability_bonus = ability_mod if mechanics.has_move_modifier else 0
+    return ability_bonus, stab_bonus
+
+
+def calculate_move_damage(pokemon, move_data, ability_mod=0, is_crit=False, rng=random):
+    """Calculate damage for a move including ability modifier, level scaling, critical hits, and STAB"""
+    mechanics = get_move_mechanics(move_data)
+    damage_type = mechanics.damage_type
+
+    # Use scaled dice if available, otherwise use base dice
+    dice_str = mechanics.dice_for_level(pokemon.level)
+    if not dice_str:
+        return None, None, None, None, False, 0
+
+    # Roll the damage dice
+    base_damage = roll_dice(dice_str, rng)
+
+    # Handle critical hits - roll damage dice again and add
+    crit_damage = 0
+    if is_crit:
+        crit_damage = roll_dice(dice_str, rng)
+        total_dice_damage = base_damage + crit_damage
+    else:
+        total_dice_damage = base_damage
+
+    # Add ability modifier and STAB bonus
+    ability_bonus, stab_bonus = damage_bonuses(mechanics, pokemon, ability_mod)
+    total_damage = total_dice_damage + ability_bonus + stab_bonus
+
+    # Return all components including crit info and STAB
+    return base_damage, total_damage, damage_type, dice_str, crit_damage, stab_bonus
+
+
+def parse_ability_scores(ability_scores_text):
+    """{"str": 13, ...} from the "STR: 13 (+1)" lines of a generated Pokémon"""
+    ability_scores = {}
+    for line in ability_scores_text.split("\n"):
+        parts = line.split(":")
+        if len(parts) >= 2:
+            ab = parts[0].strip().lower()
+            val_match = re.search(r"\d+", parts[1])
+            val = int(val_match.group()) if val_match else 10
+            ability_scores[ab] = val
+    return ability_scores
+
+
+def best_power_ability(power_abilities, pokemon):
+    """(ability, modifier) of the best power ability, or (None, 0) for status moves"""
+    chosen_ability = None
+    highest_mod = 0
+
+    if power_abilities:
+        # Attack move - find best ability modifier (could be negative)
+        highest_mod = float('-inf')  # Start with very low value
+        for ability in power_abilities:
+            mod = pokemon.modifier(ability)
+            if mod > highest_mod:
+                highest_mod = mod
+                chosen_ability = ability
+
+    return chosen_ability, highest_mod
+
+
+class AttackResult:
+    """Outcome of one use of a move, rendered by format_message, text() or to_dict()
+
+    kind is "attack" (d20 + mod + prof, possibly with a save DC as well),
+    "save" (save DC only) or "none" (nothing to roll - see note). Damage
+    fields stay None for moves without damage dice.
+    """
+
+    __slots__ = ("move_id", "kind", "note", "ability", "ability_mod", "proficiency",
+                 "d20", "attack_total", "is_crit", "save_dc", "save_type",
+                 "dice", "base_damage", "crit_damage", "adds_modifier", "stab_bonus",
+                 "total_damage", "damage_type")
+
+    def __init__(self, move_id, kind="none", note=None):
+        self.move_id = move_id
+        self.kind = kind
+        self.note = note
+        self.ability = None
+        self.ability_mod = self.proficiency = 0
+        self.d20 = self.attack_total = self.save_dc = self.save_type = None
+        self.is_crit = self.adds_modifier = False
+        self.dice = self.base_damage = self.total_damage = self.damage_type = None
+        self.crit_damage = self.stab_bonus = 0
+
+    @property
+    def ability_name(self):
+        return self.ability.upper() if self.ability else "N/A"
+
+    @property
+    def has_damage(self):
+        return self.base_damage is not None
+
+    def attack_parts(self):
+        """Breakdown of the attack total, or of the save DC for save-only moves"""
+        first = f"d20: {self.d20}" if self.kind == "attack" else "8"
+        return [first, f"{self.ability_mod} {self.ability_name}", f"{self.proficiency} prof"]
+
+    def damage_parts(self):
+        parts = [f"{self.dice}: {self.base_damage}"]
+        if self.is_crit and self.crit_damage > 0:
+            parts.append(f"{self.dice}: {self.crit_damage}")
+        if self.adds_modifier:
+            parts.append(f"{self.ability_mod} {self.ability_name}")
+        if self.stab_bonus > 0:
+            parts.append(f"{self.stab_bonus} STAB")
+        return parts
+
+    def save_text(self):
+        return f"{self.save_dc} ({self.save_type})" if self.save_type else f"{self.save_dc}"
+
+    def damage_breakdown(self):
+        prefix = "CRITICAL! " if self.is_crit and self.crit_damage > 0 else ""
+        return prefix + " + ".join(self.damage_parts())
+
+    # ---------------- Formatters ----------------
+    def text(self):
+        """(attack line, damage line or None) as plain text"""
+        if self.kind == "attack":
+            attack_text = f"{self.attack_total} [{' + '.join(self.attack_parts())}]"
+            if self.is_crit:
+                attack_text += " CRITICAL HIT!"
+            if self.save_dc is not None:
+                attack_text += f" | Save DC: {self.save_text()}"
+        elif self.kind == "save":
+            attack_text = f"Saving Throw DC: {self.save_text()} [{' + '.join(self.attack_parts())}]"
+        else:
+            return self.note, None
+
+        if not self.has_damage:
+            return attack_text, None
+        when = "hit" if self.kind == "attack" else "failed save"
+        return attack_text, (f"Damage on {when}: {self.total_damage} {self.damage_type} "
+                             f"[{self.damage_breakdown()}]")
+
+    def to_dict(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+@timed("attack_roll")
+def attack_roll(pokemon, move_id, rng=random):
+    move_data = move_lookup().get(move_id)
+    if not move_data:
+        return AttackResult(move_id, note="Move not found")
+
+    pokemon = as_instance(pokemon)
+    mechanics = get_move_mechanics(move_data)
+
+    # Determine best ability modifier - handle status moves properly
+    chosen_ability, highest_mod = best_power_ability(
+        mechanics.power_abilities, pokemon)
+    prof = pokemon.proficiency_bonus
+
+    # Only roll d20 and check for crit if the move involves an attack roll
+    d20_roll = 0  # non-attack moves keep 0 so the math works
+    is_crit = False
+    if mechanics.has_attack:
+        d20_roll = rng.randint(1, 20)
+        is_crit = (d20_roll == 20)
+
+    # Calculate damage
+    base_damage, total_damage, damage_type, dice_str, crit_damage, stab_bonus = \
+        calculate_move_damage(pokemon, move_data, highest_mod, is_crit, rng)
+
+    # Moves with both an attack and a save (like Vice Grip) roll to hit and show the DC;
+    # moves with a power ability but neither still get a to-hit total
+    if mechanics.has_save and not mechanics.has_attack:
+        result = AttackResult(mechanics.move_id, "save")
+    elif mechanics.has_save or mechanics.power_abilities:
+        result = AttackResult(mechanics.move_id, "attack")
+        result.d20 = d20_roll
+        result.attack_total = d20_roll + highest_mod + prof
+        result.is_crit = is_crit
+    else:
+        return AttackResult(mechanics.move_id, note="See move description")
+
+    result.ability = chosen_ability
+    result.ability_mod = highest_mod
+    result.proficiency = prof
+    if mechanics.has_save:
+        result.save_dc = 8 + highest_mod + prof
+        result.save_type = mechanics.save_type
+
+    if base_damage is not None:
+        result.dice = dice_str
+        result.base_damage = base_damage
+        result.crit_damage = crit_damage
+        result.adds_modifier = mechanics.has_move_modifier
+        result.stab_bonus = stab_bonus
+        result.total_damage = total_damage
+        result.damage_type = damage_type
+    return result
+
+
+def format_message(pokemon_name, move_name, result):
+    """Format an AttackResult for the battle log in Roll20 style"""
+
+    # Start with the move announcement
+    message_parts = [f"{pokemon_name} uses {move_name}!"]
+    message_parts.append("")  # Empty line for spacing
+
+    if result.kind == "save":
+        message_parts.append(f"Spell Save DC: {result.save_text()}")
+        message_parts.append(f"  └ {' + '.join(result.attack_parts())}")
+    elif result.kind == "attack":
+        crit_text = " (CRITICAL HIT!)" if result.is_crit else ""
+        message_parts.append(f"Attack Roll: {result.attack_total}{crit_text}")
+        message_parts.append(f"  └ {' + '.join(result.attack_parts())}")
+    else:
+        # Other cases (like "See move description")
+        message_parts.append(f"Result: {result.note}")
+
+    if result.kind != "none" and result.has_damage:
+        crit_text = " (CRITICAL!)" if result.is_crit and result.crit_damage > 0 else ""
+        message_parts.append(
+            f"Damage: {result.total_damage} {result.damage_type}{crit_text}")
+        message_parts.append(f"  └ {' + '.join(result.damage_parts())}")
+
+    return "\n".join(message_parts)
+
+
+class PokemonType:
+    def __init__(self, types: list[str]):
+        if not types or len(types) > 2:
+            raise ValueError("PokemonType must have 1 or 2 types")
+        chart = type_chart()
+        for t in types:
+            if t not in chart.codes:
+                raise ValueError(f"Invalid Pokémon type: {t}")
+        self.types = types
+        self.profile = chart.profile(types)
+
+    def defensive_multipliers(self) -> dict[str, float]:
+        return dict(zip(type_chart().type_names, self.profile.multipliers))
+
+    def vulnerabilities(self) -> list[str]:
+        return list(self.profile.vulnerabilities)
+
+    def resistances(self) -> list[str]:
+        return list(self.profile.resistances)
+
+    def immunities(self) -> list[str]:
+        return list(self.profile.immunities) or ["None"]
+
+# ---------------- AREA CHOICE ----------------
+
+
+def choose_area(areas):
+    if not areas:
+        print("❌ No areas available.")
+        return None
+    print("\nAvailable areas:")
+    for area_name in areas.keys():
+        print(f"- {area_name}")
+    while True:
+        choice = input("Type the area name: ").strip()
+        area_key = next(
+            (name for name in areas if name.lower() == choice.lower()), None)
+        if area_key:
+            return areas[area_key]
+        else:
+            print("❌ Area not found. Try again.")
+
+# ---------------- NATURE APPLY ----------------
+
+
+def apply_nature(attributes, rng=random):
+    nature = NATURE_SAMPLER.sample(rng)
+    modified_attributes = attributes.copy()
+    incr_text = decr_text = ""
+    if nature["increase"]:
+        modified_attributes[nature["increase"]] += 1
+        incr_text = f"+1 {nature['increase'].capitalize()}"
+    if nature["decrease"]:
+        modified_attributes[nature["decrease"]] -= 1
+        decr_text = f"-1 {nature['decrease'].capitalize()}"
+    if incr_text or decr_text:
+        nature_text = f"{nature['name']} ({incr_text}{', ' if incr_text and decr_text else ''}{decr_text})"
+    else:
+        nature_text = nature['name']
+    return nature["name"], modified_attributes, nature_text
+
+# ---------------- ABILITY MODIFIER ----------------
+
+
+def ability_modifier(score):
+    return (score - 10) // 2
+
+# ---------------- ASI LOGIC ----------------
+
+
+# No ASI point raises a stat above this
+ASI_CAP = 20
+
+
+def distribute_asi(attributes: dict, points: int, rng=random) -> dict:
+    """Spread points uniformly over the stats below ASI_CAP, as a capped multinomial draw
+
+    Same distribution as handing out one point at a time to a random stat
+    still below the cap: all points are drawn at once, and any that land
+    above the cap are drawn again over the stats still below it (rarely
+    more than one round). See bench/asi_check.py for the statistical check.
+    """
+    modified_attributes = attributes.copy()
+    while points:
+        uncapped_stats = [s for s in modified_attributes if modified_attributes[s] < ASI_CAP]
+        if not uncapped_stats:
+            break  # all stats capped
+        for stat in rng.choices(uncapped_stats, k=points):
+            modified_attributes[stat] += 1
+        points = 0
+        for stat in uncapped_stats:
+            if modified_attributes[stat] > ASI_CAP:
+                points += modified_attributes[stat] - ASI_CAP
+                modified_attributes[stat] = ASI_CAP
+
+    return modified_attributes
+
+
+def apply_asi(full_pokemon, attributes: dict, level: int, rng=random) -> dict:
+    return distribute_asi(attributes, asi_points(full_pokemon, level), rng)
+
+
+# ---------------- FORMAT LIST ----------------
+
+
+def format_ability_scores(attributes):
+    return "\n".join(
+        f"{k.upper()}: {v} ({'+' if (mod := ability_modifier(v)) >= 0 else ''}{mod})"
+        for k, v in attributes.items()
+    )
+
+
+def format_list(lst):
+    return ", ".join(f"{i['type'].capitalize()} {i['value']}ft" if isinstance(i, dict) else str(i) for i in lst)
+
+# ---------------- POKEMON INSTANCE ----------------
+ABILITY_NAMES = ("str", "dex", "con", "int", "wis", "cha")
+ABILITY_INDEX = {ability: i for i, ability in enumerate(ABILITY_NAMES)}
+
+
+class PokemonInstance:
+    """One generated Pokémon with typed stats
+
+    Ability scores are an integer array in ABILITY_NAMES order with their
+    modifiers precomputed, and skill/save proficiencies are sets, so rolls
+    are plain arithmetic. It still reads like the old dict - pokemon["skills"],
+    pokemon.get("ability_scores") - with display strings built on access;
+    to_dict() gives the JSON form.
+    """
+
+    __slots__ = ("instance_id", "name", "shiny", "level", "sr", "proficiency_bonus",
+                 "gender", "type_list", "profile", "size", "nature", "ac", "hp",
+                 "speed", "senses", "scores", "modifiers", "skill_list", "skill_set",
+                 "save_list", "save_set", "moves", "abilities", "held_item", "image_url")
+
+    KEYS = ("name", "shiny", "level", "sr", "proficiency_bonus", "gender", "types",
+            "size", "nature", "ac", "hp", "speed", "senses", "ability_scores", "skills",
+            "saving_throws", "vulnerabilities", "resistances", "immunities", "moves",
+            "abilities", "held_item", "image_url")
+
+    def __init__(self, name, level, scores, proficiency_bonus=0, type_list=(),
+                 skills=(), saving_throws=(), shiny=False, sr=0, gender="Unknown",
+                 size="Unknown", nature="Unknown", ac="Unknown", hp="Unknown",
+                 speed="Unknown", senses="Unknown", moves=(), abilities="",
+                 held_item="None", image_url="", instance_id=None):
+        self.instance_id = instance_id
+        self.name = name
+        self.shiny = shiny
+        self.level = level
+        self.sr = sr
+        self.proficiency_bonus = proficiency_bonus
+        self.gender = gender
+        self.type_list = tuple(type_list)
+        self.profile = type_chart().profile(self.type_list) if self.type_list else None
+        self.size = size
+        self.nature = nature
+        self.ac = ac
+        self.hp = hp
+        self.speed = speed
+        self.senses = senses
+        self.scores = tuple(scores)
+        self.modifiers = tuple(ability_modifier(score) for score in self.scores)
+        self.skill_list = tuple(skills)
+        self.skill_set = frozenset(s.lower() for s in self.skill_list)
+        self.save_list = tuple(saving_throws)
+        self.save_set = frozenset(s.lower() for s in self.save_list)
+        self.moves = list(moves)
+        self.abilities = abilities
+        self.held_item = held_item
+        self.image_url = image_url
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild from to_dict() output, or any dict with the same keys"""
+        scores = parse_ability_scores(data.get("ability_scores", ""))
+        types_text = data.get("types", "")
+        type_list = [t.strip().lower() for t in types_text.split("/")
+                     if t.strip() and types_text != "Unknown"]
+
+        def names(key):
+            text = data.get(key) or "None"
+            return [] if text == "None" else [s.strip().lower() for s in text.split(",")]
+
+        return cls(
+            data.get("name", "Unknown"), data.get("level", 1),
+            [scores.get(ability, 10) for ability in ABILITY_NAMES],
+            data.get("proficiency_bonus", 0), type_list, names("skills"),
+            names("saving_throws"), data.get("shiny", False), data.get("sr", 0),
+            data.get("gender", "Unknown"), data.get("size", "Unknown"),
+            data.get("nature", "Unknown"), data.get("ac", "Unknown"),
+            data.get("hp", "Unknown"), data.get("speed", "Unknown"),
+            data.get("senses", "Unknown"), data.get("moves", []),
+            data.get("abilities", ""), data.get("held_item", "None"),
+            data.get("image_url", ""), data.get("_id"))
+
+    # ---------------- Rolls ----------------
+    def score(self, ability):
+        index = ABILITY_INDEX.get(ability)
+        return 10 if index is None else self.scores[index]
+
+    def modifier(self, ability):
+        index = ABILITY_INDEX.get(ability)
+        return 0 if index is None else self.modifiers[index]
+
+    def proficient_save(self, ability):
+        return ability in self.save_set
+
+    def proficient_skill(self, skill):
+        return skill.lower() in self.skill_set
+
+    # ---------------- Display strings ----------------
+    def _display(self, key):
+        if key == "types":
+            return "/".join(t.capitalize() for t in self.type_list) or "Unknown"
+        if key == "ability_scores":
+            return "\n".join(
+                f"{ability.upper()}: {score} ({'+' if mod >= 0 else ''}{mod})"
+                for ability, score, mod in zip(ABILITY_NAMES, self.scores, self.modifiers))
+        if key == "skills":
+            return ", ".join(s.capitalize() for s in self.skill_list) or "None"
+        if key == "saving_throws":
+            return ", ".join(s.upper() for s in self.save_list) or "None"
+        if key in ("vulnerabilities", "resistances"):
+            return list(getattr(self.profile, key)) if self.profile else []
+        if key == "immunities":
+            return (list(self.profile.immunities) or ["None"]) if self.profile else []
+        return getattr(self, key)
+
+    def __getitem__(self, key):
+        if key == "_id" and self.instance_id is not None:
+            return self.instance_id
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return self._display(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key in self.KEYS or (key == "_id" and self.instance_id is not None)
+
+    def keys(self):
+        return list(self.KEYS)
+
+    def to_dict(self):
+        data = {key: self._display(key) for key in self.KEYS}
+        if self.instance_id is not None:
+            data["_id"] = self.instance_id
+        return data
+
+    def __eq__(self, other):
+        if isinstance(other, PokemonInstance):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    __hash__ = None
+
+
+def as_instance(pokemon):
+    """A PokemonInstance for either an instance or a dict in the to_dict() format"""
+    if isinstance(pokemon, PokemonInstance):
+        return pokemon
+    return PokemonInstance.from_dict(pokemon)
+
+# ---------------- PICK RANDOM POKEMON ----------------
+
+
+class Encounter:
+    """A rolled encounter whose ability scores may still lack their ASIs
+
+    build() turns it into a PokemonInstance. Bulk generation rolls with
+    asi=False and draws the ASIs of a whole shard in one NumPy batch first.
+    """
+    __slots__ = ("level_stats", "attributes", "fields")
+
+    def __init__(self, level_stats, attributes, fields):
+        self.level_stats = level_stats
+        self.attributes = attributes
+        self.fields = fields  # every other PokemonInstance argument
+
+    def build(self):
+        con_mod = ability_modifier(self.attributes["con"])
+        return PokemonInstance(
+            scores=[self.attributes.get(ability, 10) for ability in ABILITY_NAMES],
+            proficiency_bonus=self.level_stats.proficiency_bonus,
+            hp=self.level_stats.hp(con_mod),
+            **self.fields)
+
+
+@timed("pick_random_pokemon")
+def pick_random_pokemon(area, pokemon_index, rng=random, conditions=frozenset()):
+    """Roll one encounter; conditions (e.g. {"night", "rain"}) apply entry weight modifiers"""
+    encounter = roll_encounter(area, pokemon_index, rng, conditions)
+    return encounter.build() if encounter else None
+
+
+def roll_encounter(area, pokemon_index, rng=random, conditions=frozenset(), asi=True):
+    """Every draw of pick_random_pokemon as an Encounter; asi=False leaves the ASIs to the caller"""
+    if not area.get("pokemon"):
+        print("❌ This area has no Pokémon!", file=sys.stderr)
+        return None
+
+    try:
+        sampler = area_sampler(area, frozenset(conditions))
+    except ValueError:
+        print("❌ No Pokémon can appear here under these conditions!", file=sys.stderr)
+        return None
+    p = sampler.sample(rng)
+    level = rng.randint(p["min_level"], p["max_level"])
+    species = pokemon_index.find(p["name"])
+    if not species:
+        print(f"❌ {p['name']} not found in pokemon.json!", file=sys.stderr)
+        return None
+    full_pokemon = species.data
+
+    # ------------------ SHINY CHECK ------------------
+    is_shiny = rng.randint(1, 100) == 1
+    display_name = p['name'].upper()
+
+    image_url = ""
+    if full_pokemon:
+        if is_shiny:
+            image_url = full_pokemon["media"].get("mainShiny", "")
+        else:
+            image_url = full_pokemon["media"].get("main", "")
+
+# ---------------- Held Item Check ----------------
+    if rng.randint(1, 4) == 1:  # 25% chance
+        held_items = load_held_items(HELDITEMS_FILE)
+        held_item_text = held_items.sample(
+            rng, area.get("name"), species.types, frozenset(conditions)) or "None"
+    else:
+        held_item_text = "None"
+
+    # Gender
+    if isinstance(species.gender, tuple):
+        gender_text = rng.choices(
+            ["Female", "Male"], weights=species.gender, k=1)[0]
+    else:
+        gender_text = species.gender
+
+    # ---------------- Ability Scores ----------------
+    base_attributes = full_pokemon.get("attributes", {}).copy()
+
+    # Apply nature first
+    _, nature_modified_attributes, nature_text = apply_nature(
+        base_attributes, rng)
+
+    # Everything level-dependent that is not random comes from the species' level table
+    level_stats = species.at_level(level)
+
+    # Then apply ASIs on top of nature-modified stats
+    modified_attributes = nature_modified_attributes
+    if asi:
+        modified_attributes = distribute_asi(
+            nature_modified_attributes, level_stats.asi_points, rng)
+
+    # ---------------- Moves selection ----------------
+    available_moves = level_stats.move_pool
+    moves_chosen = rng.sample(available_moves, min(
+        4, len(available_moves))) if available_moves else ["None"]
+    moves_chosen = [m.replace("-", " ").title() for m in moves_chosen]
+
+    # ---------------- Abilities ----------------
+    normal_abilities = species.normal_abilities
+    hidden_abilities = species.hidden_abilities
+    chosen_ability = rng.choice(
+        normal_abilities) if normal_abilities else "None"
+
+    def ability_with_desc(ability_id):
+        ability_info = ability_lookup().get(ability_id)
+        if ability_info:
+            return f"Ability: {ability_info['name']} - {ability_info['description']}\n"
+        return ability_id
+
+    abilities_text = ability_with_desc(chosen_ability)
+    if hidden_abilities:
+        hidden_texts = [ability_with_desc(h) for h in hidden_abilities]
+        abilities_text += "\nHidden " + "\n".join(hidden_texts)
+
+    # HP and the score list wait for the final attributes, see Encounter.build()
+    return Encounter(level_stats, modified_attributes, dict(
+        name=display_name,
+        level=level,
+        type_list=full_pokemon.get("type", []),
+        skills=full_pokemon.get("skills", []),
+        saving_throws=full_pokemon.get("savingThrows", []),
+        shiny=is_shiny,
+        sr=full_pokemon.get("sr", 0),
+        gender=gender_text,
+        size=full_pokemon.get("size", "Unknown").capitalize(),
+        nature=nature_text,
+        ac=full_pokemon.get("ac", "Unknown"),
+        speed=format_list(full_pokemon.get("speed", [])),
+        senses=format_list(full_pokemon.get("senses", [])),
+        moves=moves_chosen,
+        abilities=abilities_text,
+        held_item=held_item_text,
+        image_url=image_url,
+    ))
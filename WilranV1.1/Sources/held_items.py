@@ -0,0 +1,78 @@
+import json
+import os
+import sys
+
+from perf import timed
+from sampling import AliasSampler, entry_weight
+
+
+class HeldItemTable:
+    """helditems.json with a sampler per (area, types, conditions) pool
+
+    Each entry in "items" is either a plain name or an object:
+      {"name": "Charcoal", "rarity": "rare", "types": ["fire"]}
+      {"name": "Big Pearl", "weight": 2, "areas": ["Coral Reef"], "modifiers": {"night": 2}}
+    "weight", "rarity" and "modifiers" work like area entries. An item with
+    "types" only drops from Pokémon of one of those types, one with "areas"
+    only in those areas. A plain list of names draws exactly like the old
+    rng.choice over the list.
+    """
+
+    def __init__(self, items):
+        self.items = []
+        for item in items:
+            if isinstance(item, str):
+                item = {"name": item}
+            elif "types" in item:
+                item = dict(item, types=[t.lower() for t in item["types"]])
+            self.items.append(item)
+        self.samplers = {}
+
+    @classmethod
+    @timed("load.held_items")
+    def from_file(cls, file_path):
+        if not os.path.exists(file_path):
+            print(f"❌ {file_path} not found!", file=sys.stderr)
+            return cls([])
+        with open(file_path, "r", encoding="utf-8") as f:
+            return cls(json.load(f).get("items", []))
+
+    def __len__(self):
+        return len(self.items)
+
+    def sampler(self, area_name=None, types=(), conditions=frozenset()):
+        """AliasSampler over the items that can drop here, or None if none can"""
+        key = (area_name, types, conditions)
+        if key not in self.samplers:
+            pool = [item for item in self.items
+                    if ("types" not in item or any(t in item["types"] for t in types))
+                    and ("areas" not in item or area_name in item["areas"])]
+            weights = [entry_weight(item, conditions) for item in pool]
+            sampler = None
+            if pool and sum(weights) > 0:
+                sampler = AliasSampler(weights, [item["name"] for item in pool])
+            self.samplers[key] = sampler
+        return self.samplers[key]
+
+    def sample(self, rng, area_name=None, types=(), conditions=frozenset()):
+        """One item name, or None when nothing can drop here"""
+        sampler = self.sampler(area_name, types, conditions)
+        return sampler.sample(rng) if sampler else None
+
+
+# path -> (mtime_ns, table); a table is rebuilt only after the file changes
+_tables = {}
+
+
+def load_held_items(file_path):
+    """The HeldItemTable for file_path, re-read only when its mtime changes"""
+    try:
+        mtime = os.stat(file_path).st_mtime_ns
+    except OSError:
+        mtime = None
+    cached = _tables.get(file_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    table = HeldItemTable.from_file(file_path)
+    _tables[file_path] = (mtime, table)
+    return table
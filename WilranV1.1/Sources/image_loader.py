@@ -0,0 +1,112 @@
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from perf import timed
+
+
+REQUEST_TIMEOUT = 10  # seconds
+POLL_MS = 50
+MEMORY_CACHE_ITEMS = 128  # PhotoImages kept alive for instant re-display
+
+
+@timed("image.fetch")
+def fetch_image(url, size):
+    """Download an image and resize it with PIL (runs on a worker thread)"""
+    import requests
+    from PIL import Image
+
+    response = requests.get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    pil_img = Image.open(BytesIO(response.content))
+    pil_img.load()
+    return pil_img.resize(size, Image.Resampling.LANCZOS)
+
+
+class ImageLoader:
+    """Loads images on a thread pool and hands them back on the Tk main thread
+
+    Each request belongs to a slot (e.g. the randomizer preview or one tracker
+    row). A newer request for the same slot supersedes the old one, so results
+    from a stale re-roll are dropped instead of overwriting the current image.
+    """
+
+    def __init__(self, widget, max_workers=4, sprite_cache=None):
+        self.widget = widget
+        self.sprite_cache = sprite_cache
+        self.memory_cache = OrderedDict()  # (url, size) -> PhotoImage, least recent first
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="wilran-img")
+        self.results = queue.Queue()
+        self.pending = {}  # slot -> (generation, future)
+        self.generation = 0
+        self.polling = False
+
+    def request(self, slot, url, size, callback):
+        """Load url resized to size; callback(tk_image or None) runs on the Tk thread"""
+        self.cancel(slot)
+        key = (url, size)
+        if key in self.memory_cache:
+            self.memory_cache.move_to_end(key)
+            callback(self.memory_cache[key])
+            return
+
+        self.generation += 1
+        generation = self.generation
+
+        def work():
+            try:
+                if self.sprite_cache:
+                    result = self.sprite_cache.get_thumbnail(url, size)
+                else:
+                    result = fetch_image(url, size)
+            except Exception:
+                result = None
+            self.results.put((slot, generation, key, result, callback))
+
+        self.pending[slot] = (generation, self.executor.submit(work))
+        self._start_polling()
+
+    def cancel(self, slot):
+        """Forget any in-flight request for a slot"""
+        pending = self.pending.pop(slot, None)
+        if pending:
+            pending[1].cancel()
+
+    def shutdown(self):
+        for slot in list(self.pending):
+            self.cancel(slot)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.sprite_cache:
+            self.sprite_cache.flush()
+
+    def _start_polling(self):
+        if not self.polling:
+            self.polling = True
+            self.widget.after(POLL_MS, self._poll)
+
+    def _poll(self):
+        from PIL import ImageTk
+
+        while True:
+            try:
+                slot, generation, key, pil_img, callback = self.results.get_nowait()
+            except queue.Empty:
+                break
+            tk_img = None
+            if pil_img:
+                tk_img = ImageTk.PhotoImage(pil_img)
+                self.memory_cache[key] = tk_img
+                if len(self.memory_cache) > MEMORY_CACHE_ITEMS:
+                    self.memory_cache.popitem(last=False)
+            pending = self.pending.get(slot)
+            if not pending or pending[0] != generation:
+                continue  # cancelled or superseded
+            del self.pending[slot]
+            callback(tk_img)
+
+        if self.pending:
+            self.widget.after(POLL_MS, self._poll)
+        else:
+            self.polling = False
@@ -0,0 +1,72 @@
+# Levels a Pokémon can have; every species gets one precomputed row per level
+MAX_LEVEL = 20
+
+# ---------------- PROFICIENCY BONUS ----------------
+
+
+def proficiency_bonus(level):
+    if 1 <= level <= 4:
+        return 2
+    elif 5 <= level <= 8:
+        return 3
+    elif 9 <= level <= 12:
+        return 4
+    elif 13 <= level <= 16:
+        return 5
+    else:  # 17+
+        return 6
+
+
+# ---------------- HIT DICE ----------------
+hit_dice_bonus = {
+    "d4": 3,
+    "d6": 4,
+    "d8": 5,
+    "d10": 6,
+    "d12": 7,
+    "d20": 11
+}
+
+# ---------------- ASI LOGIC ----------------
+ASI_BREAKPOINTS = [4, 8, 12, 16]
+
+
+def asi_per_breakpoint(full_pokemon):
+    """Single-stage Pokémon get 4 points per breakpoint, two-stage lines 3, others 2"""
+    evo = full_pokemon.get("evolution")
+    max_stage = int(evo.get("maxStage")) if evo and "maxStage" in evo else 1
+    return 4 if max_stage == 1 else 3 if max_stage == 2 else 2
+
+
+def asi_points(full_pokemon, level):
+    """ASI points for breakpoints strictly above minLevel and <= level"""
+    pokemon_min_level = full_pokemon.get("minLevel", 1)
+    valid_bps = [bp for bp in ASI_BREAKPOINTS if bp > pokemon_min_level and bp <= level]
+    return asi_per_breakpoint(full_pokemon) * len(valid_bps)
+
+
+# ---------------- LEVEL TABLE ----------------
+
+class LevelStats:
+    """One species at one level: everything about it that does not need a roll"""
+    __slots__ = ("level", "proficiency_bonus", "asi_points", "move_pool",
+                 "base_hp", "hp_levels", "hp_die_bonus")
+
+    def __init__(self, species, level):
+        data = species.data
+        self.level = level
+        self.proficiency_bonus = proficiency_bonus(level)
+        self.asi_points = asi_points(data, level)
+        self.move_pool = species.move_pool(level)
+        # HP = base + (levels above minLevel) * (hit die bonus + CON modifier)
+        self.base_hp = data["hp"]
+        self.hp_levels = max(0, level - data["minLevel"])
+        self.hp_die_bonus = hit_dice_bonus[data["hitDice"]]
+
+    def hp(self, con_mod):
+        return self.base_hp + self.hp_levels * (self.hp_die_bonus + con_mod)
+
+
+def level_table(species):
+    """LevelStats for levels 1..MAX_LEVEL; index 0 is level 1"""
+    return tuple(LevelStats(species, level) for level in range(1, MAX_LEVEL + 1))
@@ -0,0 +1,136 @@
+import json
+import os
+import sys
+from collections import deque
+
+
+# Fix for PyInstaller - get the directory where the executable is located
+if getattr(sys, 'frozen', False):
+    # Running as PyInstaller executable
+    SCRIPT_DIR = os.path.dirname(sys.executable)
+else:
+    # Running as Python script
+    SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SPILL_FILE = os.path.join(SCRIPT_DIR, "battle_log.jsonl")
+DEFAULT_MEMORY_CAP = 1000
+SPILL_MAX_BYTES = 1024 * 1024
+SPILL_BACKUPS = 3
+
+
+class SpillFile:
+    """Rotating on-disk store for log entries that fell out of memory
+
+    Each line is "<entry number>\\t<JSON message>", so a range lookup only
+    decodes the messages it returns. When the current file passes max_bytes
+    it becomes .1, .1 becomes .2 and so on; the oldest beyond backups is
+    dropped for good.
+    """
+
+    def __init__(self, path=SPILL_FILE, max_bytes=SPILL_MAX_BYTES, backups=SPILL_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.first_numbers = []  # first entry number of each file, oldest first
+        # Entry numbers restart every session, so old spill files are meaningless
+        for path in self._paths():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _paths(self):
+        """Every file, oldest first"""
+        return [f"{self.path}.{i}" for i in range(self.backups, 0, -1)] + [self.path]
+
+    def _rotate(self):
+        for i in range(self.backups, 0, -1):
+            src = self.path if i == 1 else f"{self.path}.{i - 1}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i}")
+        if len(self.first_numbers) > self.backups:
+            del self.first_numbers[0]
+
+    def write(self, entries):
+        """Append [(number, message), ...] in order"""
+        if not entries:
+            return
+        if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+            self._rotate()
+        if not os.path.exists(self.path):
+            self.first_numbers.append(entries[0][0])
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(f"{n}\t{json.dumps(message, ensure_ascii=False)}\n"
+                         for n, message in entries)
+
+    @property
+    def earliest(self):
+        return self.first_numbers[0] if self.first_numbers else None
+
+    def read(self, lo, hi):
+        """Entries numbered lo <= n < hi that are still on disk"""
+        entries = []
+        existing = [p for p in self._paths() if os.path.exists(p)]
+        for index, path in enumerate(existing):
+            following = self.first_numbers[index + 1] if index + 1 < len(self.first_numbers) else None
+            # Skip files that end before lo or start at/after hi
+            if following is not None and following <= lo:
+                continue
+            if self.first_numbers[index] >= hi:
+                break
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    number, _, message = line.partition("\t")
+                    n = int(number)
+                    if lo <= n < hi:
+                        entries.append((n, json.loads(message)))
+                    elif n >= hi:
+                        break
+        return entries
+
+
+class LogStore:
+    """Battle log entries: the newest memory_cap in a ring buffer, older ones spilled to disk"""
+
+    def __init__(self, memory_cap=DEFAULT_MEMORY_CAP, spill=None):
+        self.recent = deque()
+        self.memory_cap = memory_cap
+        self.spill = spill if spill is not None else SpillFile()
+        self.total = 0
+
+    def __len__(self):
+        return self.total
+
+    @property
+    def earliest(self):
+        """Number of the oldest entry that can still be read"""
+        if self.spill.earliest is not None:
+            return self.spill.earliest
+        return self.recent[0][0] if self.recent else self.total
+
+    def append_many(self, messages):
+        """Store messages, returning their [(number, message), ...]"""
+        added = []
+        for message in messages:
+            added.append((self.total, message))
+            self.total += 1
+        self.recent.extend(added)
+        overflow = len(self.recent) - self.memory_cap
+        if overflow > 0:
+            self.spill.write([self.recent.popleft() for _ in range(overflow)])
+        return added
+
+    def get(self, lo, hi):
+        """Entries numbered lo <= n < hi, from memory or the spill files"""
+        lo = max(lo, self.earliest)
+        hi = min(hi, self.total)
+        if lo >= hi:
+            return []
+        first_in_memory = self.recent[0][0] if self.recent else self.total
+        entries = []
+        if lo < first_in_memory:
+            entries = self.spill.read(lo, min(hi, first_in_memory))
+        if hi > first_in_memory:
+            start = max(lo, first_in_memory) - first_in_memory
+            entries.extend(self.recent[i] for i in range(start, hi - first_in_memory))
+        return entries
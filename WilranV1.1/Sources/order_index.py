@@ -0,0 +1,136 @@
+import random
+
+
+class _Node:
+    __slots__ = ("key", "priority", "size", "left", "right", "parent")
+
+    def __init__(self, key, priority):
+        self.key = key
+        self.priority = priority
+        self.size = 1
+        self.left = self.right = self.parent = None
+
+
+def _size(node):
+    return node.size if node else 0
+
+
+def _update(node):
+    node.size = 1 + _size(node.left) + _size(node.right)
+    if node.left:
+        node.left.parent = node
+    if node.right:
+        node.right.parent = node
+
+
+def _merge(a, b):
+    """Every node of a followed by every node of b"""
+    if not a or not b:
+        return a or b
+    if a.priority > b.priority:
+        a.right = _merge(a.right, b)
+        _update(a)
+        return a
+    b.left = _merge(a, b.left)
+    _update(b)
+    return b
+
+
+def _split(node, count):
+    """(first count nodes, the rest)"""
+    if not node:
+        return None, None
+    if _size(node.left) >= count:
+        left, node.left = _split(node.left, count)
+        _update(node)
+        return left, node
+    node.right, right = _split(node.right, count - _size(node.left) - 1)
+    _update(node)
+    return node, right
+
+
+class OrderIndex:
+    """Ordered sequence of unique keys with O(log n) insert, remove, position and move
+
+    An implicit treap: each node knows its subtree size and parent, so the
+    position of a key is found by walking up from its node and moving a key
+    is a split and two merges. Priorities only shape the tree, so they come
+    from a private RNG and never touch the game streams.
+    """
+
+    def __init__(self, keys=()):
+        self._nodes = {}
+        self._root = None
+        self._priorities = random.Random(0)
+        for key in keys:
+            self.append(key)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, key):
+        return key in self._nodes
+
+    def __iter__(self):
+        stack = []
+        node = self._root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def _set_root(self, node):
+        self._root = node
+        if node:
+            node.parent = None
+
+    def index(self, key):
+        node = self._nodes[key]
+        position = _size(node.left)
+        while node.parent:
+            if node is node.parent.right:
+                position += _size(node.parent.left) + 1
+            node = node.parent
+        return position
+
+    def __getitem__(self, position):
+        if not 0 <= position < len(self):
+            raise IndexError("OrderIndex position out of range")
+        node = self._root
+        while True:
+            left = _size(node.left)
+            if position < left:
+                node = node.left
+            elif position == left:
+                return node.key
+            else:
+                position -= left + 1
+                node = node.right
+
+    def slice(self, start, stop):
+        """Keys at positions start <= i < stop"""
+        return [self[i] for i in range(max(start, 0), min(stop, len(self)))]
+
+    def insert(self, position, key):
+        if key in self._nodes:
+            raise ValueError(f"{key!r} is already in the order")
+        node = self._nodes[key] = _Node(key, self._priorities.random())
+        left, right = _split(self._root, position)
+        self._set_root(_merge(_merge(left, node), right))
+
+    def append(self, key):
+        self.insert(len(self), key)
+
+    def remove(self, key):
+        left, rest = _split(self._root, self.index(key))
+        _, right = _split(rest, 1)
+        del self._nodes[key]
+        self._set_root(_merge(left, right))
+
+    def move(self, key, position):
+        """Move key so it ends up at position"""
+        self.remove(key)
+        self.insert(position, key)
@@ -0,0 +1,89 @@
+import functools
+import os
+import threading
+import time
+from collections import deque
+
+# Latest samples kept per timer for the percentiles
+SAMPLES_KEPT = 2048
+
+# Off unless WILRAN_PROFILE is set, the CLI gets --profile or the debug window opens
+ENABLED = bool(os.environ.get("WILRAN_PROFILE"))
+
+
+class Stat:
+    __slots__ = ("count", "total", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=SAMPLES_KEPT)
+
+
+_stats = {}
+_lock = threading.Lock()
+
+
+def enable(on=True):
+    global ENABLED
+    ENABLED = on
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+
+def record(name, seconds):
+    with _lock:
+        stat = _stats.get(name)
+        if stat is None:
+            stat = _stats[name] = Stat()
+        stat.count += 1
+        stat.total += seconds
+        stat.samples.append(seconds)
+
+
+def timed(name):
+    """Decorator recording each call's duration; costs one flag check per call while off"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+def percentile(sorted_samples, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, min(len(sorted_samples) - 1, round(fraction * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+def snapshot():
+    """[{"name", "count", "total_ms", "p50_ms", "p95_ms"}, ...] by total time, largest first"""
+    with _lock:
+        stats = [(name, stat.count, stat.total, sorted(stat.samples))
+                 for name, stat in _stats.items()]
+    rows = [{
+        "name": name,
+        "count": count,
+        "total_ms": total * 1000,
+        "p50_ms": percentile(samples, 0.50) * 1000,
+        "p95_ms": percentile(samples, 0.95) * 1000,
+    } for name, count, total, samples in stats if samples]
+    rows.sort(key=lambda row: -row["total_ms"])
+    return rows
+
+
+def format_table(rows):
+    lines = [f"{'timer':<32} {'count':>8} {'total ms':>10} {'p50 ms':>9} {'p95 ms':>9}"]
+    lines += [f"{row['name']:<32} {row['count']:>8} {row['total_ms']:>10.1f} "
+              f"{row['p50_ms']:>9.3f} {row['p95_ms']:>9.3f}" for row in rows]
+    return "\n".join(lines)
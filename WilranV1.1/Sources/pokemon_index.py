@@ -0,0 +1,172 @@
+import json
+import os
+import sys
+
+from levels import MAX_LEVEL, LevelStats, level_table
+from species_search import SpeciesSearch
+
+
+# Level-gated move lists in pokemon.json and the level they unlock at
+LEVEL_MOVE_KEYS = [
+    ("start", 1),
+    ("level2", 2),
+    ("level6", 6),
+    ("level10", 10),
+    ("level14", 14),
+    ("level18", 18),
+]
+
+
+def parse_gender(gender_info):
+    """Turn a pokemon.json gender string into "Genderless", "Unknown" or a (female, male) ratio"""
+    if not isinstance(gender_info, str):
+        return "Unknown"
+    if gender_info.lower() == "genderless" or gender_info == "0:0":
+        return "Genderless"
+    if ":" in gender_info:
+        female_ratio, male_ratio = map(int, gender_info.split(":"))
+        if female_ratio + male_ratio > 0:
+            return (female_ratio, male_ratio)
+        return "Genderless"
+    return "Unknown"
+
+
+class Species:
+    """One pokemon.json entry plus the values every roll would otherwise recompute"""
+    __slots__ = ("data", "name", "types", "gender", "normal_abilities",
+                 "hidden_abilities", "move_pools", "levels")
+
+    def __init__(self, data):
+        self.data = data
+        self.name = data["name"]
+        self.types = tuple(t.lower() for t in data.get("type", []))
+        self.gender = parse_gender(data.get("gender", "Unknown"))
+
+        abilities_data = data.get("abilities", [])
+        self.normal_abilities = tuple(
+            a["id"] for a in abilities_data if not a.get("hidden", False))
+        self.hidden_abilities = tuple(
+            a["id"] for a in abilities_data if a.get("hidden", False))
+
+        # Cumulative move pools: (unlock level, every move available from that level)
+        moves_data = data.get("moves", {})
+        pools = []
+        pool = ()
+        for key, unlock_level in LEVEL_MOVE_KEYS:
+            pool = pool + tuple(moves_data.get(key, []))
+            pools.append((unlock_level, pool))
+        self.move_pools = tuple(pools)
+        self.levels = None  # level_table(), built by the first at_level() call
+
+    def move_pool(self, level):
+        """All level-gated moves the species knows at a level"""
+        available = ()
+        for unlock_level, pool in self.move_pools:
+            if level < unlock_level:
+                break
+            available = pool
+        return available
+
+    def at_level(self, level):
+        """LevelStats for this species at a level, from the cached per-level table"""
+        if not 1 <= level <= MAX_LEVEL:
+            return LevelStats(self, level)
+        if self.levels is None:
+            self.levels = level_table(self)
+        return self.levels[level - 1]
+
+
+class PokemonIndex:
+    """Case-insensitive lookups and secondary indexes over pokemon.json"""
+
+    def __init__(self, items):
+        self.items = items
+        self.species = [Species(p) for p in items]
+        self.by_name = {}
+        self.by_id = {}
+        self.by_number = {}
+        self.by_type = {}
+        self.by_sr = {}
+
+        for species in self.species:
+            data = species.data
+            self.by_name.setdefault(species.name.lower(), species)
+            if data.get("id"):
+                self.by_id.setdefault(str(data["id"]).lower(), species)
+            if data.get("number") is not None:
+                self.by_number.setdefault(data["number"], []).append(species)
+            for t in species.types:
+                self.by_type.setdefault(t, []).append(species)
+            self.by_sr.setdefault(data.get("sr", 0), []).append(species)
+        self._search = None
+
+    @property
+    def search(self):
+        """SpeciesSearch over this index, built on first use"""
+        if self._search is None:
+            self._search = SpeciesSearch(self)
+        return self._search
+
+    @classmethod
+    def from_file(cls, file_path):
+        """Build the index from a pokemon.json file (empty if it is missing)"""
+        if not os.path.exists(file_path):
+            print(f"❌ {file_path} not found!", file=sys.stderr)
+            return cls([])
+        with open(file_path, "r", encoding="utf-8") as f:
+            return cls(json.load(f).get("items", []))
+
+    def __len__(self):
+        return len(self.species)
+
+    def __iter__(self):
+        return iter(self.species)
+
+    def __contains__(self, key):
+        return self.find(key) is not None
+
+    def find(self, key):
+        """Look up a species by name, id or National Dex number"""
+        if isinstance(key, int):
+            forms = self.by_number.get(key)
+            return forms[0] if forms else None
+        key = str(key).strip().lower()
+        species = self.by_name.get(key) or self.by_id.get(key)
+        if species is None and key.isdigit():
+            return self.find(int(key))
+        return species
+
+    def get(self, key):
+        """Raw pokemon.json entry for a name, id or number, or None"""
+        species = self.find(key)
+        return species.data if species else None
+
+    def evolution_line(self, key):
+        """Every species in the evolution family of a species, lowest stage first"""
+        species = self.find(key)
+        if species is None:
+            return []
+        # Walk down to the base form, then out along every branch
+        seen = {id(species)}
+        while True:
+            parents = species.data.get("evolution", {}).get("from", [])
+            parent = self.find(parents[0]) if parents else None
+            if parent is None or id(parent) in seen:
+                break
+            seen.add(id(parent))
+            species = parent
+        line = [species]
+        seen = {id(species)}
+        for member in line:
+            for evolution in member.data.get("evolution", {}).get("to", []):
+                child = self.find(evolution.get("id", ""))
+                if child is not None and id(child) not in seen:
+                    seen.add(id(child))
+                    line.append(child)
+        return line
+
+    def of_type(self, type_name):
+        return self.by_type.get(type_name.lower(), [])
+
+    def with_sr(self, sr):
+        return self.by_sr.get(sr, [])
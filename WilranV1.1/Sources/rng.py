@@ -0,0 +1,35 @@
+import hashlib
+import random
+import secrets
+
+
+def derive_seed(*parts):
+    """Stable 64-bit seed from any mix of ints and strings"""
+    digest = hashlib.sha256("/".join(str(p) for p in parts).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class RandomStreams:
+    """Named random.Random substreams derived from one session seed
+
+    Encounter generation and combat rolls draw from separate streams, so
+    rolling dice in the tracker never changes which Pokémon the next
+    Randomize produces. The same seed replays a session exactly.
+    """
+
+    def __init__(self, seed=None):
+        self.seed = secrets.randbits(64) if seed is None else seed
+        self.streams = {}
+
+    def stream(self, name):
+        if name not in self.streams:
+            self.streams[name] = random.Random(derive_seed(self.seed, name))
+        return self.streams[name]
+
+    @property
+    def encounter(self):
+        return self.stream("encounter")
+
+    @property
+    def combat(self):
+        return self.stream("combat")
@@ -0,0 +1,114 @@
+import copy
+import math
+import threading
+from collections import OrderedDict
+
+# Weight of an area entry with a "rarity" tier and no explicit "weight"
+RARITY_WEIGHTS = {"common": 20, "uncommon": 10, "rare": 3, "very rare": 1}
+
+
+class AliasSampler:
+    """Weighted choice in O(1) per draw with Vose's alias method
+
+    The tables are built once in O(n). Equal weights skip them and draw with
+    rng.randrange, which consumes the stream exactly like rng.choice, so
+    seeds recorded before weights existed still replay the same encounters.
+    """
+
+    __slots__ = ("items", "size", "prob", "alias")
+
+    def __init__(self, weights, items=None):
+        weights = [float(w) for w in weights]
+        if not weights or any(w < 0 or math.isnan(w) for w in weights) or not sum(weights):
+            raise ValueError("AliasSampler needs non-negative weights with a positive sum")
+        self.items = list(items) if items is not None else None
+        self.size = len(weights)
+        self.prob = self.alias = None
+        if all(w == weights[0] for w in weights):
+            return
+
+        n = self.size
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        prob = [0.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left is 1 up to rounding error
+        for i in large + small:
+            prob[i] = 1.0
+        self.prob = prob
+        self.alias = alias
+
+    def __len__(self):
+        return self.size
+
+    def bind(self, items):
+        """A sampler sharing these tables that draws from items instead"""
+        bound = AliasSampler.__new__(AliasSampler)
+        bound.size, bound.prob, bound.alias = self.size, self.prob, self.alias
+        bound.items = items
+        return bound
+
+    def sample_index(self, rng):
+        if self.prob is None:
+            return rng.randrange(self.size)
+        i = rng.randrange(self.size)
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+    def sample(self, rng):
+        index = self.sample_index(rng)
+        return self.items[index] if self.items is not None else index
+
+
+def entry_weight(entry, conditions=()):
+    """Encounter weight of an area entry under the active conditions
+
+    "weight" wins over the "rarity" tier; "modifiers" multiplies it for each
+    active condition, e.g. {"night": 2, "rain": 0.5}.
+    """
+    weight = entry.get("weight")
+    if weight is None:
+        weight = RARITY_WEIGHTS.get(entry.get("rarity", "").lower(), 1)
+    for condition, multiplier in entry.get("modifiers", {}).items():
+        if condition in conditions:
+            weight *= multiplier
+    return weight
+
+
+# Alias tables kept for this many (entry list, conditions); least recently used go first
+AREA_SAMPLER_CACHE = 64
+
+# (id(area["pokemon"]), conditions) -> (deep copy of the entries, AliasSampler over indices)
+_area_samplers = OrderedDict()
+_area_samplers_lock = threading.Lock()
+
+
+def area_sampler(area, conditions=frozenset()):
+    """AliasSampler over an area's current entries under the active conditions
+
+    Cached tables are only reused while the entries still equal the copy
+    they were built from, so an entry edited in place never draws with its
+    old weight. The cache keeps copies, not the areas, and is bounded, so
+    areas replaced by a store reload are not pinned in memory.
+    """
+    entries = area["pokemon"]
+    key = (id(entries), conditions)
+    with _area_samplers_lock:
+        cached = _area_samplers.get(key)
+        if cached is not None and cached[0] == entries:
+            _area_samplers.move_to_end(key)
+            return cached[1].bind(entries)
+    tables = AliasSampler([entry_weight(e, conditions) for e in entries])
+    with _area_samplers_lock:
+        _area_samplers[key] = (copy.deepcopy(entries), tables)
+        _area_samplers.move_to_end(key)
+        if len(_area_samplers) > AREA_SAMPLER_CACHE:
+            _area_samplers.popitem(last=False)
+    return tables.bind(entries)
@@ -0,0 +1,193 @@
+import json
+import os
+import queue
+import sys
+import threading
+
+
+# Fix for PyInstaller - get the directory where the executable is located
+if getattr(sys, 'frozen', False):
+    # Running as PyInstaller executable
+    SCRIPT_DIR = os.path.dirname(sys.executable)
+else:
+    # Running as Python script
+    SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SESSION_FILE = os.path.join(SCRIPT_DIR, "wilran_session.jsonl")
+SESSION_FORMAT = 1
+# Rewrite the journal as one snapshot after this many appended events
+COMPACT_EVERY = 500
+# Battle log messages kept in a snapshot
+MAX_LOG_MESSAGES = 1000
+
+
+class SessionState:
+    """Tracker state rebuilt by applying journal events in order
+
+    Events are small dicts with an "op":
+      add     {"id", "pokemon"}      pokemon in PokemonInstance.to_dict() form
+      remove  {"id"}
+      order   {"ids"}                sidebar order after a drag
+      hp      {"id", "current", "max"}
+      pp      {"id", "pp"}           the full move -> PP dict of one Pokémon
+      select  {"id"}
+      log     {"message"}
+    """
+
+    def __init__(self):
+        self.next_id = 1
+        self.pokemon = {}   # id -> pokemon dict, in sidebar order
+        self.health = {}    # id -> {"current", "max"}
+        self.pp = {}        # id -> {move name: PP left}
+        self.selected = None
+        self.log = []
+
+    def apply(self, event):
+        op = event.get("op")
+        pokemon_id = event.get("id")
+        if op == "add":
+            self.pokemon[pokemon_id] = event["pokemon"]
+            self.next_id = max(self.next_id, pokemon_id + 1)
+        elif op == "remove":
+            self.pokemon.pop(pokemon_id, None)
+            self.health.pop(pokemon_id, None)
+            self.pp.pop(pokemon_id, None)
+            if self.selected == pokemon_id:
+                self.selected = None
+        elif op == "order":
+            self.pokemon = {pid: self.pokemon[pid]
+                            for pid in event["ids"] if pid in self.pokemon}
+        elif op == "hp" and pokemon_id in self.pokemon:
+            self.health[pokemon_id] = {
+                "current": event["current"], "max": event["max"]}
+        elif op == "pp" and pokemon_id in self.pokemon:
+            self.pp[pokemon_id] = dict(event["pp"])
+        elif op == "select":
+            self.selected = pokemon_id if pokemon_id in self.pokemon else None
+        elif op == "log":
+            self.log.append(event["message"])
+            if len(self.log) > 2 * MAX_LOG_MESSAGES:
+                del self.log[:-MAX_LOG_MESSAGES]
+
+    def is_empty(self):
+        return not self.pokemon and not self.log
+
+    def to_snapshot(self):
+        # JSON object keys are strings, so ids travel as [id, value] pairs
+        return {
+            "op": "snapshot",
+            "format": SESSION_FORMAT,
+            "next_id": self.next_id,
+            "pokemon": [[pid, p] for pid, p in self.pokemon.items()],
+            "health": [[pid, h] for pid, h in self.health.items()],
+            "pp": [[pid, pp] for pid, pp in self.pp.items()],
+            "selected": self.selected,
+            "log": self.log[-MAX_LOG_MESSAGES:],
+        }
+
+    def load_snapshot(self, snapshot):
+        self.next_id = snapshot.get("next_id", 1)
+        self.pokemon = {pid: p for pid, p in snapshot.get("pokemon", [])}
+        self.health = {pid: h for pid, h in snapshot.get("health", [])}
+        self.pp = {pid: pp for pid, pp in snapshot.get("pp", [])}
+        self.selected = snapshot.get("selected")
+        self.log = list(snapshot.get("log", []))
+
+
+def load_session(path=SESSION_FILE):
+    """SessionState from a journal file, skipping a torn last line after a crash"""
+    state = SessionState()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if event.get("op") == "snapshot":
+                    if event.get("format") != SESSION_FORMAT:
+                        return SessionState()
+                    state.load_snapshot(event)
+                else:
+                    state.apply(event)
+    except OSError:
+        pass
+    return state
+
+
+class SessionJournal:
+    """Append-only autosave of tracker events, written on a background thread
+
+    record() only puts the event on a queue, so the UI never waits on disk.
+    The writer thread appends each event as one JSON line, keeps its own
+    SessionState replica and, every COMPACT_EVERY events, rewrites the file
+    as a single snapshot line (temp file + os.replace).
+    """
+
+    def __init__(self, path=SESSION_FILE, state=None):
+        self.path = path
+        # The writer thread's own replica. A state the caller already loaded
+        # from path is taken over rather than parsed again; the caller may
+        # only read it until its first record().
+        self.state = load_session(path) if state is None else state
+        self.events = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="session-journal", daemon=True)
+        self.thread.start()
+        # Start from a compact file, whatever the previous session left behind
+        self.events.put({"op": "compact"})
+
+    def record(self, event):
+        self.events.put(event)
+
+    def reset(self):
+        """Forget the saved session"""
+        self.events.put({"op": "reset"})
+
+    def close(self):
+        """Write everything still queued, compact and stop the writer"""
+        self.events.put({"op": "compact"})
+        self.events.put(None)
+        self.thread.join()
+
+    def _run(self):
+        appended = 0
+        out = None
+        while True:
+            event = self.events.get()
+            if event is None:
+                break
+            try:
+                op = event["op"]
+                if op in ("compact", "reset"):
+                    if op == "reset":
+                        self.state = SessionState()
+                    if out:
+                        out.close()
+                        out = None
+                    self._compact()
+                    appended = 0
+                    continue
+
+                self.state.apply(event)
+                if out is None:
+                    out = open(self.path, "a", encoding="utf-8")
+                out.write(json.dumps(event, ensure_ascii=False) + "\n")
+                appended += 1
+                # Flush once the queue drains, not after every event of a burst
+                if self.events.empty():
+                    out.flush()
+                if appended >= COMPACT_EVERY:
+                    out.close()
+                    out = None
+                    self._compact()
+                    appended = 0
+            except (OSError, TypeError, ValueError) as e:
+                print(f"❌ Could not save the session: {e}", file=sys.stderr)
+        if out:
+            out.close()
+
+    def _compact(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(self.state.to_snapshot(), ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
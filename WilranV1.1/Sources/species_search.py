@@ -0,0 +1,172 @@
+import re
+from collections import Counter
+
+# Fuzzy matches scoring below this are not worth suggesting
+MIN_SIMILARITY = 0.3
+SR_FILTER = re.compile(r"^sr(<=|>=|<|>|=)(\d+(?:\.\d+)?|\d+/\d+)$")
+SR_COMPARE = {
+    "<=": lambda a, b: a <= b,
+    ">=": lambda a, b: a >= b,
+    "<": lambda a, b: a < b,
+    ">": lambda a, b: a > b,
+    "=": lambda a, b: a == b,
+}
+
+
+def normalize(text):
+    """Lowercase and keep only letters and digits, so Mr. Mime also matches mr-mime"""
+    return re.sub(r"[^a-z0-9]", "", str(text).lower())
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SpeciesSearch:
+    """Prefix trie plus trigram index over every species name and id
+
+    suggest() ranks exact matches first, then prefix matches (shortest
+    name first), then fuzzy trigram matches for typos, so a misspelt name
+    still finds its species. Both indexes are built once, in O(total name
+    length).
+    """
+
+    def __init__(self, pokemon_index):
+        self.index = pokemon_index
+        self.trie = {}
+        self.trigram_postings = {}  # trigram -> set of key ids
+        self.keys = []              # key id -> (normalized key, species)
+        self.key_trigrams = []
+
+        for species in pokemon_index:
+            names = {normalize(species.name), normalize(species.data.get("id", ""))}
+            for key in names - {""}:
+                key_id = len(self.keys)
+                self.keys.append((key, species))
+
+                node = self.trie
+                for char in key:
+                    node = node.setdefault(char, {})
+                node.setdefault(None, []).append(key_id)
+
+                grams = trigrams(key)
+                self.key_trigrams.append(len(grams))
+                for gram in grams:
+                    self.trigram_postings.setdefault(gram, set()).add(key_id)
+
+    def prefix(self, text):
+        """Species whose name or id starts with text, shortest first"""
+        node = self.trie
+        for char in normalize(text):
+            node = node.get(char)
+            if node is None:
+                return []
+        key_ids = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char is None:
+                    key_ids.extend(child)
+                else:
+                    stack.append(child)
+        key_ids.sort(key=lambda k: (len(self.keys[k][0]), self.keys[k][0]))
+        return self._unique(self.keys[k][1] for k in key_ids)
+
+    def fuzzy(self, text):
+        """[(similarity, species), ...] by trigram overlap, best first"""
+        grams = trigrams(normalize(text))
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.trigram_postings.get(gram, ()))
+        scored = []
+        for key_id, count in shared.items():
+            # Dice coefficient of the two trigram sets
+            similarity = 2 * count / (len(grams) + self.key_trigrams[key_id])
+            if similarity >= MIN_SIMILARITY:
+                scored.append((similarity, self.keys[key_id][0], key_id))
+        scored.sort(key=lambda s: (-s[0], s[1]))
+        seen = set()
+        results = []
+        for similarity, _, key_id in scored:
+            species = self.keys[key_id][1]
+            if id(species) not in seen:
+                seen.add(id(species))
+                results.append((similarity, species))
+        return results
+
+    def suggest(self, text, limit=5):
+        """Up to limit species for what the user typed, best match first"""
+        exact = self.index.find(text)
+        candidates = [exact] if exact else []
+        candidates += self.prefix(text)
+        candidates += [species for _, species in self.fuzzy(text)]
+        return self._unique(candidates)[:limit]
+
+    @staticmethod
+    def _unique(species_list):
+        seen = set()
+        unique = []
+        for species in species_list:
+            if id(species) not in seen:
+                seen.add(id(species))
+                unique.append(species)
+        return unique
+
+
+def parse_sr(text):
+    if "/" in text:
+        numerator, denominator = text.split("/")
+        if int(denominator) == 0:
+            raise ValueError(f"SR fraction '{text}' divides by zero")
+        return int(numerator) / int(denominator)
+    return float(text)
+
+
+def find_normalized(pokemon_index, text):
+    """Species whose name or id equals text once normalized, so mrmime finds Mr. Mime"""
+    species = pokemon_index.find(text)
+    if species:
+        return species
+    key = normalize(text)
+    return next((s for s in pokemon_index
+                 if key and key in (normalize(s.name), normalize(s.data.get("id", "")))), None)
+
+
+def filter_species(pokemon_index, query):
+    """Species matching every filter in query, in pokemon.json order
+
+    Filters are separated by spaces:
+      type:grass        has that type (repeat for dual types)
+      sr<=2             SR compared with <, <=, =, >= or > (fractions like 1/2 work)
+      line:bulbasaur    the whole evolution line of a species; names with spaces
+                        are written without them (line:mrmime or line:mr-mime)
+    Raises ValueError for a filter it does not understand.
+    """
+    filters = []
+    for token in query.lower().split():
+        if token.startswith("type:"):
+            type_name = token[len("type:"):]
+            filters.append(lambda s, t=type_name: t in s.types)
+        elif token.startswith("line:"):
+            species = find_normalized(pokemon_index, token[len("line:"):])
+            if not species:
+                raise ValueError(f"no species called '{token[len('line:'):]}'")
+            members = {id(s) for s in pokemon_index.evolution_line(species.name)}
+            filters.append(lambda s, m=members: id(s) in m)
+        else:
+            match = SR_FILTER.match(token)
+            if not match:
+                raise ValueError(f"unknown filter '{token}'")
+            compare, limit = SR_COMPARE[match.group(1)], parse_sr(match.group(2))
+            filters.append(lambda s, c=compare, v=limit: c(s.data.get("sr", 0), v))
+    if not filters:
+        raise ValueError("no filters given")
+    return [s for s in pokemon_index if all(f(s) for f in filters)]
+
+
+def is_filter_query(text):
+    """True when the input looks like filters rather than a species name"""
+    return any(token.startswith(("type:", "line:")) or SR_FILTER.match(token)
+               for token in text.lower().split())
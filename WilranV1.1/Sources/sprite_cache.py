@@ -0,0 +1,259 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from perf import timed
+
+
+# Fix for PyInstaller - get the directory where the executable is located
+if getattr(sys, 'frozen', False):
+    # Running as PyInstaller executable
+    SCRIPT_DIR = os.path.dirname(sys.executable)
+else:
+    # Running as Python script
+    SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CACHE_DIR = os.path.join(SCRIPT_DIR, "sprite_cache")
+INDEX_NAME = "index.json"
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+REQUEST_TIMEOUT = 10  # seconds
+# Downloads between index writes, so a crash forgets at most this many URLs
+FLUSH_EVERY = 25
+
+# Randomizer preview and tracker sidebar sizes, resized once when downloaded
+THUMBNAIL_SIZES = [(100, 100), (80, 80)]
+
+
+@timed("image.download")
+def download(url):
+    import requests
+
+    response = requests.get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.content
+
+
+class SpriteCache:
+    """Content-addressed sprite cache on disk with a byte budget and LRU eviction
+
+    Originals are stored under the SHA-1 of their bytes, next to their resized
+    thumbnails. index.json maps URLs to content hashes and records the size and
+    last use of every entry, so cached sprites are served with no network access.
+    Changes to the index stay in memory until flush(), which runs every
+    FLUSH_EVERY downloads, at the end of prewarm() and on the image loader's
+    shutdown. Sprites a crash left out of the index are indexed again on load,
+    so they still count against the byte budget.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.RLock()
+        self.dirty = False
+        self.unflushed = 0  # downloads since the last flush
+        self.urls = {}     # url -> content hash
+        self.entries = {}  # content hash -> {"size": bytes on disk, "used": last access}
+        self._load_index()
+
+    # ---------------- Index ----------------
+    def _index_path(self):
+        return os.path.join(self.cache_dir, INDEX_NAME)
+
+    def _load_index(self):
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as f:
+                index = json.load(f)
+            self.urls = index.get("urls", {})
+            self.entries = index.get("entries", {})
+        except (OSError, ValueError):
+            self.urls, self.entries = {}, {}
+        self._index_orphans()
+
+    def _index_orphans(self):
+        """Add sprites on disk but missing from the index, using their mtime as last use"""
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        found = False
+        for name in names:
+            digest, ext = os.path.splitext(name)
+            if ext != ".img" or digest in self.entries:
+                continue
+            paths = [p for p in self._entry_files(digest) if os.path.exists(p)]
+            self.entries[digest] = {"size": sum(os.path.getsize(p) for p in paths),
+                                    "used": os.path.getmtime(self._original_path(digest))}
+            found = True
+        if found:
+            self.dirty = True
+            self._evict()
+
+    def flush(self):
+        """Write the index if anything changed since the last flush"""
+        with self.lock:
+            if not self.dirty:
+                return
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self._index_path() + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"urls": self.urls, "entries": self.entries}, f)
+            os.replace(tmp_path, self._index_path())
+            self.dirty = False
+            self.unflushed = 0
+
+    def total_bytes(self):
+        with self.lock:
+            return sum(e["size"] for e in self.entries.values())
+
+    # ---------------- Files ----------------
+    def _original_path(self, digest):
+        return os.path.join(self.cache_dir, f"{digest}.img")
+
+    def _thumbnail_path(self, digest, size):
+        return os.path.join(self.cache_dir, f"{digest}_{size[0]}x{size[1]}.png")
+
+    def _entry_files(self, digest):
+        return [self._original_path(digest)] + [
+            self._thumbnail_path(digest, size) for size in THUMBNAIL_SIZES]
+
+    @staticmethod
+    def _write_atomic(path, write):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        write(tmp_path)
+        os.replace(tmp_path, path)
+
+    def _touch(self, digest):
+        with self.lock:
+            entry = self.entries.get(digest)
+            if entry:
+                entry["used"] = time.time()
+                self.dirty = True
+
+    def _store(self, url, data):
+        """Save downloaded bytes plus every thumbnail size, returning the content hash"""
+        from PIL import Image
+
+        digest = hashlib.sha1(data).hexdigest()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        original_path = self._original_path(digest)
+        if not os.path.exists(original_path):
+            def write_original(path):
+                with open(path, "wb") as f:
+                    f.write(data)
+            self._write_atomic(original_path, write_original)
+
+        pil_img = Image.open(BytesIO(data))
+        pil_img.load()
+        for size in THUMBNAIL_SIZES:
+            thumb_path = self._thumbnail_path(digest, size)
+            if not os.path.exists(thumb_path):
+                thumb = pil_img.resize(size, Image.Resampling.LANCZOS)
+                self._write_atomic(
+                    thumb_path, lambda path: thumb.save(path, format="PNG"))
+
+        size_on_disk = sum(os.path.getsize(p)
+                           for p in self._entry_files(digest) if os.path.exists(p))
+        with self.lock:
+            self.urls[url] = digest
+            self.entries[digest] = {"size": size_on_disk, "used": time.time()}
+            self.dirty = True
+            self._evict()
+            self.unflushed += 1
+            if self.unflushed >= FLUSH_EVERY:
+                self.flush()
+        return digest
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits its byte budget"""
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return
+        for digest, entry in sorted(self.entries.items(), key=lambda item: item[1]["used"]):
+            if total <= self.max_bytes:
+                break
+            for path in self._entry_files(digest):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= entry["size"]
+            del self.entries[digest]
+        self.urls = {u: d for u, d in self.urls.items() if d in self.entries}
+        self.dirty = True
+
+    # ---------------- Public ----------------
+    def cached_digest(self, url):
+        """Content hash for a URL if its files are still on disk, else None"""
+        with self.lock:
+            digest = self.urls.get(url)
+        if digest and os.path.exists(self._original_path(digest)):
+            return digest
+        return None
+
+    @timed("image.thumbnail")
+    def get_thumbnail(self, url, size):
+        """PIL image of url at size, downloading only if it isn't cached yet"""
+        from PIL import Image
+
+        digest = self.cached_digest(url) or self._store(url, download(url))
+        self._touch(digest)
+
+        thumb_path = self._thumbnail_path(digest, size)
+        if os.path.exists(thumb_path):
+            pil_img = Image.open(thumb_path)
+            pil_img.load()
+            return pil_img
+
+        # A size that isn't pre-resized - resize from the original
+        pil_img = Image.open(self._original_path(digest))
+        pil_img.load()
+        return pil_img.resize(size, Image.Resampling.LANCZOS)
+
+    def prewarm(self, urls, max_workers=8):
+        """Download every URL not cached yet, returning (cached, failed) counts"""
+        urls = list(dict.fromkeys(url for url in urls if url))
+        missing = [url for url in urls if not self.cached_digest(url)]
+
+        def fetch(url):
+            try:
+                self._store(url, download(url))
+                return True
+            except Exception:
+                return False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch, missing))
+        self.flush()
+        failed = results.count(False)
+        return len(urls) - failed, failed
+
+
+def area_sprite_urls(areas, pokemon_index):
+    """Normal and shiny sprite URLs of every species referenced in areas.json"""
+    urls = []
+    for area in areas.values():
+        for entry in area.get("pokemon", []):
+            pokemon = pokemon_index.get(entry["name"])
+            if pokemon:
+                media = pokemon.get("media", {})
+                urls.extend(u for u in (media.get("main"), media.get("mainShiny")) if u)
+    return list(dict.fromkeys(urls))
+
+
+if __name__ == "__main__":
+    from area_store import load_areas
+    from data_bundle import load_game_data
+    from pokemon_index import PokemonIndex
+
+    # Includes areas still only in the change log
+    urls = area_sprite_urls(load_areas(), PokemonIndex(
+        load_game_data(SCRIPT_DIR)["pokemon"]))
+    cache = SpriteCache()
+    cached, failed = cache.prewarm(urls)
+    print(f"💾 {cached} sprites cached in {cache.cache_dir} "
+          f"({cache.total_bytes() // 1024} KB), {failed} failed")
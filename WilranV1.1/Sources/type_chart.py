@@ -0,0 +1,119 @@
+from itertools import combinations_with_replacement
+
+# Optional - only the batch matchup API needs it, so it is imported on first
+# use rather than adding its import time to every start of the app
+np = None
+
+
+def _numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise RuntimeError("Batch type matchups need NumPy (pip install numpy)") from None
+        np = numpy
+    return np
+
+
+class DefensiveProfile:
+    """Damage multiplier of every attack type against one single or dual typing"""
+
+    __slots__ = ("types", "multipliers", "vulnerabilities",
+                 "resistances", "immunities")
+
+    def __init__(self, types, type_names, multipliers):
+        self.types = types
+        self.multipliers = multipliers
+        self.vulnerabilities = tuple(sorted(
+            t for t, m in zip(type_names, multipliers) if m > 1))
+        self.resistances = tuple(sorted(
+            t for t, m in zip(type_names, multipliers) if 0 < m < 1))
+        self.immunities = tuple(sorted(
+            t for t, m in zip(type_names, multipliers) if m == 0))
+
+
+class TypeChart:
+    """typechart.json as a dense matrix indexed by integer type codes
+
+    matrix[attack][defend] is the multiplier of one attack type against one
+    defending type. Every single and dual-type profile (18 + 153 = 171) is
+    built up front, so looking one up is a dict access.
+    """
+
+    def __init__(self, chart):
+        # chart is keyed defending type -> attacking type -> multiplier
+        self.type_names = tuple(chart)
+        self.codes = {name: code for code, name in enumerate(self.type_names)}
+        self.matrix = tuple(
+            tuple(float(chart[defend][attack]) for defend in self.type_names)
+            for attack in self.type_names)
+
+        self.profiles = {}
+        for key in combinations_with_replacement(range(len(self.type_names)), 2):
+            multipliers = tuple(
+                self.matrix[attack][key[0]] *
+                (self.matrix[attack][key[1]] if key[1] != key[0] else 1.0)
+                for attack in range(len(self.type_names)))
+            types = tuple(self.type_names[c] for c in dict.fromkeys(key))
+            self.profiles[key] = DefensiveProfile(
+                types, self.type_names, multipliers)
+        self.profile_keys = list(self.profiles)
+        self._profile_array = None
+
+    def __contains__(self, type_name):
+        return type_name in self.codes
+
+    def code(self, type_name):
+        return self.codes[type_name.lower()]
+
+    def profile_key(self, types):
+        """Sorted code pair for one or two type names; a single type is (c, c)"""
+        codes = sorted(self.code(t) for t in types)
+        if not codes or len(codes) > 2:
+            raise ValueError("A Pokémon has 1 or 2 types")
+        return (codes[0], codes[-1])
+
+    def profile(self, types):
+        return self.profiles[self.profile_key(types)]
+
+    def multiplier(self, attack_type, defender_types):
+        return self.profile(defender_types).multipliers[self.code(attack_type)]
+
+    def best_attack(self, attack_types, defender_types):
+        """(index, multiplier) of the most effective attack type, or None if there are none"""
+        multipliers = self.profile(defender_types).multipliers
+        best = None
+        for index, attack_type in enumerate(attack_types):
+            if attack_type in self.codes:
+                multiplier = multipliers[self.codes[attack_type]]
+                if best is None or multiplier > best[1]:
+                    best = (index, multiplier)
+        return best
+
+    # ---------------- Batch (NumPy) ----------------
+    def profile_array(self):
+        """(171, 18) array - one row of attack multipliers per profile_keys entry"""
+        np = _numpy()
+        if self._profile_array is None:
+            self._profile_array = np.array(
+                [self.profiles[key].multipliers for key in self.profile_keys])
+        return self._profile_array
+
+    def matchups(self, attack_types, defenders):
+        """(len(attack_types), len(defenders)) array of multipliers
+
+        defenders is a list of type lists; unknown attack types count as neutral.
+        """
+        np = _numpy()
+        profiles = self.profile_array()
+        rows = {key: i for i, key in enumerate(self.profile_keys)}
+        defender_rows = np.array(
+            [rows[self.profile_key(types)] for types in defenders], dtype=np.intp)
+        table = np.ones((len(attack_types), len(defenders)))
+        known = [i for i, t in enumerate(attack_types) if t in self.codes]
+        if known:
+            attack_codes = np.array(
+                [self.codes[attack_types[i]] for i in known], dtype=np.intp)
+            table[known] = profiles[np.ix_(defender_rows, attack_codes)].T
+        return table
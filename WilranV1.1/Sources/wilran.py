@@ -1,826 +1,65 @@
-import json
-import os
-import random
+import time
+
+# Time-to-first-window is measured from here, before the heavier imports
+STARTED = time.perf_counter()
+
 import copy
-import re
+import multiprocessing
+import random
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 from tkinter import messagebox
-import requests
-from PIL import Image, ImageTk
-from io import BytesIO
-
-
-if getattr(sys, 'frozen', False):
-    # Running as PyInstaller executable
-    SCRIPT_DIR = os.path.dirname(sys.executable)
-else:
-    # Running as Python script
-    SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-
-
-AREA_FILE = os.path.join(SCRIPT_DIR, "areas.json")
-POKEMON_FILE = os.path.join(SCRIPT_DIR, "pokemon.json")
-TYPECHART_FILE = os.path.join(SCRIPT_DIR, "typechart.json")
-ABILITIES_FILE = os.path.join(SCRIPT_DIR, "abilities.json")
-MOVES_FILE = os.path.join(SCRIPT_DIR, "moves.json")
-HELDITEMS_FILE = os.path.join(SCRIPT_DIR, "helditems.json")
-
-
-# ---------------- NATURE TABLE ----------------
-natures_table = [
-    {"name": "Hardy", "increase": None,
-        "decrease": None, "range": range(1, 5)},
-    {"name": "Lonely", "increase": "str",
-        "decrease": "con", "range": range(5, 9)},
-    {"name": "Brave", "increase": "str",
-        "decrease": "dex", "range": range(9, 13)},
-    {"name": "Adamant", "increase": "str",
-        "decrease": "wis", "range": range(13, 17)},
-    {"name": "Naughty", "increase": "str",
-        "decrease": "cha", "range": range(17, 21)},
-    {"name": "Bold", "increase": "con",
-        "decrease": "str", "range": range(21, 25)},
-    {"name": "Docile", "increase": None,
-        "decrease": None, "range": range(25, 29)},
-    {"name": "Relaxed", "increase": "con",
-        "decrease": "dex", "range": range(29, 33)},
-    {"name": "Impish", "increase": "con",
-        "decrease": "wis", "range": range(33, 37)},
-    {"name": "Lax", "increase": "con",
-        "decrease": "cha", "range": range(37, 41)},
-    {"name": "Timid", "increase": "dex",
-        "decrease": "str", "range": range(41, 45)},
-    {"name": "Hasty", "increase": "dex",
-        "decrease": "con", "range": range(45, 49)},
-    {"name": "Serious", "increase": None,
-        "decrease": None, "range": range(49, 53)},
-    {"name": "Jolly", "increase": "dex",
-        "decrease": "wis", "range": range(53, 57)},
-    {"name": "Naive", "increase": "dex",
-        "decrease": "cha", "range": range(57, 61)},
-    {"name": "Modest", "increase": "wis",
-        "decrease": "str", "range": range(61, 65)},
-    {"name": "Mild", "increase": "wis",
-        "decrease": "con", "range": range(65, 69)},
-    {"name": "Quiet", "increase": "wis",
-        "decrease": "dex", "range": range(69, 73)},
-    {"name": "Bashful", "increase": None,
-        "decrease": None, "range": range(73, 77)},
-    {"name": "Rash", "increase": "wis",
-        "decrease": "cha", "range": range(77, 81)},
-    {"name": "Calm", "increase": "cha",
-        "decrease": "str", "range": range(81, 85)},
-    {"name": "Gentle", "increase": "cha",
-        "decrease": "con", "range": range(85, 89)},
-    {"name": "Sassy", "increase": "cha",
-        "decrease": "dex", "range": range(89, 93)},
-    {"name": "Careful", "increase": "cha",
-        "decrease": "wis", "range": range(93, 97)},
-    {"name": "Quirky", "increase": None,
-        "decrease": None, "range": range(97, 101)},
-]
-
-# ---------------- JSON LOAD ----------------
-
-
-def load_json(file_path):
-    if not os.path.exists(file_path):
-        print(f"❌ {file_path} not found!")
-        return {}
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-# ---------------- TYPE CLASS ----------------
-POKEMON_TYPE_CHART = load_json(TYPECHART_FILE)
-POKEMON_TYPES = list(POKEMON_TYPE_CHART.keys())
-
-# ---------------- ABILITIES LOAD ----------------
-ABILITIES_DATA = load_json(ABILITIES_FILE).get("items", [])
-ABILITY_LOOKUP = {a["id"]: a for a in ABILITIES_DATA}
-
-# ---------------- MOVES LOAD ----------------
-MOVES_DATA = load_json(MOVES_FILE).get("moves", [])
-MOVE_LOOKUP = {m["id"]: m for m in MOVES_DATA}
-
-
-def roll_dice(dice_str):
-    match = re.match(r"(\d+)d(\d+)", dice_str)
-    if not match:
-        return int(dice_str)  # fallback if just a number
-    n, m = map(int, match.groups())
-    return sum(random.randint(1, m) for _ in range(n))
-
-
-def parse_damage_from_description(description_text, move_data):
-    """Extract damage dice and type from move description"""
-    # Patterns for moves WITH ability modifier (+ MOVE)
-    move_modifier_patterns = [
-        r'(\d+d\d+(?:\s*\+\s*\d+)?)\s*\+?\s*MOVE\s+(\w+)\s+damage',
-        r'(\d+d\d+)\s*\+?\s*MOVE\s+(\w+)\s+damage',
-        r'takes\s+(\d+d\d+(?:\s*\+\s*\d+)?)\s*\+?\s*MOVE\s+(\w+)\s+damage',
-        r'deals?\s+(\d+d\d+(?:\s*\+\s*\d+)?)\s*\+?\s*MOVE\s+(\w+)\s+damage'
-    ]
-
-    # First, try to match patterns with MOVE modifier
-    for pattern in move_modifier_patterns:
-        match = re.search(pattern, description_text, re.IGNORECASE)
-        if match:
-            dice_str = match.group(1).strip()
-            damage_type = match.group(2).strip().lower()
-            return dice_str, damage_type  # Will include ability mod
-
-    # If no MOVE found, try patterns for flat damage (no ability modifier)
-    flat_damage_patterns = [
-        r'doing\s+(\d+d\d+)\s+(\w+)\s+damage',
-        r'takes\s+(\d+d\d+)\s+(\w+)\s+damage',
-        r'deals?\s+(\d+d\d+)\s+(\w+)\s+damage',
-        r'(\d+d\d+)\s+(\w+)\s+damage'
-    ]
-
-    for pattern in flat_damage_patterns:
-        match = re.search(pattern, description_text, re.IGNORECASE)
-        if match:
-            dice_str = match.group(1).strip()
-            damage_type = match.group(2).strip().lower()
-            return dice_str, damage_type  # Will NOT include ability mod
-
-    return None, None
-
-
-def get_scaled_damage_dice(move_data, pokemon_level):
-    """Apply higher level damage scaling if applicable"""
-    higher_levels = move_data.get("higherLevels", "")
-    if not higher_levels:
-        return None
-
-    # Parse higher levels text for damage scaling
-    # Example: "The damage dice roll for this move changes to 2d4 at level 5, 1d12 at level 10, and 4d4 at level 17."
-    level_patterns = [
-        (r'(\d+d\d+) at level (\d+)', lambda m: (m.group(1), int(m.group(2))))
-    ]
-
-    scalings = []
-    for pattern, parser in level_patterns:
-        for match in re.finditer(pattern, higher_levels):
-            dice, level = parser(match)
-            scalings.append((level, dice))
-
-    # Sort by level and find the highest applicable scaling
-    scalings.sort(reverse=True)  # Highest level first
-    for level_req, dice in scalings:
-        if pokemon_level >= level_req:
-            return dice
-
-    return None
-
-
-def calculate_move_damage(pokemon, move_data, ability_mod=0, is_crit=False):
-    """Calculate damage for a move including ability modifier, level scaling, critical hits, and STAB"""
-    # Get description text
-    description_text = ""
-    for d in move_data.get("description", []):
-        if isinstance(d, str):
-            description_text += d.lower() + " "
-
-    has_move_modifier = bool(
-        re.search(r'\+?\s*MOVE\s+\w+\s+damage', description_text, re.IGNORECASE))
-
-    # Parse base damage from description
-    base_dice_str, damage_type = parse_damage_from_description(
-        description_text, move_data)
-
-    if not base_dice_str:
-        return None, None, None, None, False, 0
-
-    # Check for level-based scaling and use the best available dice
-    pokemon_level = pokemon.get("level", 1)
-    scaled_dice = get_scaled_damage_dice(move_data, pokemon_level)
-
-    # Use scaled dice if available, otherwise use base dice
-    dice_str = scaled_dice if scaled_dice else base_dice_str
-
-    # Roll the damage dice
-    base_damage = roll_dice(dice_str)
-
-    # Handle critical hits - roll damage dice again and add
-    crit_damage = 0
-    if is_crit:
-        crit_damage = roll_dice(dice_str)
-        total_dice_damage = base_damage + crit_damage
-    else:
-        total_dice_damage = base_damage
-
-    # Calculate STAB bonus - ALWAYS check for type matching
-    stab_bonus = 0
-    move_type = move_data.get("type", "").lower()
-    pokemon_types = pokemon.get("types", "").lower().split("/")
-    pokemon_types = [t.strip() for t in pokemon_types]
-
-    if move_type in pokemon_types:
-        # STAB applies differently based on whether move uses modifiers
-        if has_move_modifier:
-            stab_bonus = ability_mod  # STAB doubles the Move Power Mod
-        else:
-            # For flat damage moves, STAB still adds the ability modifier once
-            stab_bonus = ability_mod
-
-    # Add ability modifier and STAB bonus
-    if has_move_modifier:
-        total_damage = total_dice_damage + ability_mod + stab_bonus
-    else:
-        total_damage = total_dice_damage + stab_bonus  # Only STAB, no base modifier
-
-    # Return all components including crit info and STAB
-    return base_damage, total_damage, damage_type, dice_str, crit_damage, stab_bonus
-
-
-def attack_roll(pokemon, move_id):
-    move_data = MOVE_LOOKUP.get(move_id)
-    if not move_data:
-        return "Move not found", None
-
-    # Parse ability scores
-    ability_scores = {}
-    for line in pokemon["ability_scores"].split("\n"):
-        parts = line.split(":")
-        if len(parts) >= 2:
-            ab = parts[0].strip().lower()
-            val_match = re.search(r"\d+", parts[1])
-            val = int(val_match.group()) if val_match else 10
-            ability_scores[ab] = val
-
-    # Determine best ability modifier - handle status moves properly
-    chosen_ability = None
-    highest_mod = 0
-    power_abilities = move_data.get("power")
-
-    # Handle different power types
-    if power_abilities == "none" or power_abilities is None:
-        # Status move - no ability modifier needed
-        highest_mod = 0
-        chosen_ability = None
-    elif isinstance(power_abilities, list) and power_abilities:
-        # Attack move - find best ability modifier
-        best_mod = float('-inf')  # Start with very low value
-        for ability in power_abilities:
-            score = ability_scores.get(ability, 10)
-            mod = ability_modifier(score)
-            if mod > best_mod:
-                best_mod = mod
-                chosen_ability = ability
-
-        # Set the highest modifier (could be negative)
-        highest_mod = best_mod if best_mod != float('-inf') else 0
-    else:
-        # Fallback for other power types
-        highest_mod = 0
-        chosen_ability = None
-
-    prof = pokemon.get("proficiency_bonus", 0)
-
-    # Get description for save detection
-    description_text = ""
-    for d in move_data.get("description", []):
-        if isinstance(d, str):
-            description_text += d.lower() + " "
-
-    # Check if move uses MOVE modifier
-    has_move_modifier = bool(
-        re.search(r'\+?\s*MOVE\s+\w+\s+damage', description_text, re.IGNORECASE))
-
-    # Detect saving throw type from description
-    save_type = None
-    if "save" in description_text:
-        # Look for patterns like "STR save", "DEX save", etc.
-        save_patterns = [
-            r'\b(str|strength)\s+save',
-            r'\b(dex|dexterity)\s+save',
-            r'\b(con|constitution)\s+save',
-            r'\b(int|intelligence)\s+save',
-            r'\b(wis|wisdom)\s+save',
-            r'\b(cha|charisma)\s+save'
-        ]
-
-        for pattern in save_patterns:
-            match = re.search(pattern, description_text, re.IGNORECASE)
-            if match:
-                save_ability = match.group(1).lower()
-                if save_ability in ['str', 'strength']:
-                    save_type = 'STR'
-                elif save_ability in ['dex', 'dexterity']:
-                    save_type = 'DEX'
-                elif save_ability in ['con', 'constitution']:
-                    save_type = 'CON'
-                elif save_ability in ['int', 'intelligence']:
-                    save_type = 'INT'
-                elif save_ability in ['wis', 'wisdom']:
-                    save_type = 'WIS'
-                elif save_ability in ['cha', 'charisma']:
-                    save_type = 'CHA'
-                break
-
-    # Check if move has both attack roll and save (like Vice Grip)
-    has_save = "save" in description_text
-    has_attack = isinstance(
-        power_abilities, list) and power_abilities and ("make a melee attack" in description_text or "make a ranged attack" in description_text or "make an attack" in description_text)
-
-# Only roll d20 and check for crit if the move involves an attack roll
-    d20_roll = None
-    is_crit = False
-    if has_attack:
-        d20_roll = random.randint(1, 20)
-        is_crit = (d20_roll == 20)
-    else:
-        # For non-attack moves, set d20_roll to 0 so math works
-        d20_roll = 0
-
-    # Calculate damage
-    damage_calc = calculate_move_damage(
-        pokemon, move_data, highest_mod, is_crit
-    )
-
-    if damage_calc[0] is not None:
-        base_damage, total_damage, damage_type, dice_str, crit_damage, stab_bonus = damage_calc
-    else:
-        base_damage = total_damage = damage_type = dice_str = crit_damage = stab_bonus = None
-
-    # Format results - handle moves with both mechanics
-    if has_attack and has_save:
-        # Moves like Vice Grip that have both attack and save
-        total = d20_roll + highest_mod + prof
-        ability_name = chosen_ability.upper() if chosen_ability else "N/A"
-
-        if is_crit:
-            attack_result = f"{total} [d20: {d20_roll} + {highest_mod} {ability_name} + {prof} prof] CRITICAL HIT!"
-        else:
-            attack_result = f"{total} [d20: {d20_roll} + {highest_mod} {ability_name} + {prof} prof]"
-
-        # Add save DC info
-        save_dc = 8 + highest_mod + prof
-        if save_type:
-            attack_result += f" | Save DC: {save_dc} ({save_type})"
-        else:
-            attack_result += f" | Save DC: {save_dc}"
-
-        if base_damage is not None:
-            if is_crit and crit_damage > 0:
-                if has_move_modifier and stab_bonus > 0:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [CRITICAL! {dice_str}: {base_damage} + {dice_str}: {crit_damage} + {highest_mod} {ability_name} + {stab_bonus} STAB]"
-                elif has_move_modifier:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [CRITICAL! {dice_str}: {base_damage} + {dice_str}: {crit_damage} + {highest_mod} {ability_name}]"
-                elif stab_bonus > 0:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [CRITICAL! {dice_str}: {base_damage} + {dice_str}: {crit_damage} + {stab_bonus} STAB]"
-                else:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [CRITICAL! {dice_str}: {base_damage} + {dice_str}: {crit_damage}]"
-            else:
-                if has_move_modifier and stab_bonus > 0:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [{dice_str}: {base_damage} + {highest_mod} {ability_name} + {stab_bonus} STAB]"
-                elif has_move_modifier:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [{dice_str}: {base_damage} + {highest_mod} {ability_name}]"
-                elif stab_bonus > 0:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [{dice_str}: {base_damage} + {stab_bonus} STAB]"
-                else:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [{dice_str}: {base_damage}]"
-        else:
-            damage_result = None
-
-    elif has_save and not has_attack:
-        # Save-only moves - no attack roll, no crit
-        total = 8 + highest_mod + prof
-        ability_name = chosen_ability.upper() if chosen_ability else "N/A"
-
-        if save_type:
-            attack_result = f"Saving Throw DC: {total} ({save_type}) [8 + {highest_mod} {ability_name} + {prof} prof]"
-        else:
-            attack_result = f"Saving Throw DC: {total} [8 + {highest_mod} {ability_name} + {prof} prof]"
-
-        # Damage for save-only moves - no crit possible
-        if base_damage is not None:
-            if has_move_modifier and stab_bonus > 0:
-                damage_result = f"Damage on failed save: {total_damage} {damage_type} [{dice_str}: {base_damage} + {highest_mod} {ability_name} + {stab_bonus} STAB]"
-            elif has_move_modifier:
-                damage_result = f"Damage on failed save: {total_damage} {damage_type} [{dice_str}: {base_damage} + {highest_mod} {ability_name}]"
-            elif stab_bonus > 0:
-                damage_result = f"Damage on failed save: {total_damage} {damage_type} [{dice_str}: {base_damage} + {stab_bonus} STAB]"
-            else:
-                damage_result = f"Damage on failed save: {total_damage} {damage_type} [{dice_str}: {base_damage}]"
-        else:
-            damage_result = None
-
-    elif isinstance(power_abilities, list) and power_abilities:
-        # Attack-only moves
-        total = d20_roll + highest_mod + prof
-        ability_name = chosen_ability.upper() if chosen_ability else "N/A"
-
-        if is_crit:
-            attack_result = f"{total} [d20: {d20_roll} + {highest_mod} {ability_name} + {prof} prof] CRITICAL HIT!"
-        else:
-            attack_result = f"{total} [d20: {d20_roll} + {highest_mod} {ability_name} + {prof} prof]"
-
-        if base_damage is not None:
-            if is_crit and crit_damage > 0:
-                if has_move_modifier and stab_bonus > 0:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [CRITICAL! {dice_str}: {base_damage} + {dice_str}: {crit_damage} + {highest_mod} {ability_name} + {stab_bonus} STAB]"
-                elif has_move_modifier:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [CRITICAL! {dice_str}: {base_damage} + {dice_str}: {crit_damage} + {highest_mod} {ability_name}]"
-                elif stab_bonus > 0:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [CRITICAL! {dice_str}: {base_damage} + {dice_str}: {crit_damage} + {stab_bonus} STAB]"
-                else:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [CRITICAL! {dice_str}: {base_damage} + {dice_str}: {crit_damage}]"
-            else:
-                if has_move_modifier and stab_bonus > 0:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [{dice_str}: {base_damage} + {highest_mod} {ability_name} + {stab_bonus} STAB]"
-                elif has_move_modifier:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [{dice_str}: {base_damage} + {highest_mod} {ability_name}]"
-                elif stab_bonus > 0:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [{dice_str}: {base_damage} + {stab_bonus} STAB]"
-                else:
-                    damage_result = f"Damage on hit: {total_damage} {damage_type} [{dice_str}: {base_damage}]"
-        else:
-            damage_result = None
-    else:
-        attack_result = "See move description"
-        damage_result = None
-
-    return attack_result, damage_result
-
-
-def format_message(pokemon_name, move_name, attack_result, damage_result=None):
-    """Format battle log messages in Roll20 style"""
-
-    # Start with the move announcement
-    message_parts = [f"{pokemon_name} uses {move_name}!"]
-    message_parts.append("")  # Empty line for spacing
-
-    # Parse attack roll information
-    if "Saving Throw DC:" in attack_result:
-        # Extract DC, save type, and breakdown - updated regex to handle save type
-        dc_match = re.search(
-            r"Saving Throw DC: (\d+)(?: \((\w+)\))? \[(.*?)\]", attack_result)
-        if dc_match:
-            dc_value = dc_match.group(1)
-            save_type = dc_match.group(2)  # This could be None if no save type
-            breakdown = dc_match.group(3)
-
-            if save_type:
-                message_parts.append(
-                    f"Spell Save DC: {dc_value} ({save_type})")
-            else:
-                message_parts.append(f"Spell Save DC: {dc_value}")
-            message_parts.append(f"  └ {breakdown}")
-    elif "CRITICAL HIT!" in attack_result:
-        # Extract attack roll with crit
-        attack_match = re.search(
-            r"(\d+) \[(.*?)\] CRITICAL HIT!", attack_result)
-        if attack_match:
-            total = attack_match.group(1)
-            breakdown = attack_match.group(2)
-            message_parts.append(f"Attack Roll: {total} (CRITICAL HIT!)")
-            message_parts.append(f"  └ {breakdown}")
-    elif re.search(r"^\d+", attack_result):
-        # Regular attack roll
-        attack_match = re.search(r"(\d+) \[(.*?)\]", attack_result)
-        if attack_match:
-            total = attack_match.group(1)
-            breakdown = attack_match.group(2)
-            message_parts.append(f"Attack Roll: {total}")
-            message_parts.append(f"  └ {breakdown}")
-    else:
-        # Other cases (like "See move description")
-        message_parts.append(f"Result: {attack_result}")
-
-    # Parse damage information if present
-    if damage_result:
-        if "CRITICAL!" in damage_result:
-            # Critical damage parsing
-            damage_match = re.search(
-                r"Damage on (?:hit|failed save): (\d+) (\w+) \[CRITICAL! (.*?)\]", damage_result)
-            if damage_match:
-                total_damage = damage_match.group(1)
-                damage_type = damage_match.group(2)
-                breakdown = damage_match.group(3)
-                message_parts.append(
-                    f"Damage: {total_damage} {damage_type} (CRITICAL!)")
-                message_parts.append(f"  └ {breakdown}")
-        else:
-            # Regular damage parsing
-            damage_match = re.search(
-                r"Damage on (?:hit|failed save): (\d+) (\w+) \[(.*?)\]", damage_result)
-            if damage_match:
-                total_damage = damage_match.group(1)
-                damage_type = damage_match.group(2)
-                breakdown = damage_match.group(3)
-                message_parts.append(f"Damage: {total_damage} {damage_type}")
-                message_parts.append(f"  └ {breakdown}")
-
-    return "\n".join(message_parts)
-
-
-class PokemonType:
-    def __init__(self, types: list[str]):
-        if not types or len(types) > 2:
-            raise ValueError("PokemonType must have 1 or 2 types")
-        for t in types:
-            if t not in POKEMON_TYPE_CHART:
-                raise ValueError(f"Invalid Pokémon type: {t}")
-        self.types = types
-
-    def defensive_multipliers(self) -> dict[str, float]:
-        multipliers = {}
-        for attack_type in POKEMON_TYPES:
-            multiplier = 1.0
-            for t in self.types:
-                multiplier *= POKEMON_TYPE_CHART[t][attack_type]
-            multipliers[attack_type] = multiplier
-        return multipliers
-
-    def vulnerabilities(self) -> list[str]:
-        return sorted([t for t, m in self.defensive_multipliers().items() if m > 1])
-
-    def resistances(self) -> list[str]:
-        return sorted([t for t, m in self.defensive_multipliers().items() if 0 < m < 1])
-
-    def immunities(self) -> list[str]:
-        imm = sorted(
-            [t for t, m in self.defensive_multipliers().items() if m == 0])
-        return imm if imm else ["None"]
-
-# ---------------- AREA CHOICE ----------------
-
-
-def choose_area(areas):
-    if not areas:
-        print("❌ No areas available.")
-        return None
-    print("\nAvailable areas:")
-    for area_name in areas.keys():
-        print(f"- {area_name}")
-    while True:
-        choice = input("Type the area name: ").strip()
-        area_key = next(
-            (name for name in areas if name.lower() == choice.lower()), None)
-        if area_key:
-            return areas[area_key]
-        else:
-            print("❌ Area not found. Try again.")
-
-# ---------------- NATURE APPLY ----------------
-
-
-def apply_nature(attributes):
-    nature_roll = random.randint(1, 100)
-    nature = next(nt for nt in natures_table if nature_roll in nt["range"])
-    modified_attributes = attributes.copy()
-    incr_text = decr_text = ""
-    if nature["increase"]:
-        modified_attributes[nature["increase"]] += 1
-        incr_text = f"+1 {nature['increase'].capitalize()}"
-    if nature["decrease"]:
-        modified_attributes[nature["decrease"]] -= 1
-        decr_text = f"-1 {nature['decrease'].capitalize()}"
-    if incr_text or decr_text:
-        nature_text = f"{nature['name']} ({incr_text}{', ' if incr_text and decr_text else ''}{decr_text})"
-    else:
-        nature_text = nature['name']
-    return nature["name"], modified_attributes, nature_text
-
-# ---------------- ABILITY MODIFIER ----------------
-
-
-def ability_modifier(score):
-    return (score - 10) // 2
-
-# ---------------- PROFICIENCY BONUS ----------------
-
-
-def proficiency_bonus(level):
-    if 1 <= level <= 4:
-        return 2
-    elif 5 <= level <= 8:
-        return 3
-    elif 9 <= level <= 12:
-        return 4
-    elif 13 <= level <= 16:
-        return 5
-    else:  # 17+
-        return 6
-
-
-# ---------------- HIT DICE ----------------
-hit_dice_bonus = {
-    "d4": 3,
-    "d6": 4,
-    "d8": 5,
-    "d10": 6,
-    "d12": 7,
-    "d20": 11
-}
-
-# ---------------- ASI LOGIC ----------------
-ASI_BREAKPOINTS = [4, 8, 12, 16]
-
-
-def apply_asi(full_pokemon, attributes: dict, level: int) -> dict:
-    import random
-
-    modified_attributes = attributes.copy()
-
-    # Determine ASIs per breakpoint
-    evo = full_pokemon.get("evolution")
-    max_stage = int(evo.get("maxStage")) if evo and "maxStage" in evo else 1
-    asi_per_bp = 4 if max_stage == 1 else 3 if max_stage == 2 else 2
-
-    pokemon_min_level = full_pokemon.get("minLevel", 1)
-    # Breakpoints strictly above minLevel and <= current level
-    valid_bps = [bp for bp in ASI_BREAKPOINTS if bp >
-                 pokemon_min_level and bp <= level]
-    total_asi = asi_per_bp * len(valid_bps)
-
-    stats = list(modified_attributes.keys())
-
-    for _ in range(total_asi):
-        # pick a random stat that is not capped at 20
-        uncapped_stats = [s for s in stats if modified_attributes[s] < 20]
-        if not uncapped_stats:
-            break  # all stats capped
-        choice = random.choice(uncapped_stats)
-        modified_attributes[choice] += 1
-
-    return modified_attributes
-
-
-# ---------------- FORMAT LIST ----------------
-
 
-def format_list(lst):
-    return ", ".join(f"{i['type'].capitalize()} {i['value']}ft" if isinstance(i, dict) else str(i) for i in lst)
-
-# ---------------- PICK RANDOM POKEMON ----------------
-
-
-def pick_random_pokemon(area, all_pokemon_data):
-    if not area.get("pokemon"):
-        print("❌ This area has no Pokémon!")
-        return None
-
-    p = random.choice(area["pokemon"])
-    level = random.randint(p["min_level"], p["max_level"])
-    full_pokemon = next(
-        (pk for pk in all_pokemon_data if pk["name"].lower() == p["name"].lower()), None)
-
-    # ------------------ SHINY CHECK ------------------
-    is_shiny = random.randint(1, 100) == 1
-    display_name = p['name'].upper()
-
-    image_url = ""
-    if full_pokemon:
-        if is_shiny:
-            image_url = full_pokemon["media"].get("mainShiny", "")
-        else:
-            image_url = full_pokemon["media"].get("main", "")
-
-    # Defaults
-    gender_text = types_text = size_text = ac_text = speed_text = senses_text = hp_text = ability_scores_text = nature_text = "Unknown"
-    skills_text = saving_throws_text = ""
-    prof_bonus = proficiency_bonus(level)
-    vulnerabilities = resistances = immunities = []
-
-# ---------------- Held Item Check ----------------
-    if random.randint(1, 4) == 1:  # 25% chance
-        held_items = load_json(HELDITEMS_FILE).get("items", [])
-        if held_items:
-            held_item_text = random.choice(held_items)
-        else:
-            held_item_text = "None"
-    else:
-        held_item_text = "None"
-
-    if full_pokemon:
-        # Gender
-        gender_info = full_pokemon.get("gender", "Unknown")
-        if gender_info.lower() == "genderless" or gender_info == "0:0":
-            gender_text = "Genderless"
-        elif ":" in gender_info:
-            female_ratio, male_ratio = map(int, gender_info.split(":"))
-            gender_text = random.choices(
-                ["Female", "Male"], weights=[female_ratio, male_ratio], k=1
-            )[0] if female_ratio + male_ratio > 0 else "Genderless"
-
-        # Types, size, AC, HP, speed, senses
-        types_list = full_pokemon.get("type", [])
-        types_text = "/".join([t.capitalize()
-                              for t in types_list]) or "Unknown"
-        size_text = full_pokemon.get("size", "Unknown").capitalize()
-        ac_text = full_pokemon.get("ac", "Unknown")
-        hp_text = full_pokemon.get("hp", "Unknown")
-        speed_text = format_list(full_pokemon.get("speed", []))
-        senses_text = format_list(full_pokemon.get("senses", []))
-
-        # Type calculations
-        pokemon_type = PokemonType(types_list)
-        vulnerabilities = pokemon_type.vulnerabilities()
-        resistances = pokemon_type.resistances()
-        immunities = pokemon_type.immunities()
-
-        # ---------------- Ability Scores ----------------
-        base_attributes = full_pokemon.get("attributes", {}).copy()
-
-        # Apply nature first
-        _, nature_modified_attributes, nature_text = apply_nature(
-            base_attributes)
-
-        # Then apply ASIs on top of nature-modified stats
-        modified_attributes = apply_asi(
-            full_pokemon, nature_modified_attributes, level)
-
-        # Format ability scores text
-        ability_scores_text = "\n".join(
-            f"{k.upper()}: {v} ({'+' if (mod := ability_modifier(v)) >= 0 else ''}{mod})"
-            for k, v in modified_attributes.items()
-        )
-
-        # ---------------- Skills & Saving Throws ----------------
-        skills_list = full_pokemon.get("skills", [])
-        saving_throws_list = full_pokemon.get("savingThrows", [])
-        skills_text = ", ".join(s.capitalize()
-                                for s in skills_list) if skills_list else "None"
-        saving_throws_text = ", ".join(
-            s.upper() for s in saving_throws_list) if saving_throws_list else "None"
-
-        # ---------------- Moves selection ----------------
-        moves_data = full_pokemon.get("moves", {})
-        available_moves = []
-        available_moves.extend(moves_data.get("start", []))
-        for lvl_key in ["level2", "level6", "level10", "level14", "level18"]:
-            lvl_num = int(lvl_key.replace("level", ""))
-            if level >= lvl_num:
-                available_moves.extend(moves_data.get(lvl_key, []))
-        moves_chosen = random.sample(available_moves, min(
-            4, len(available_moves))) if available_moves else ["None"]
-        moves_chosen = [m.replace("-", " ").title() for m in moves_chosen]
-
-        # ---------------- Abilities ----------------
-        abilities_data = full_pokemon.get("abilities", [])
-        normal_abilities = [a["id"]
-                            for a in abilities_data if not a.get("hidden", False)]
-        hidden_abilities = [a["id"]
-                            for a in abilities_data if a.get("hidden", False)]
-        chosen_ability = random.choice(
-            normal_abilities) if normal_abilities else "None"
-
-        def ability_with_desc(ability_id):
-            ability_info = ABILITY_LOOKUP.get(ability_id)
-            if ability_info:
-                return f"Ability: {ability_info['name']} - {ability_info['description']}\n"
-            return ability_id
-
-        abilities_text = ability_with_desc(chosen_ability)
-        if hidden_abilities:
-            hidden_texts = [ability_with_desc(h) for h in hidden_abilities]
-            abilities_text += "\nHidden " + "\n".join(hidden_texts)
-
-        # ---------------- HP based on level ----------------
-        base_hp = full_pokemon["hp"]
-        hit_dice = full_pokemon["hitDice"]
-        pokemon_min_level = full_pokemon["minLevel"]
-        con_mod = ability_modifier(modified_attributes["con"])
-        levels_above_min = max(0, level - pokemon_min_level)
-        additional_hp = levels_above_min * (hit_dice_bonus[hit_dice] + con_mod)
-        hp_text = base_hp + additional_hp
-
-    return {
-        "name": display_name,
-        "shiny": is_shiny,
-        "level": level,
-        "sr": full_pokemon.get("sr", 0),
-        "proficiency_bonus": prof_bonus,
-        "gender": gender_text,
-        "types": types_text,
-        "size": size_text,
-        "nature": nature_text,
-        "ac": ac_text,
-        "hp": hp_text,
-        "speed": speed_text,
-        "senses": senses_text,
-        "ability_scores": ability_scores_text,
-        "skills": skills_text,
-        "saving_throws": saving_throws_text,
-        "vulnerabilities": vulnerabilities,
-        "resistances": resistances,
-        "immunities": immunities,
-        "moves": moves_chosen,
-        "abilities": abilities_text,
-        "held_item": held_item_text,
-        "image_url": image_url
-    }
+from area_store import AreaStore
+from distributions import move_damage_summary
+from engine import (PokemonInstance, attack_roll, format_message, load_pokemon_index,
+                    move_lookup, pick_random_pokemon)
+from image_loader import ImageLoader
+from log_store import LogStore
+from order_index import OrderIndex
+import perf
+from perf import timed
+from pokemon_index import PokemonIndex
+from rng import RandomStreams
+from session import SessionJournal, load_session
+from sprite_cache import SpriteCache
+
+# How often the randomizer checks areas.json and its change log for edits
+AREA_POLL_MS = 2000
+# How often the main window checks whether the startup data has loaded
+LOADING_POLL_MS = 50
+# Refresh rate of the hidden performance window (Ctrl+Shift+D)
+DEBUG_REFRESH_MS = 1000
+# Every sidebar row has the same height, so positions and drag targets are arithmetic
+SIDEBAR_ROW_HEIGHT = 112
+SIDEBAR_ROW_GAP = 4
+SIDEBAR_ROW_WIDTH = 116
 
 
 # ---------------- REUSABLE INFO PANEL ----------------
 
 class PokemonInfoPanel(ttk.Frame):
+    WRAP_LEN = 450
+    SECTIONS = (
+        ("basics", "📌 Basics"),
+        ("stats", "📊 Stats"),
+        ("skills", "🛡️ Skills & Proficiencies"),
+        ("defenses", "🧪 Defenses"),
+        ("moves", "⚔️ Moves & Abilities"),
+    )
+    # (section, row) in display order
+    ROWS = (
+        ("basics", "size"), ("basics", "nature"), ("basics", "held_item"),
+        ("basics", "sr"), ("basics", "exp"),
+        ("stats", "ac"), ("stats", "hp"), ("stats", "speed"), ("stats", "ability_scores"),
+        ("skills", "proficiency_bonus"), ("skills", "skills"), ("skills", "saving_throws"),
+        ("defenses", "vulnerabilities"), ("defenses", "resistances"), ("defenses", "immunities"),
+        ("moves", "moves"), ("moves", "abilities"),
+    )
+
     def __init__(self, parent):
         super().__init__(parent)
         self.canvas = tk.Canvas(self, borderwidth=0)
@@ -841,175 +80,167 @@ class PokemonInfoPanel(ttk.Frame):
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
-    def add_description_tooltip(self, widget, pokemon_name):
-        """Add a tooltip with the Pokemon's description"""
-        # Find the full pokemon data to get the description
-        full_pokemon = None
-        if hasattr(self, 'all_pokemon_data'):
-            for pokemon_data in self.all_pokemon_data:
-                if pokemon_data["name"].lower() == pokemon_name.lower():
-                    full_pokemon = pokemon_data
-                    break
+        self.descriptions = {}  # pokemon name -> tooltip text
+        self.build_layout()
 
-        if full_pokemon and full_pokemon.get("description"):
-            description = full_pokemon["description"]
-            ToolTip(widget, description)
-        else:
-            # Fallback if no description found
-            ToolTip(widget, f"No description available for {pokemon_name}")
-
-    def display_pokemon(self, pokemon):
-        # Clear previous widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-
-        wrap_len = 450
+    def build_layout(self):
+        """Create every label once; display_pokemon only changes texts and visibility"""
+        # grid_remove() remembers each widget's row, so hidden rows come back in place
+        self.scrollable_frame.columnconfigure(0, weight=1)
 
         # --- Header ---
-        shiny_text = " 🌟 Shiny! 🌟" if pokemon.get("shiny", False) else ""
-        name = pokemon.get("name", "Unknown")
-        level = pokemon.get("level", "")
-        gender = pokemon.get("gender", "")
-
-        # Only show level and gender if they exist
-        level_text = f" (Lv {level})" if level else ""
-        gender_text = f" - {gender}" if gender else ""
-
-        name_label = tk.Label(
-            self.scrollable_frame,
-            text=f"{name}{level_text}{gender_text}{shiny_text}",
-            font=("Arial", 14, "bold"),
-            wraplength=wrap_len,
-            justify="left"
-        )
-        name_label.pack(anchor="w")
-
-        # Add tooltip with description to the name label
-        self.add_description_tooltip(name_label, name)
+        self.name_label = tk.Label(
+            self.scrollable_frame, font=("Arial", 14, "bold"),
+            wraplength=self.WRAP_LEN, justify="left")
+        self.name_label.grid(row=0, column=0, sticky="w")
+        self.name_tooltip = ToolTip(self.name_label, "")
+
+        self.type_label = tk.Label(
+            self.scrollable_frame, font=("Arial", 12),
+            wraplength=self.WRAP_LEN, justify="left")
+        self.type_label.grid(row=1, column=0, sticky="w")
+
+        # --- Sections ---
+        self.sections = {}
+        for row, (key, title) in enumerate(self.SECTIONS, start=2):
+            frame = ttk.LabelFrame(self.scrollable_frame, text=title)
+            frame.grid(row=row, column=0, sticky="ew", pady=5)
+            frame.grid_remove()
+            self.sections[key] = frame
+
+        self.rows = {}
+        self.row_texts = {}  # row -> text currently shown, None when hidden
+        for row, (section, key) in enumerate(self.ROWS):
+            if key == "ability_scores":
+                label = tk.Label(self.sections[section], font=("Courier", 10), justify="left")
+            else:
+                label = tk.Label(self.sections[section], wraplength=self.WRAP_LEN, justify="left")
+            pady = 2 if key in ("ability_scores", "moves", "abilities") else 0
+            label.grid(row=row, column=0, sticky="w", pady=pady)
+            label.grid_remove()
+            self.rows[key] = label
+            self.row_texts[key] = None
+
+    def description_text(self, pokemon_name):
+        """Description tooltip text for a species, looked up once per name"""
+        text = self.descriptions.get(pokemon_name)
+        if text is None:
+            # Find the full pokemon data to get the description
+            full_pokemon = None
+            if getattr(self, 'pokemon_index', None):
+                full_pokemon = self.pokemon_index.get(pokemon_name)
+
+            if full_pokemon and full_pokemon.get("description"):
+                text = full_pokemon["description"]
+            else:
+                # Fallback if no description found
+                text = f"No description available for {pokemon_name}"
+            self.descriptions[pokemon_name] = text
+        return text
 
-        tk.Label(
-            self.scrollable_frame,
-            text=f"Type: {pokemon.get('types', '')}",
-            font=("Arial", 12),
-            wraplength=wrap_len,
-            justify="left"
-        ).pack(anchor="w")
+    def row_values(self, pokemon):
+        """Text of every row, None for rows that are not shown"""
+        values = dict.fromkeys(self.rows)
 
         # --- Basics ---
-        basics_frame = ttk.LabelFrame(self.scrollable_frame, text="📌 Basics")
-        basics_frame.pack(fill="x", pady=5)
-
         if pokemon.get("size"):
-            tk.Label(basics_frame, text=f"Size: {pokemon['size']}",
-                     wraplength=wrap_len, justify="left").pack(anchor="w")
+            values["size"] = f"Size: {pokemon['size']}"
         if pokemon.get("nature"):
-            tk.Label(basics_frame, text=f"Nature: {pokemon['nature']}",
-                     wraplength=wrap_len, justify="left").pack(anchor="w")
+            values["nature"] = f"Nature: {pokemon['nature']}"
         if pokemon.get("held_item"):
-            tk.Label(basics_frame, text=f"Held Item: {pokemon['held_item']}",
-                     wraplength=wrap_len, justify="left").pack(anchor="w")
-
-            # Display SR
+            values["held_item"] = f"Held Item: {pokemon['held_item']}"
         if pokemon.get("sr") is not None:
-            tk.Label(basics_frame, text=f"SR: {pokemon['sr']}",
-                     wraplength=wrap_len, justify="left").pack(anchor="w")
-
-        # Calculate and display XP
+            values["sr"] = f"SR: {pokemon['sr']}"
         if pokemon.get("level") and pokemon.get("sr") is not None:
             xp_value = 200 * pokemon["level"] * pokemon["sr"]
-            tk.Label(basics_frame, text=f"Exp: {int(xp_value)}",
-                     wraplength=wrap_len, justify="left").pack(anchor="w")
+            values["exp"] = f"Exp: {int(xp_value)}"
 
         # --- Stats ---
-        if any(pokemon.get(field) for field in ["ac", "hp", "speed", "ability_scores"]):
-            stats_frame = ttk.LabelFrame(self.scrollable_frame, text="📊 Stats")
-            stats_frame.pack(fill="x", pady=5)
-
-            if pokemon.get("ac"):
-                tk.Label(stats_frame, text=f"Armor Class: {pokemon['ac']}",
-                         wraplength=wrap_len, justify="left").pack(anchor="w")
-            if pokemon.get("hp"):
-                tk.Label(stats_frame, text=f"HP: {pokemon['hp']}",
-                         wraplength=wrap_len, justify="left").pack(anchor="w")
-            if pokemon.get("speed"):
-                tk.Label(stats_frame, text=f"Speed: {pokemon['speed']}",
-                         wraplength=wrap_len, justify="left").pack(anchor="w")
-
-            # --- Ability Scores ---
-            if pokemon.get("ability_scores"):
-                abilities_text = ""
-                for line in pokemon['ability_scores'].split("\n"):
-                    abilities_text += f"    {line}\n"
-
-                tk.Label(stats_frame, text=abilities_text.rstrip(),
-                         font=("Courier", 10),
-                         justify="left").pack(anchor="w", pady=2)
+        if pokemon.get("ac"):
+            values["ac"] = f"Armor Class: {pokemon['ac']}"
+        if pokemon.get("hp"):
+            values["hp"] = f"HP: {pokemon['hp']}"
+        if pokemon.get("speed"):
+            values["speed"] = f"Speed: {pokemon['speed']}"
+        if pokemon.get("ability_scores"):
+            values["ability_scores"] = "\n".join(
+                f"    {line}" for line in pokemon["ability_scores"].split("\n")).rstrip()
 
         # --- Skills & Proficiencies ---
-        if any(pokemon.get(field) for field in ["proficiency_bonus", "skills", "saving_throws"]):
-            skills_frame = ttk.LabelFrame(
-                self.scrollable_frame, text="🛡️ Skills & Proficiencies")
-            skills_frame.pack(fill="x", pady=5)
-
-            if pokemon.get("proficiency_bonus"):
-                tk.Label(
-                    skills_frame, text=f"Proficiency Bonus: +{pokemon.get('proficiency_bonus', 0)}",
-                    wraplength=wrap_len, justify="left").pack(anchor="w")
-
-            if pokemon.get("skills"):
-                tk.Label(skills_frame, text=f"Skills: {pokemon.get('skills', 'None')}",
-                         wraplength=wrap_len, justify="left").pack(anchor="w")
-
-            if pokemon.get("saving_throws"):
-                tk.Label(skills_frame, text=f"Saving Throws: {pokemon.get('saving_throws', 'None')}",
-                         wraplength=wrap_len, justify="left").pack(anchor="w")
+        if pokemon.get("proficiency_bonus"):
+            values["proficiency_bonus"] = f"Proficiency Bonus: +{pokemon['proficiency_bonus']}"
+        if pokemon.get("skills"):
+            values["skills"] = f"Skills: {pokemon['skills']}"
+        if pokemon.get("saving_throws"):
+            values["saving_throws"] = f"Saving Throws: {pokemon['saving_throws']}"
 
         # --- Defenses ---
-        if any(pokemon.get(field) for field in ["vulnerabilities", "resistances", "immunities"]):
-            defenses_frame = ttk.LabelFrame(
-                self.scrollable_frame, text="🧪 Defenses")
-            defenses_frame.pack(fill="x", pady=5)
-
-            vulnerabilities = pokemon.get('vulnerabilities', [])
-            resistances = pokemon.get('resistances', [])
-            immunities = pokemon.get('immunities', [])
-
-            if vulnerabilities:
-                tk.Label(defenses_frame, text=f"Vulnerabilities: {', '.join(vulnerabilities)}",
-                         wraplength=wrap_len, justify="left").pack(anchor="w")
-
-            if resistances:
-                tk.Label(defenses_frame, text=f"Resistances: {', '.join(resistances)}",
-                         wraplength=wrap_len, justify="left").pack(anchor="w")
-
-            if immunities:
-                tk.Label(defenses_frame, text=f"Immunities: {', '.join(immunities)}",
-                         wraplength=wrap_len, justify="left").pack(anchor="w")
+        for field in ("vulnerabilities", "resistances", "immunities"):
+            entries = pokemon.get(field)
+            if entries:
+                values[field] = f"{field.capitalize()}: {', '.join(entries)}"
 
         # --- Moves & Abilities ---
-        if any(pokemon.get(field) for field in ["moves", "abilities"]):
-            moves_frame = ttk.LabelFrame(
-                self.scrollable_frame, text="⚔️ Moves & Abilities")
-            moves_frame.pack(fill="x", pady=5)
+        if pokemon.get("moves"):
+            values["moves"] = f"Moves: {', '.join(pokemon['moves'])}"
+        if pokemon.get("abilities"):
+            values["abilities"] = f"{pokemon['abilities']}"
+        return values
 
-            moves = pokemon.get('moves', [])
-            if moves:
-                tk.Label(moves_frame, text=f"Moves: {', '.join(moves)}",
-                         wraplength=wrap_len, justify="left").pack(anchor="w", pady=2)
+    @timed("ui.display_pokemon")
+    def display_pokemon(self, pokemon):
+        # --- Header ---
+        shiny_text = " 🌟 Shiny! 🌟" if pokemon.get("shiny", False) else ""
+        name = pokemon.get("name", "Unknown")
+        level = pokemon.get("level", "")
+        gender = pokemon.get("gender", "")
 
-            if pokemon.get("abilities"):
-                tk.Label(moves_frame, text=f"{pokemon.get('abilities', '')}",
-                         wraplength=wrap_len, justify="left").pack(anchor="w", pady=2)
+        # Only show level and gender if they exist
+        level_text = f" (Lv {level})" if level else ""
+        gender_text = f" - {gender}" if gender else ""
+
+        self.name_label.config(text=f"{name}{level_text}{gender_text}{shiny_text}")
+        self.name_tooltip.hide()
+        self.name_tooltip.text = self.description_text(name)
+        self.type_label.config(text=f"Type: {pokemon.get('types', '')}")
+
+        # --- Rows, touching only the ones that changed ---
+        visible_sections = {"basics"}
+        values = self.row_values(pokemon)
+        for section, key in self.ROWS:
+            text = values[key]
+            if text is not None:
+                visible_sections.add(section)
+            if text == self.row_texts[key]:
+                continue
+            label = self.rows[key]
+            if text is None:
+                label.grid_remove()
+            else:
+                label.config(text=text)
+                if self.row_texts[key] is None:
+                    label.grid()
+            self.row_texts[key] = text
+
+        for key, frame in self.sections.items():
+            if key in visible_sections:
+                frame.grid()
+            else:
+                frame.grid_remove()
 
 # ---------------- GUI APP ----------------
 
 
 class WilranApp(ttk.Frame):
-    def __init__(self, parent, areas, all_pokemon_data, battler_frame):
+    def __init__(self, parent, areas, pokemon_index, battler_frame, image_loader=None, rng=None,
+                 area_store=None):
         super().__init__(parent, padding=10)
         self.areas = areas
-        self.all_pokemon_data = all_pokemon_data
+        self.area_store = area_store  # AreaStore to follow for live edits, or None
+        self.pokemon_index = pokemon_index
         self.battler_frame = battler_frame
+        self.image_loader = image_loader or ImageLoader(self)
+        self.rng = rng or random  # encounter stream
         self.current_pokemon = None
 
         # --- Area selection ---
@@ -1071,13 +302,31 @@ class WilranApp(ttk.Frame):
             self.pokemon_text_frame, font=("Arial", 12), fg="gold")
         self.shiny_label.pack(anchor="w")
 
+        if self.area_store:
+            self.after(AREA_POLL_MS, self.poll_areas)
+
+    def poll_areas(self):
+        """Pick up areas created or edited in the area manager while the GUI runs"""
+        try:
+            changed = self.area_store.refresh()
+        except (OSError, ValueError) as e:
+            # e.g. areas.json edited by hand and saved half-way; try again next poll
+            print(f"❌ Could not reload areas: {e}", file=sys.stderr)
+            changed = False
+        if changed:
+            self.areas = self.area_store.areas
+            self.area_dropdown.config(values=list(self.areas.keys()))
+            if self.area_var.get() not in self.areas:
+                self.area_var.set("")
+        self.after(AREA_POLL_MS, self.poll_areas)
+
     def randomize_pokemon(self):
         area_name = self.area_var.get()
         if not area_name:
             return
 
         area = self.areas[area_name]
-        pokemon = pick_random_pokemon(area, self.all_pokemon_data)
+        pokemon = pick_random_pokemon(area, self.pokemon_index, self.rng)
         if not pokemon:
             return
 
@@ -1085,17 +334,15 @@ class WilranApp(ttk.Frame):
         self.add_button.config(state="normal")
         self.view_button.config(state="normal")
 
-        # Display image
+        # Display image - loaded in the background, a quick re-roll drops the stale one
+        self.pokemon_img_label.configure(image="", text="⏳ Loading...")
+        self.pokemon_img_label.image = None
         if pokemon.get("image_url"):
-            try:
-                response = requests.get(pokemon["image_url"])
-                pil_img = Image.open(BytesIO(response.content))
-                pil_img = pil_img.resize((100, 100), Image.Resampling.LANCZOS)
-                tk_img = ImageTk.PhotoImage(pil_img)
-                self.pokemon_img_label.configure(image=tk_img)
-                self.pokemon_img_label.image = tk_img
-            except:
-                self.pokemon_img_label.configure(text="No Image")
+            self.image_loader.request(
+                "randomizer", pokemon["image_url"], (100, 100), self.show_pokemon_image)
+        else:
+            self.image_loader.cancel("randomizer")
+            self.pokemon_img_label.configure(text="No Image")
 
         # Display text
         pokemon_name = pokemon["name"]
@@ -1106,6 +353,13 @@ class WilranApp(ttk.Frame):
         self.shiny_label.config(
             text="🌟 Shiny! 🌟" if pokemon.get("shiny") else "")
 
+    def show_pokemon_image(self, tk_img):
+        if tk_img:
+            self.pokemon_img_label.configure(image=tk_img, text="")
+            self.pokemon_img_label.image = tk_img
+        else:
+            self.pokemon_img_label.configure(text="No Image")
+
     def add_to_battler(self):
         if self.current_pokemon:
             self.battler_frame.add_pokemon(self.current_pokemon)
@@ -1127,10 +381,14 @@ class WilranApp(ttk.Frame):
 # ---------------- Battler ----------------
 
 class BattlerFrame(ttk.Frame):
-    def __init__(self, parent, battle_log=None, all_pokemon_data=None):
+    def __init__(self, parent, battle_log=None, pokemon_index=None, image_loader=None, rng=None,
+                 journal=None):
         super().__init__(parent)
         self.battle_log = battle_log  # reference to BattleLogFrame
-        self.all_pokemon_data = all_pokemon_data or []
+        self.pokemon_index = pokemon_index or PokemonIndex([])
+        self.image_loader = image_loader or ImageLoader(self)
+        self.rng = rng or random  # combat stream
+        self.journal = journal  # SessionJournal for autosave, or None
 
         # Main layout: sidebar + info panel
         main_frame = tk.Frame(self)
@@ -1143,23 +401,17 @@ class BattlerFrame(ttk.Frame):
         # Create canvas and scrollbar for Pokemon list
         self.sidebar_canvas = tk.Canvas(
             sidebar_container, bg="#f0f0f0", width=120)  # Set canvas width directly
-        sidebar_scrollbar = ttk.Scrollbar(
+        self.sidebar_scrollbar = ttk.Scrollbar(
             sidebar_container, orient="vertical", command=self.sidebar_canvas.yview)
-        self.sidebar = tk.Frame(self.sidebar_canvas, bg="#f0f0f0")
 
-        self.sidebar.bind(
-            "<Configure>",
-            lambda e: self.sidebar_canvas.configure(
-                scrollregion=self.sidebar_canvas.bbox("all"))
-        )
-
-        self.sidebar_canvas.create_window(
-            (0, 0), window=self.sidebar, anchor="nw")
-        self.sidebar_canvas.configure(yscrollcommand=sidebar_scrollbar.set)
+        # Only the rows in view exist as widgets; scrolling rebinds them
+        self.sidebar_canvas.configure(yscrollcommand=self.on_sidebar_scroll,
+                                      scrollregion=(0, 0, SIDEBAR_ROW_WIDTH, 0))
+        self.sidebar_canvas.bind("<Configure>", lambda e: self.render_sidebar())
 
         # Pack canvas and scrollbar
         self.sidebar_canvas.pack(side="left", fill="y")  # Remove expand=True
-        sidebar_scrollbar.pack(side="right", fill="y")
+        self.sidebar_scrollbar.pack(side="right", fill="y")
 
         # Bind mousewheel scrolling
         def _on_mousewheel(event):
@@ -1174,7 +426,7 @@ class BattlerFrame(ttk.Frame):
 
         # Info panel
         self.info_panel = PokemonInfoPanel(right_container)
-        self.info_panel.all_pokemon_data = self.all_pokemon_data  # Add this line
+        self.info_panel.pokemon_index = self.pokemon_index
         self.info_panel.pack(side="top", fill="both",
                              expand=True, padx=5, pady=5)
 
@@ -1267,10 +519,18 @@ class BattlerFrame(ttk.Frame):
         # Now create the actual moves button frame below header
         self.moves_frame = tk.Frame(right_container)
         self.moves_frame.pack(side="top", fill="x", padx=5, pady=5)
+        self.no_moves_label = tk.Label(self.moves_frame, text="No moves available")
+        # Buttons are reused across selections; move_buttons is the visible prefix
+        self._move_button_pool = []
         self.move_buttons = []
+        self._move_info = {}      # move id -> (header, description) tooltip text
+        self._move_tooltips = {}  # (pokemon id, move id) -> full tooltip text
 
         # Internal state
-        self.pokemon_widgets = {}
+        self.tracked = {}           # pokemon id -> PokemonInstance
+        self.order = OrderIndex()   # sidebar order of pokemon ids
+        self.sidebar_rows = []      # pooled row widgets, enough to fill the view
+        self._sidebar_count = 0
         self.selected_pokemon_id = None
         self.next_id = 1  # counter for unique IDs
         self.default_bg = "#f0f0f0"
@@ -1281,22 +541,132 @@ class BattlerFrame(ttk.Frame):
 
         self.setup_mousewheel_scrolling()
 
+    # ---------------- Sidebar Rows ----------------
+    def create_sidebar_row(self):
+        """One recycled sidebar slot; bind_row points it at whichever Pokémon scrolls into it"""
+        row = tk.Frame(self.sidebar_canvas, relief="raised",
+                       bd=2, bg=self.default_bg, cursor="hand2")
+        row.pokemon_id = None
+        # Image loader slot of this row, so a rebound row drops its old sprite request
+        row.slot = ("tracker", len(self.sidebar_rows))
+
+        row.name_label = tk.Label(row, font=("Arial", 10, "bold"), bg=self.default_bg,
+                                  cursor="hand2")
+        row.name_label.pack(anchor="w")
+        row.img_label = tk.Label(row, cursor="hand2", bg=self.default_bg)
+        row.img_label.pack(pady=2)
+
+        row.trash_btn = tk.Button(row, text="🗑️", fg="red", borderwidth=0,
+                                  cursor="hand2", command=lambda: self.confirm_remove(row.pokemon_id),
+                                  bg=self.default_bg)
+        row.trash_btn.place_forget()
+
+        # Bound once per row; handlers look up the Pokémon the row shows right now
+        for widget in (row, row.name_label, row.img_label):
+            widget.bind("<ButtonPress-1>", lambda e: self.on_drag_start(e, row.pokemon_id))
+            widget.bind("<B1-Motion>", self.on_drag_motion)
+            widget.bind("<ButtonRelease-1>", self.on_drag_release)
+
+        # Show/hide trash on hover
+        def show_trash(e, offset_x=20, offset_y=-5):
+            row.trash_btn.place(relx=1.0, rely=0.0, x=offset_x,
+                                y=offset_y, anchor="ne")
+
+        def hide_trash(e):
+            row.trash_btn.place_forget()
+
+        for widget in (row, row.name_label, row.img_label, row.trash_btn):
+            widget.bind("<Enter>", show_trash)
+            widget.bind("<Leave>", hide_trash)
+        self.bind_mousewheel_to_new_widgets(row)
+
+        row.item = self.sidebar_canvas.create_window(
+            0, -SIDEBAR_ROW_HEIGHT, window=row, anchor="nw",
+            width=SIDEBAR_ROW_WIDTH, height=SIDEBAR_ROW_HEIGHT - SIDEBAR_ROW_GAP)
+        self.sidebar_rows.append(row)
+        return row
+
+    def bind_row(self, row, pokemon_id):
+        """Show a Pokémon in a pooled row, touching widgets only when something changed"""
+        if row.pokemon_id != pokemon_id:
+            row.pokemon_id = pokemon_id
+            pokemon = self.tracked[pokemon_id]
+            row.name_label.config(text=pokemon["name"])
+            if pokemon.get("image_url"):
+                # Placeholder until the sprite arrives from the image loader
+                row.img_label.configure(image="", text="⏳")
+                row.img_label.image = None
+                self.image_loader.request(
+                    row.slot, pokemon["image_url"], (80, 80),
+                    lambda tk_img, pid=pokemon_id: self.show_row_image(row, pid, tk_img))
+            else:
+                self.image_loader.cancel(row.slot)
+                row.img_label.configure(image="", text="")
+                row.img_label.image = None
+        self.paint_row(row)
+
+    def show_row_image(self, row, pokemon_id, tk_img):
+        if row.pokemon_id != pokemon_id or not row.winfo_exists():
+            return
+        if tk_img:
+            row.img_label.configure(image=tk_img, text="")
+            row.img_label.image = tk_img
+        else:
+            row.img_label.configure(text="⚠️ Img error")
+
+    def paint_row(self, row):
+        bg = self.selected_bg if row.pokemon_id == self.selected_pokemon_id else self.default_bg
+        if row.cget("bg") != bg:
+            for w in (row, row.name_label, row.img_label, row.trash_btn):
+                w.config(bg=bg)
+
+    def render_sidebar(self):
+        """Bind the pooled rows to the Pokémon scrolled into view and park the rest"""
+        canvas = self.sidebar_canvas
+        count = len(self.order)
+        if count != self._sidebar_count:
+            self._sidebar_count = count
+            canvas.configure(scrollregion=(0, 0, SIDEBAR_ROW_WIDTH, count * SIDEBAR_ROW_HEIGHT))
+
+        top = max(int(canvas.canvasy(0)) // SIDEBAR_ROW_HEIGHT, 0)
+        visible = self.order.slice(top, top + canvas.winfo_height() // SIDEBAR_ROW_HEIGHT + 2)
+        while len(self.sidebar_rows) < len(visible):
+            self.create_sidebar_row()
+
+        for i, row in enumerate(self.sidebar_rows):
+            if i < len(visible):
+                self.bind_row(row, visible[i])
+                canvas.coords(row.item, 0, (top + i) * SIDEBAR_ROW_HEIGHT)
+            elif row.pokemon_id is not None:
+                # Above the scroll region, so never on screen
+                row.pokemon_id = None
+                self.image_loader.cancel(row.slot)
+                row.trash_btn.place_forget()
+                canvas.coords(row.item, 0, -SIDEBAR_ROW_HEIGHT)
+
+    def on_sidebar_scroll(self, first, last):
+        self.sidebar_scrollbar.set(first, last)
+        self.render_sidebar()
+
+    def row_at(self, y_root):
+        """Sidebar position under a screen y, from row heights alone"""
+        y = self.sidebar_canvas.canvasy(y_root - self.sidebar_canvas.winfo_rooty())
+        return min(max(int(y // SIDEBAR_ROW_HEIGHT), 0), len(self.order) - 1)
+
     # ---------------- Drag and Drop Methods ----------------
     def on_drag_start(self, event, pokemon_id):
-        """Start dragging a Pokemon container"""
-        widget = event.widget
-        # Find the container (might be clicking on a child widget)
-        while widget and widget not in [w["container"] for w in self.pokemon_widgets.values()]:
-            widget = widget.master
-
-        if widget:
-            self.drag_data["item"] = pokemon_id
-            self.drag_data["y"] = event.y_root
-            self.drag_data["start_y"] = event.y_root  # Track starting position
-            self.drag_data["dragging"] = False  # Not dragging yet
-            widget.config(cursor="hand2")  # Keep hand cursor initially
-
-    def on_drag_motion(self, event, pokemon_id):
+        """Start dragging a Pokemon row"""
+        if pokemon_id is None:
+            return
+        self.drag_data["item"] = pokemon_id
+        self.drag_data["y"] = event.y_root
+        self.drag_data["start_y"] = event.y_root  # Track starting position
+        self.drag_data["dragging"] = False  # Not dragging yet
+        self.drag_data["moved"] = False
+        # The pressed widget keeps the pointer grab, and its cursor, until release
+        self.drag_data["widget"] = event.widget
+
+    def on_drag_motion(self, event):
         """Handle dragging motion"""
         if self.drag_data["item"] is None:
             return
@@ -1307,102 +677,57 @@ class BattlerFrame(ttk.Frame):
                 event.y_root - self.drag_data.get("start_y", event.y_root))
             if distance < 5:
                 return  # Not enough movement, don't start drag yet
-            else:
-                # Start dragging
-                self.drag_data["dragging"] = True
-                widget = self.pokemon_widgets[self.drag_data["item"]
-                                              ]["container"]
-                widget.config(cursor="fleur")
-
-        # Get current y position
-        current_y = event.y_root
-
-        # Find all pokemon IDs in order
-        pokemon_order = list(self.pokemon_widgets.keys())
-        drag_index = pokemon_order.index(self.drag_data["item"])
-
-        # Determine if we should swap
-        for idx, pid in enumerate(pokemon_order):
-            if pid == self.drag_data["item"]:
-                continue
-
-            container = self.pokemon_widgets[pid]["container"]
-            container_y = container.winfo_rooty()
-            container_height = container.winfo_height()
-
-            # Check if dragged item is over this container
-            if container_y <= current_y <= container_y + container_height:
-                # Swap positions
-                if idx < drag_index:
-                    # Moving up
-                    self.swap_pokemon_positions(
-                        self.drag_data["item"], pid, "before")
-                elif idx > drag_index:
-                    # Moving down
-                    self.swap_pokemon_positions(
-                        self.drag_data["item"], pid, "after")
-                break
-
-    def on_drag_release(self, event, pokemon_id):
+            # Start dragging
+            self.drag_data["dragging"] = True
+            self.drag_data["widget"].config(cursor="fleur")
+
+        # Scroll when dragged past either edge of the list
+        canvas_top = self.sidebar_canvas.winfo_rooty()
+        if event.y_root < canvas_top:
+            self.sidebar_canvas.yview_scroll(-1, "units")
+        elif event.y_root > canvas_top + self.sidebar_canvas.winfo_height():
+            self.sidebar_canvas.yview_scroll(1, "units")
+
+        drag_id = self.drag_data["item"]
+        target = self.row_at(event.y_root)
+        if target != self.order.index(drag_id):
+            self.order.move(drag_id, target)
+            self.drag_data["moved"] = True
+            self.render_sidebar()
+
+    def on_drag_release(self, event):
         """End dragging"""
-        if self.drag_data["item"] is not None:
-            widget = self.pokemon_widgets[self.drag_data["item"]]["container"]
-            widget.config(cursor="hand2")
+        pokemon_id = self.drag_data["item"]
+        if pokemon_id is not None:
+            self.drag_data["widget"].config(cursor="hand2")
 
+            if self.drag_data["moved"]:
+                self.record({"op": "order", "ids": list(self.order)})
             # If we didn't actually drag (just clicked), select the Pokemon
-            if not self.drag_data.get("dragging", False):
+            if not self.drag_data.get("dragging", False) and pokemon_id in self.tracked:
                 self.select_pokemon(pokemon_id)
 
         self.drag_data = {"item": None, "y": 0,
                           "start_y": 0, "dragging": False}
 
-    def swap_pokemon_positions(self, drag_id, target_id, position):
-        """Swap the positions of two Pokemon in the sidebar"""
-        # Get all widgets in current order
-        all_widgets = list(self.pokemon_widgets.items())
-
-        # Find indices
-        drag_idx = next(i for i, (pid, _) in enumerate(
-            all_widgets) if pid == drag_id)
-        target_idx = next(i for i, (pid, _) in enumerate(
-            all_widgets) if pid == target_id)
-
-        # Don't swap if already in correct position
-        if (position == "before" and drag_idx == target_idx - 1) or \
-                (position == "after" and drag_idx == target_idx + 1):
-            return
-
-        # Unpack all containers
-        for pid, widgets in all_widgets:
-            widgets["container"].pack_forget()
-
-        # Build new order
-        new_order = []
-
-        # Go through all items and build the correct order
-        for i, (pid, widgets) in enumerate(all_widgets):
-            if pid == drag_id:
-                # Skip the dragged item, we'll add it in the right place
-                continue
-
-            if pid == target_id:
-                # This is where we insert the dragged item
-                if position == "before":
-                    new_order.append((drag_id, self.pokemon_widgets[drag_id]))
-                    new_order.append((pid, widgets))
-                else:  # after
-                    new_order.append((pid, widgets))
-                    new_order.append((drag_id, self.pokemon_widgets[drag_id]))
-            else:
-                # Not the target or dragged item, just add normally
-                new_order.append((pid, widgets))
-
-        # Repack in new order
-        for pid, widgets in new_order:
-            widgets["container"].pack(pady=2, fill="x")
-
-        # Update the internal dictionary order to match visual order
-        self.pokemon_widgets = dict(new_order)
+    # ---------------- Session ----------------
+    def record(self, event):
+        """Hand a state change to the autosave journal"""
+        if self.journal:
+            self.journal.record(event)
+
+    def restore_session(self, state):
+        """Rebuild the tracker from a SessionState"""
+        self.next_id = max(self.next_id, state.next_id)
+        self._pokemon_health = {pid: dict(h) for pid, h in state.health.items()}
+        self._current_pp_instances = {pid: dict(pp) for pid, pp in state.pp.items()}
+        for pokemon_id, data in state.pokemon.items():
+            pokemon = PokemonInstance.from_dict(data)
+            pokemon.instance_id = pokemon_id
+            self.create_sidebar_entry(pokemon)
+        self.render_sidebar()
+        if state.selected in self.tracked:
+            self.select_pokemon(state.selected)
 
     # ---------------- Add Pokémon ----------------
     def add_pokemon(self, pokemon):
@@ -1411,81 +736,20 @@ class BattlerFrame(ttk.Frame):
 
         # Make a deep copy so each instance is unique
         pokemon_instance = copy.deepcopy(pokemon)
-        pokemon_instance["_id"] = pokemon_id
-
-        container = tk.Frame(self.sidebar, relief="raised",
-                             bd=2, bg=self.default_bg, cursor="hand2")
-        container.pack(pady=2, fill="x")
-
-        name_label = tk.Label(container, text=pokemon_instance["name"],
-                              font=("Arial", 10, "bold"), bg=self.default_bg,
-                              cursor="hand2")
-        name_label.pack(anchor="w")
-
-        img_label = None
-        if pokemon_instance.get("image_url"):
-            try:
-                response = requests.get(pokemon_instance["image_url"])
-                pil_img = Image.open(BytesIO(response.content))
-                pil_img = pil_img.resize((80, 80), Image.Resampling.LANCZOS)
-                tk_img = ImageTk.PhotoImage(pil_img)
-                img_label = tk.Label(container, image=tk_img, cursor="hand2",
-                                     bg=self.default_bg)
-                img_label.image = tk_img
-                img_label.pack(pady=2)
-                img_label.bind("<Button-1>",
-                               lambda e, pid=pokemon_id: self.select_pokemon(pid))
-            except:
-                tk.Label(container, text="⚠️ Img error",
-                         bg=self.default_bg).pack()
-
-        trash_btn = tk.Button(container, text="🗑️", fg="red", borderwidth=0,
-                              cursor="hand2", command=lambda pid=pokemon_id: self.confirm_remove(pid),
-                              bg=self.default_bg)
-        trash_btn.place_forget()
-
-        # Bind drag events to container and children
-        def bind_drag_events(widget):
-            widget.bind("<ButtonPress-1>", lambda e,
-                        pid=pokemon_id: self.on_drag_start(e, pid))
-            widget.bind("<B1-Motion>", lambda e,
-                        pid=pokemon_id: self.on_drag_motion(e, pid))
-            widget.bind("<ButtonRelease-1>", lambda e,
-                        pid=pokemon_id: self.on_drag_release(e, pid))
-            for child in widget.winfo_children():
-                if child != trash_btn:  # Don't bind to trash button
-                    bind_drag_events(child)
-
-        bind_drag_events(container)
-
-        # Show/hide trash on hover
-        def show_trash(e, offset_x=20, offset_y=-5):
-            trash_btn.place(relx=1.0, rely=0.0, x=offset_x,
-                            y=offset_y, anchor="ne")
-
-        def hide_trash(e):
-            trash_btn.place_forget()
-
-        container.bind("<Enter>", show_trash)
-        container.bind("<Leave>", hide_trash)
-        for child in container.winfo_children():
-            child.bind("<Enter>", show_trash)
-            child.bind("<Leave>", hide_trash)
-
-        self.pokemon_widgets[pokemon_id] = {
-            "pokemon": pokemon_instance,
-            "container": container,
-            "name_label": name_label,
-            "img_label": img_label,
-            "trash_btn": trash_btn
-        }
+        pokemon_instance.instance_id = pokemon_id
+        self.create_sidebar_entry(pokemon_instance)
+        self.record({"op": "add", "id": pokemon_id,
+                     "pokemon": pokemon_instance.to_dict()})
+        self.render_sidebar()
 
         self.select_pokemon(pokemon_id)
-        # Bind mousewheel to the newly created container and its children
-        self.bind_mousewheel_to_new_widgets(container)
         self.initialize_pokemon_health(pokemon_id)
 
-    # ... rest of the methods remain the same ...
+    def create_sidebar_entry(self, pokemon_instance):
+        """Track a Pokémon at the end of the sidebar; rows are drawn by render_sidebar"""
+        pokemon_id = pokemon_instance.instance_id
+        self.tracked[pokemon_id] = pokemon_instance
+        self.order.append(pokemon_id)
 
     def bind_mousewheel_to_new_widgets(self, widget):
         """Bind mousewheel to newly created widgets"""
@@ -1496,23 +760,14 @@ class BattlerFrame(ttk.Frame):
 
     # ---------------- Select Pokémon ----------------
     def select_pokemon(self, pokemon_id):
-        if self.selected_pokemon_id:
-            prev = self.pokemon_widgets.get(self.selected_pokemon_id)
-            if prev:
-                for widget_name in ("container", "name_label", "img_label", "trash_btn"):
-                    w = prev.get(widget_name)
-                    if w:
-                        w.config(bg=self.default_bg)
-
-        current = self.pokemon_widgets[pokemon_id]
-        for widget_name in ("container", "name_label", "img_label", "trash_btn"):
-            w = current.get(widget_name)
-            if w:
-                w.config(bg=self.selected_bg)
-
         self.selected_pokemon_id = pokemon_id
-        self.info_panel.display_pokemon(current["pokemon"])
-        self.display_moves(current["pokemon"], self.battle_log)
+        for row in self.sidebar_rows:
+            self.paint_row(row)
+
+        pokemon = self.tracked[pokemon_id]
+        self.record({"op": "select", "id": pokemon_id})
+        self.info_panel.display_pokemon(pokemon)
+        self.display_moves(pokemon, self.battle_log)
 
         if pokemon_id not in getattr(self, '_pokemon_health', {}):
             self.initialize_pokemon_health(pokemon_id)
@@ -1520,77 +775,106 @@ class BattlerFrame(ttk.Frame):
 
     # ---------------- Display Moves ----------------
 
-    def display_moves(self, pokemon, battle_log=None):
-        for btn in getattr(self, "move_buttons", []):
-            btn.destroy()
-        self.move_buttons = []
+    def move_info_text(self, move_id):
+        """Pokémon-independent part of a move tooltip, built once per move"""
+        text = self._move_info.get(move_id)
+        if text is None:
+            move_data = move_lookup()[move_id]
+            # Build tooltip text with extra fields
+            tooltip_parts = []
+            tooltip_parts.append(
+                f"Type: {move_data.get('type', 'N/A').capitalize()}")
+
+            power = move_data.get('power', 'N/A')
+            if isinstance(power, list):
+                power = "/".join([p.upper() for p in power])
+            tooltip_parts.append(f"Power: {power}")
+
+            tooltip_parts.append(f"Time: {move_data.get('time', 'N/A')}")
+            tooltip_parts.append(
+                f"Duration: {move_data.get('duration', 'N/A')}")
+            tooltip_parts.append(f"Range: {move_data.get('range', 'N/A')}")
+
+            # Add description text (skip tables)
+            desc_text = "\n".join(str(d) for d in move_data.get(
+                "description", []) if isinstance(d, str))
+            if "higherLevels" in move_data:
+                desc_text += f"\n\n{move_data['higherLevels']}"
+            text = ("\n".join(tooltip_parts), "\n" + desc_text)
+            self._move_info[move_id] = text
+        return text
+
+    def move_tooltip_text(self, pokemon, move_id):
+        """Full move tooltip for one Pokémon, cached per (instance, move)"""
+        key = (pokemon.instance_id, move_id)
+        text = self._move_tooltips.get(key)
+        if text is None:
+            header, description = self.move_info_text(move_id)
+            damage_summary = move_damage_summary(pokemon, move_id)
+            if damage_summary:
+                header = f"{header}\n{damage_summary}"
+            text = f"{header}\n{description}"
+            self._move_tooltips[key] = text
+        return text
+
+    def hide_moves(self, count=0):
+        """Hide pooled move buttons from index count on"""
+        for btn in self._move_button_pool[count:]:
+            btn.tooltip.hide()
+            btn.pack_forget()
+        self.move_buttons = self._move_button_pool[:count]
 
+    def display_moves(self, pokemon, battle_log=None):
         moves = pokemon.get("moves", [])
         if not moves:
-            tk.Label(self.moves_frame, text="No moves available").pack()
+            self.hide_moves()
+            self.no_moves_label.pack()
             return
+        self.no_moves_label.pack_forget()
 
         # Use unique Pokémon instance ID
         if "_current_pp_instances" not in self.__dict__:
             self._current_pp_instances = {}  # store PP per _id
 
-        pokemon_id = pokemon["_id"]
+        pokemon_id = pokemon.instance_id
         if pokemon_id not in self._current_pp_instances:
             # Initialize PP for this instance
             self._current_pp_instances[pokemon_id] = {}
             for move_name in moves:
                 move_id = move_name.lower().replace(" ", "-")
-                move_data = MOVE_LOOKUP.get(move_id)
+                move_data = move_lookup().get(move_id)
                 self._current_pp_instances[pokemon_id][move_name] = move_data["pp"] if move_data else 0
 
-        for move_name in moves:
+        # Reuse the pooled buttons; only create new ones for a longer move list
+        while len(self._move_button_pool) < len(moves):
+            btn = tk.Button(self.moves_frame, width=20)
+            btn.tooltip = ToolTip(btn, "")
+            self._move_button_pool.append(btn)
+
+        for btn, move_name in zip(self._move_button_pool, moves):
             current_pp = self._current_pp_instances[pokemon_id][move_name]
-            btn_text = f"{move_name} (PP: {current_pp})"
-            btn = tk.Button(
-                self.moves_frame,
-                text=btn_text,
-                width=20,
+            btn.tooltip.hide()
+            btn.config(
+                text=f"{move_name} (PP: {current_pp})",
+                state="disabled" if current_pp <= 0 else "normal",
                 command=lambda m=move_name, pid=pokemon_id: self.use_move_instance(
                     m, pid, battle_log)
             )
-            if current_pp <= 0:
-                btn.config(state="disabled")
-            btn.pack(side="left", padx=2, pady=2)
-            self.move_buttons.append(btn)
 
             # --- Tooltip with move info ---
             move_id = move_name.lower().replace(" ", "-")
-            move_data = MOVE_LOOKUP.get(move_id)
-            if move_data:
-                # Build tooltip text with extra fields
-                tooltip_parts = []
-                tooltip_parts.append(
-                    f"Type: {move_data.get('type', 'N/A').capitalize()}")
-
-                power = move_data.get('power', 'N/A')
-                if isinstance(power, list):
-                    power = "/".join([p.upper() for p in power])
-                tooltip_parts.append(f"Power: {power}")
-
-                tooltip_parts.append(f"Time: {move_data.get('time', 'N/A')}")
-                tooltip_parts.append(
-                    f"Duration: {move_data.get('duration', 'N/A')}")
-                tooltip_parts.append(f"Range: {move_data.get('range', 'N/A')}")
-
-                # Add description text (skip tables)
-                desc_text = "\n".join(str(d) for d in move_data.get(
-                    "description", []) if isinstance(d, str))
-                if "higherLevels" in move_data:
-                    desc_text += f"\n\n{move_data['higherLevels']}"
-                tooltip_parts.append("\n" + desc_text)
-
-                full_tooltip = "\n".join(tooltip_parts)
-                ToolTip(btn, full_tooltip)
+            btn.tooltip.text = (self.move_tooltip_text(pokemon, move_id)
+                                if move_id in move_lookup() else "")
+            if not btn.winfo_manager():
+                btn.pack(side="left", padx=2, pady=2)
+        self.hide_moves(len(moves))
 
     # ---------------- Remove Pokémon ----------------
 
     def confirm_remove(self, pokemon_id):
-        pokemon = self.pokemon_widgets[pokemon_id]["pokemon"]
+        if pokemon_id is None:
+            return
+        pokemon = self.tracked[pokemon_id]
         result = tk.messagebox.askyesno(
             "Remove Pokémon",
             f"Are you sure you want to remove {pokemon['name']} from the battler?"
@@ -1599,16 +883,19 @@ class BattlerFrame(ttk.Frame):
             self.remove_pokemon(pokemon_id)
 
     def remove_pokemon(self, pokemon_id):
-        widgets = self.pokemon_widgets.pop(pokemon_id, None)
-        if widgets:
-            widgets["container"].destroy()
+        if self.tracked.pop(pokemon_id, None) is None:
+            return
+        self.order.remove(pokemon_id)
+        self.record({"op": "remove", "id": pokemon_id})
+        self.render_sidebar()
         if self.selected_pokemon_id == pokemon_id:
             self.selected_pokemon_id = None
             self.info_panel.display_pokemon({"name": "No Pokémon selected"})
             # Clear moves frame
-            for btn in getattr(self, "move_buttons", []):
-                btn.destroy()
-            self.move_buttons = []
+            self.hide_moves()
+            self.no_moves_label.pack_forget()
+        self._move_tooltips = {key: text for key, text in self._move_tooltips.items()
+                               if key[0] != pokemon_id}
 
     # ---------------- Reset PP ----------------
 
@@ -1617,13 +904,15 @@ class BattlerFrame(ttk.Frame):
             return
 
         # Reset all moves to their original PP
-        pokemon = self.pokemon_widgets[pokemon_id]["pokemon"]
+        pokemon = self.tracked[pokemon_id]
         moves = pokemon.get("moves", [])
         for move_name in moves:
             move_id = move_name.lower().replace(" ", "-")
-            move_data = MOVE_LOOKUP.get(move_id)
+            move_data = move_lookup().get(move_id)
             if move_data:
                 self._current_pp_instances[pokemon_id][move_name] = move_data["pp"]
+        self.record({"op": "pp", "id": pokemon_id,
+                     "pp": dict(self._current_pp_instances[pokemon_id])})
 
         # Refresh move buttons and **pass the battle log**
         self.display_moves(pokemon, self.battle_log)
@@ -1635,6 +924,7 @@ class BattlerFrame(ttk.Frame):
 
         if pp_dict[move_name] > 0:
             pp_dict[move_name] -= 1
+            self.record({"op": "pp", "id": pokemon_id, "pp": dict(pp_dict)})
             # Update button
             for btn in self.move_buttons:
                 if btn.cget("text").startswith(move_name):
@@ -1643,17 +933,15 @@ class BattlerFrame(ttk.Frame):
                         btn.config(state="disabled")
                     break
 
-        pokemon = self.pokemon_widgets[pokemon_id]["pokemon"]
+        pokemon = self.tracked[pokemon_id]
         move_id = move_name.lower().replace(" ", "-")
 
         try:
-            attack_result, damage_result = attack_roll(
-                pokemon, move_id)
+            result = attack_roll(pokemon, move_id, self.rng)
 
             # Format in Roll20 style
             formatted_message = format_message(
-                pokemon['name'], move_name, attack_result, damage_result
-            )
+                pokemon['name'], move_name, result)
 
         except Exception as e:
             formatted_message = f"{pokemon['name']} uses {move_name}!\n\nError: {str(e)}"
@@ -1668,7 +956,7 @@ class BattlerFrame(ttk.Frame):
         if not hasattr(self, '_pokemon_health'):
             self._pokemon_health = {}
 
-        pokemon = self.pokemon_widgets[pokemon_id]["pokemon"]
+        pokemon = self.tracked[pokemon_id]
         max_hp = pokemon.get("hp", 100)
         self._pokemon_health[pokemon_id] = {
             "current": max_hp,
@@ -1698,7 +986,7 @@ class BattlerFrame(ttk.Frame):
         if not input_text:
             return
 
-        pokemon = self.pokemon_widgets[self.selected_pokemon_id]["pokemon"]
+        pokemon = self.tracked[self.selected_pokemon_id]
         pokemon_name = pokemon["name"]
 
         # Clear the entry
@@ -1772,6 +1060,8 @@ class BattlerFrame(ttk.Frame):
                     log_msg = f"{pokemon_name} HP remains {health_data['current']}/{max_hp}"
 
             # Update display and log
+            self.record({"op": "hp", "id": self.selected_pokemon_id,
+                         "current": health_data["current"], "max": max_hp})
             self.update_health_display()
             if self.battle_log:
                 self.battle_log.log(log_msg)
@@ -1818,21 +1108,8 @@ class BattlerFrame(ttk.Frame):
                     "Please select both roll type and specific roll!")
             return
 
-        pokemon = self.pokemon_widgets[self.selected_pokemon_id]["pokemon"]
-        pokemon_name = pokemon["name"]
-
-        # Parse ability scores from the pokemon
-        ability_scores = {}
-        for line in pokemon["ability_scores"].split("\n"):
-            parts = line.split(":")
-            if len(parts) >= 2:
-                ability_name = parts[0].strip().lower()
-                # Extract the score (number before the parentheses)
-                score_text = parts[1].strip()
-                score_match = re.search(r"(\d+)", score_text)
-                if score_match:
-                    ability_scores[ability_name] = int(
-                        score_match.group(1))
+        pokemon = self.tracked[self.selected_pokemon_id]
+        pokemon_name = pokemon.name
 
         # Determine which ability to use
         if roll_type in ["Ability Check", "Saving Throw"]:
@@ -1842,26 +1119,20 @@ class BattlerFrame(ttk.Frame):
             ability_name = self.skill_abilities.get(
                 roll_option, 'wis').lower()[:3]
 
-        # Get ability score and modifier
-        ability_score = ability_scores.get(ability_name, 10)
-        ability_modifier = (ability_score - 10) // 2
+        # Get ability modifier
+        ability_modifier = pokemon.modifier(ability_name)
 
         # Check for proficiency
-        proficiency_bonus = pokemon.get("proficiency_bonus", 0)
+        proficiency_bonus = pokemon.proficiency_bonus
         is_proficient = False
 
         if roll_type == "Saving Throw":
-            # Check if proficient in this saving throw
-            saving_throws = pokemon.get("saving_throws", "").lower()
-            is_proficient = ability_name in saving_throws
+            is_proficient = pokemon.proficient_save(ability_name)
         elif roll_type == "Skill Check":
-            # Check if proficient in this skill
-            skills = pokemon.get("skills", "").lower()
-            skill_check = roll_option.lower().replace(" ", "")
-            is_proficient = skill_check in skills.replace(" ", "")
+            is_proficient = pokemon.proficient_skill(roll_option)
 
         # Roll the d20
-        d20_roll = random.randint(1, 20)
+        d20_roll = self.rng.randint(1, 20)
 
         # Calculate total
         total = d20_roll + ability_modifier
@@ -1919,7 +1190,7 @@ class BattlerFrame(ttk.Frame):
             sidebar_parent = widget_under_mouse
             is_over_sidebar = False
             while sidebar_parent:
-                if sidebar_parent == self.sidebar_canvas or sidebar_parent == self.sidebar:
+                if sidebar_parent == self.sidebar_canvas:
                     is_over_sidebar = True
                     break
                 try:
@@ -1946,7 +1217,17 @@ class BattlerFrame(ttk.Frame):
 
 
 class BattleLogFrame(ttk.Frame):
-    def __init__(self, parent):
+    """Battle log that only keeps a window of entries in the Text widget
+
+    Every message goes to a LogStore (ring buffer in memory, older entries
+    spilled to disk). The widget shows at most `window` consecutive entries;
+    scrolling to the top or bottom pages PAGE entries in from the store.
+    """
+
+    SEPARATOR = "─" * 30 + "\n"
+    PAGE = 50
+
+    def __init__(self, parent, window=200, memory_cap=1000):
         super().__init__(parent)
 
         log_frame = ttk.LabelFrame(self, text="📜 Battle Log")
@@ -1956,24 +1237,125 @@ class BattleLogFrame(ttk.Frame):
             log_frame, width=40, height=30, wrap="word", state="disabled"
         )
         self.log_widget.pack(fill="both", expand=True)
+        self.log_widget.configure(yscrollcommand=self.on_scroll)
 
         # Configure tags for styling
         self.log_widget.tag_configure("separator", foreground="gray")
-        self.first_log = True  # Track if this is the first log entry
+        self.journal = None  # SessionJournal for autosave, or None
 
+        self.store = LogStore(memory_cap)
+        self.window = window
+        self.shown = deque()  # (entry number, lines in the widget) top to bottom
+        self.pending = []  # messages waiting for the next idle flush
+        self.flush_scheduled = False
+        self.paging_scheduled = False
+
+    @timed("ui.battle_log.log")
     def log(self, message: str):
-        self.log_widget.configure(state="normal")
+        self.log_many([message])
+
+    def log_many(self, messages):
+        """Queue messages; every call within one Tk idle cycle becomes one insert"""
+        if self.journal:
+            for message in messages:
+                self.journal.record({"op": "log", "message": message})
+        self.pending.extend(messages)
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.after_idle(self.flush)
+
+    @timed("ui.battle_log.flush")
+    def flush(self):
+        self.flush_scheduled = False
+        messages, self.pending = self.pending, []
+        if not messages:
+            return
+        following = not self.shown or self.shown[-1][0] == len(self.store) - 1
+        added = self.store.append_many(messages)
 
-        # Add separator line before message (except for first entry)
-        if not self.first_log:
-            separator = "─" * 30 + "\n"
-            self.log_widget.insert("end", separator, "separator")
+        self.log_widget.configure(state="normal")
+        if following and len(added) < self.window:
+            for entry in added:
+                self.append_entry(entry)
+            self.trim_top(len(self.shown) - self.window)
         else:
-            self.first_log = False
+            # Scrolled back into history (or a huge batch) - show the newest entries
+            self.render_tail()
+        self.log_widget.see("end")  # auto-scroll
+        self.log_widget.configure(state="disabled")
 
-        # Add the main message
+    # ---------------- Window over the store ----------------
+    def append_entry(self, entry):
+        number, message = entry
+        if self.shown:
+            self.log_widget.insert("end", self.SEPARATOR, "separator")
         self.log_widget.insert("end", f"{message}\n\n")
-        self.log_widget.see("end")  # auto-scroll
+        self.shown.append((number, message.count("\n") + 2 + bool(self.shown)))
+
+    def prepend_entry(self, entry):
+        number, message = entry
+        text = f"{message}\n\n"
+        if self.shown:
+            # The old top entry gets the separator it didn't need before
+            self.log_widget.insert("1.0", self.SEPARATOR, "separator")
+            top_number, top_lines = self.shown[0]
+            self.shown[0] = (top_number, top_lines + 1)
+        self.log_widget.insert("1.0", text)
+        self.shown.appendleft((number, message.count("\n") + 2))
+
+    def trim_top(self, count):
+        for _ in range(max(0, count)):
+            _, lines = self.shown.popleft()
+            self.log_widget.delete("1.0", f"{lines + 1}.0")
+            # The new top entry no longer needs its separator
+            top_number, top_lines = self.shown[0]
+            self.log_widget.delete("1.0", "2.0")
+            self.shown[0] = (top_number, top_lines - 1)
+
+    def trim_bottom(self, count):
+        for _ in range(max(0, count)):
+            _, lines = self.shown.pop()
+            start = 1 + sum(entry_lines for _, entry_lines in self.shown)
+            self.log_widget.delete(f"{start}.0", "end")
+
+    def render_tail(self):
+        self.log_widget.delete("1.0", "end")
+        self.shown.clear()
+        total = len(self.store)
+        for entry in self.store.get(total - self.window, total):
+            self.append_entry(entry)
+
+    def on_scroll(self, first, last):
+        self.log_widget.vbar.set(first, last)
+        if self.paging_scheduled or not self.shown:
+            return
+        at_top = float(first) <= 0.0 and self.shown[0][0] > self.store.earliest
+        at_bottom = float(last) >= 1.0 and self.shown[-1][0] < len(self.store) - 1
+        if at_top or at_bottom:
+            self.paging_scheduled = True
+            self.after_idle(self.page, "older" if at_top else "newer")
+
+    def page(self, direction):
+        """Load PAGE more entries at one end and drop as many from the other"""
+        self.paging_scheduled = False
+        if not self.shown:
+            return
+        self.log_widget.configure(state="normal")
+        if direction == "older":
+            top = self.shown[0][0]
+            entries = self.store.get(top - self.PAGE, top)
+            for entry in reversed(entries):
+                self.prepend_entry(entry)
+            self.trim_bottom(len(self.shown) - self.window)
+            # Keep the entry that was on top where the user left it
+            added_lines = sum(lines for _, lines in list(self.shown)[:len(entries)])
+            self.log_widget.yview(f"{added_lines + 1}.0")
+        else:
+            bottom = self.shown[-1][0]
+            entries = self.store.get(bottom + 1, bottom + 1 + self.PAGE)
+            for entry in entries:
+                self.append_entry(entry)
+            self.trim_top(len(self.shown) - self.window)
         self.log_widget.configure(state="disabled")
 
 
@@ -2024,23 +1406,132 @@ class ToolTip:
             self.tip_window = None
 
 
+# ---------------- Debug Window ----------------
+
+class DebugWindow(tk.Toplevel):
+    """Hidden performance overlay: count and p50/p95 of every perf timer
+
+    Opening it switches timing on; closing it switches timing back off
+    unless it was already on (WILRAN_PROFILE or --profile).
+    """
+
+    COLUMNS = (("count", "Count"), ("total_ms", "Total ms"),
+               ("p50_ms", "p50 ms"), ("p95_ms", "p95 ms"))
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.title("Wilran - Performance")
+        self.geometry("560x360")
+        self.was_enabled = perf.ENABLED
+        perf.enable()
+
+        self.tree = ttk.Treeview(self, columns=[c for c, _ in self.COLUMNS])
+        self.tree.heading("#0", text="Timer")
+        self.tree.column("#0", width=220)
+        for column, title in self.COLUMNS:
+            self.tree.heading(column, text=title)
+            self.tree.column(column, width=80, anchor="e")
+        self.tree.pack(fill="both", expand=True, padx=5, pady=5)
+
+        tk.Button(self, text="Reset", command=perf.reset).pack(side="left", padx=5, pady=5)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.refresh()
+
+    def refresh(self):
+        self.tree.delete(*self.tree.get_children())
+        for row in perf.snapshot():
+            self.tree.insert("", "end", text=row["name"], values=(
+                row["count"], f"{row['total_ms']:.1f}",
+                f"{row['p50_ms']:.3f}", f"{row['p95_ms']:.3f}"))
+        self.after_id = self.after(DEBUG_REFRESH_MS, self.refresh)
+
+    def close(self):
+        self.after_cancel(self.after_id)
+        perf.enable(self.was_enabled)
+        self.destroy()
+
+
 # ---------------- Main ----------------
 
-def main_gui():
+def load_startup_data():
+    """Everything the panels need from disk; runs on a worker thread"""
+    started = time.perf_counter()
+    area_store = AreaStore()
+    pokemon_index = load_pokemon_index()
+    move_lookup()  # the battler needs it on the first selection
+    saved_session = load_session()
+    perf.record("startup.data", time.perf_counter() - started)
+    return area_store, pokemon_index, saved_session
+
+
+def main_gui(seed=None, fresh=False):
     print("🎲 Welcome to Wilran! Pokémon Randomizer 🎲")
-    areas = load_json(AREA_FILE)
-    if not areas:
-        return
-    all_pokemon_data = load_json(POKEMON_FILE).get("items", [])
-    if not all_pokemon_data:
-        print("❌ No Pokémon data found in pokemon.json!")
-        return
+    # Separate encounter/combat streams; the same seed replays a session
+    streams = RandomStreams(seed)
 
     root = tk.Tk()
     root.title("Wilran")
     root.geometry("1400x900")
     root.minsize(800, 500)
 
+    # Ctrl+Shift+D: performance window, one at a time
+    debug_window = None
+
+    def toggle_debug_window(event=None):
+        nonlocal debug_window
+        if debug_window and debug_window.winfo_exists():
+            debug_window.close()
+        else:
+            debug_window = DebugWindow(root)
+
+    root.bind_all("<Control-D>", toggle_debug_window)
+
+    # ---- Show the window right away, the data loads behind it ----
+    loading_label = tk.Label(root, text="⏳ Loading Pokémon data...", font=("Arial", 16))
+    loading_label.pack(expand=True)
+    root.update()
+    first_window = time.perf_counter() - STARTED
+    perf.record("startup.first_window", first_window)
+    print(f"🪟 Window shown after {first_window * 1000:.0f} ms")
+
+    loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wilran-load")
+    future = loader.submit(load_startup_data)
+    loader.shutdown(wait=False)
+    cleanup = []
+
+    def finish_loading():
+        if not future.done():
+            root.after(LOADING_POLL_MS, finish_loading)
+            return
+        try:
+            area_store, pokemon_index, saved_session = future.result()
+        except Exception as e:
+            print(f"❌ Could not load the game data: {e}", file=sys.stderr)
+            loading_label.config(text=f"❌ Could not load the game data:\n{e}")
+            return
+        if not area_store.areas:
+            print(f"❌ No areas found in {area_store.path}!", file=sys.stderr)
+            loading_label.config(text=f"❌ No areas found in {area_store.path}!")
+            return
+        if not pokemon_index:
+            print("❌ No Pokémon data found in pokemon.json!")
+            loading_label.config(text="❌ No Pokémon data found in pokemon.json!")
+            return
+        loading_label.destroy()
+        cleanup.extend(build_main_window(
+            root, streams, fresh, area_store, pokemon_index, saved_session))
+        print(f"✅ Ready after {(time.perf_counter() - STARTED) * 1000:.0f} ms")
+
+    finish_loading()
+    root.mainloop()
+    for close in cleanup:
+        close()
+
+
+def build_main_window(root, streams, fresh, area_store, pokemon_index, saved_session):
+    """Create all panels once the data is loaded; returns the cleanup callbacks"""
+    areas = area_store.areas
+
     # ---- Add style for selected Pokémon ----
     style = ttk.Style(root)
     style.configure("Selected.TFrame", background="#cce5ff")
@@ -2068,22 +1559,46 @@ def main_gui():
     battle_log = BattleLogFrame(log_frame_container)
     battle_log.pack(fill="both", expand=True)
 
-    # Pass all_pokemon_data here
-    battler_panel = BattlerFrame(
-        battler_frame_container, battle_log, all_pokemon_data)
-    battler_panel.pack(fill="both", expand=True)
+    # Sprites are fetched on worker threads so the window never freezes,
+    # and kept on disk so they show up offline next time
+    image_loader = ImageLoader(root, sprite_cache=SpriteCache())
 
-    app_panel = WilranApp(randomizer_frame, areas,
-                          all_pokemon_data, battler_panel)
-    app_panel.pack(fill="both", expand=True)
+    # Autosave: the previous session comes back unless a fresh one was asked for
+    journal = SessionJournal(state=saved_session)
+    if fresh:
+        journal.reset()
+    elif not saved_session.is_empty():
+        battle_log.log_many(saved_session.log)
 
-    # Example log messages
+    # Banner lines are shown on every launch, so they stay out of the saved log
     battle_log.log("⚔️ Battle log ready!")
     battle_log.log(
         "Tip: Choose and area, randomize Pokemon, and add to tracker.")
+    battle_log.log(
+        f"🎲 Session seed: {streams.seed} (replay with: wilran gui --seed {streams.seed})")
+    battle_log.journal = journal
 
-    root.mainloop()
+    # Pass pokemon_index here
+    battler_panel = BattlerFrame(
+        battler_frame_container, battle_log, pokemon_index, image_loader, streams.combat,
+        journal)
+    battler_panel.pack(fill="both", expand=True)
+    if not fresh and saved_session.pokemon:
+        battler_panel.restore_session(saved_session)
+
+    app_panel = WilranApp(randomizer_frame, areas,
+                          pokemon_index, battler_panel, image_loader, streams.encounter,
+                          area_store)
+    app_panel.pack(fill="both", expand=True)
+
+    return [image_loader.shutdown, journal.close]
 
 
 if __name__ == "__main__":
+    # Bulk generation starts worker processes from the frozen executable too
+    multiprocessing.freeze_support()
+    if len(sys.argv) > 1:
+        # e.g. "wilran generate --area ..." - headless, see cli.py
+        from cli import main
+        sys.exit(main())
     main_gui()
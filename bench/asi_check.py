@@ -0,0 +1,165 @@
+"""Check that the one-step ASI draw matches the old one-point-at-a-time loop
+
+    python bench/asi_check.py
+    python bench/asi_check.py --samples 500000 --seed 7
+
+For each case below, the exact distribution of final ability scores is
+worked out with fractions for both the old loop and the capped multinomial
+draw, and the two must be identical. Then engine.distribute_asi and
+bulk.distribute_asi_batch are sampled and compared against that exact
+distribution with a chi-square test. Exits with 1 if anything fails.
+"""
+import argparse
+import math
+import os
+import random
+import sys
+from collections import Counter
+from fractions import Fraction
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCES_DIR = os.path.join(ROOT, "WilranV1.1", "Sources")
+
+# (scores in ABILITY_NAMES order, ASI points)
+CASES = [
+    ((10, 10, 10, 10, 10, 10), 16),  # no cap in reach: a plain multinomial
+    ((19, 20, 18, 10, 21, 19), 8),   # one stat capped, one above the cap from its nature
+    ((19, 19, 19, 19, 19, 20), 16),  # everything caps, the rest of the points are lost
+    ((18, 18, 12, 12, 20, 20), 12),
+]
+# p-values below this fail the sampling test
+ALPHA = 0.001
+
+
+# ---------------- Exact distributions ----------------
+
+def old_loop_distribution(scores, points):
+    """{final scores: probability} of one point at a time to a random uncapped stat"""
+    from engine import ASI_CAP
+
+    states = {tuple(scores): Fraction(1)}
+    for _ in range(points):
+        next_states = Counter()
+        for state, probability in states.items():
+            uncapped = [i for i, score in enumerate(state) if score < ASI_CAP]
+            if not uncapped:
+                next_states[state] += probability
+                continue
+            for i in uncapped:
+                raised = state[:i] + (state[i] + 1,) + state[i + 1:]
+                next_states[raised] += probability / len(uncapped)
+        states = next_states
+    return dict(states)
+
+
+def compositions(total, parts):
+    if parts == 1:
+        yield (total,)
+        return
+    for first in range(total + 1):
+        for rest in compositions(total - first, parts - 1):
+            yield (first,) + rest
+
+
+def multinomial_distribution(scores, points):
+    """{final scores: probability} of the capped multinomial draw with redraws"""
+    from engine import ASI_CAP
+
+    uncapped = [i for i, score in enumerate(scores) if score < ASI_CAP]
+    if not points or not uncapped:
+        return {tuple(scores): Fraction(1)}
+    result = Counter()
+    for counts in compositions(points, len(uncapped)):
+        probability = Fraction(math.factorial(points), len(uncapped) ** points)
+        for count in counts:
+            probability /= math.factorial(count)
+        drawn = list(scores)
+        for i, count in zip(uncapped, counts):
+            drawn[i] += count
+        overflow = sum(max(0, drawn[i] - ASI_CAP) for i in uncapped)
+        for i in uncapped:
+            drawn[i] = min(drawn[i], ASI_CAP)
+        for state, sub_probability in multinomial_distribution(drawn, overflow).items():
+            result[state] += probability * sub_probability
+    return dict(result)
+
+
+# ---------------- Sampling test ----------------
+
+def chi_square_p(observed, exact, samples):
+    """Chi-square goodness of fit; outcomes expected fewer than 5 times are pooled"""
+    statistic = 0.0
+    bins = 0
+    pooled_expected = pooled_observed = 0
+    for state, probability in exact.items():
+        expected = float(probability) * samples
+        if expected < 5:
+            pooled_expected += expected
+            pooled_observed += observed.get(state, 0)
+            continue
+        statistic += (observed.get(state, 0) - expected) ** 2 / expected
+        bins += 1
+    if pooled_expected:
+        statistic += (pooled_observed - pooled_expected) ** 2 / pooled_expected
+        bins += 1
+    unexpected = sum(count for state, count in observed.items() if state not in exact)
+    if unexpected:
+        return 0.0
+    dof = bins - 1
+    if dof < 1:
+        return 1.0
+    # Wilson-Hilferty: (X/k)^(1/3) is close to normal
+    z = ((statistic / dof) ** (1 / 3) - (1 - 2 / (9 * dof))) / math.sqrt(2 / (9 * dof))
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def sample_scalar(scores, points, samples, seed):
+    from engine import ABILITY_NAMES, distribute_asi
+
+    rng = random.Random(seed)
+    attributes = dict(zip(ABILITY_NAMES, scores))
+    return Counter(tuple(distribute_asi(attributes, points, rng).values())
+                   for _ in range(samples))
+
+
+def sample_batch(scores, points, samples, seed):
+    from bulk import distribute_asi_batch, np
+
+    rows = distribute_asi_batch(
+        np.random.default_rng(seed), np.tile(scores, (samples, 1)), np.full(samples, points))
+    return Counter(map(tuple, rows.tolist()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=200_000, help="draws per case and method")
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+    sys.path.insert(0, SOURCES_DIR)
+    from bulk import np
+
+    failed = False
+    for scores, points in CASES:
+        print(f"{scores} + {points} points")
+        exact = old_loop_distribution(scores, points)
+        if multinomial_distribution(scores, points) == exact:
+            print(f"  ✅ exact distributions identical ({len(exact)} outcomes)")
+        else:
+            print("  ❌ exact distributions differ")
+            failed = True
+
+        samplers = [("distribute_asi", sample_scalar)]
+        if np is not None:
+            samplers.append(("distribute_asi_batch", sample_batch))
+        else:
+            print("  NumPy not installed - skipping distribute_asi_batch")
+        for name, sampler in samplers:
+            p = chi_square_p(sampler(scores, points, args.samples, args.seed), exact, args.samples)
+            ok = p >= ALPHA
+            failed |= not ok
+            print(f"  {'✅' if ok else '❌'} {name:<22} chi-square p = {p:.3f}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
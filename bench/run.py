@@ -0,0 +1,357 @@
+"""Benchmarks for Wilran's data loading, generation and combat hot paths
+
+    python bench/run.py                          # run everything, JSON to stdout
+    python bench/run.py -o results.json --baseline bench/baseline.json
+    python bench/run.py --save-baseline bench/baseline.json
+
+The sources and data JSON are copied to a scratch directory first, so a run
+never writes bundles or area files into the checkout. Every case draws from
+its own random.Random(SEED), so all repeats do identical work. Each case is
+run once to warm up, then --repeat times. per_op_us comes from the fastest
+run, which is the least disturbed by whatever else the machine is doing.
+"""
+import argparse
+import contextlib
+import glob
+import io
+import itertools
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCES_DIR = os.path.join(ROOT, "WilranV1.1", "Sources")
+DATA_DIR = os.path.join(ROOT, "WilranV1.1", "Wilran_V1.1")
+DATA_FILES = ("pokemon.json", "moves.json", "abilities.json", "typechart.json",
+              "areas.json", "helditems.json")
+
+SEED = 1234
+# Slower than baseline by more than this fraction counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+BENCHMARKS = []
+
+
+def benchmark(func):
+    """Register a function returning {case name: (operations, run)}"""
+    BENCHMARKS.append(func)
+    return func
+
+
+def stage(work_dir, data_dir):
+    """Copy the sources and data into work_dir and make them importable"""
+    for path in glob.glob(os.path.join(SOURCES_DIR, "*.py")):
+        shutil.copy(path, work_dir)
+    for name in DATA_FILES:
+        shutil.copy(os.path.join(data_dir, name), work_dir)
+    sys.path.insert(0, work_dir)
+
+
+# ---------------- Benchmarks ----------------
+
+@benchmark
+def loading(scale, work_dir):
+    import subprocess
+
+    import data_bundle
+    from pokemon_index import PokemonIndex
+
+    cold_dir = os.path.join(work_dir, "cold")
+    os.makedirs(cold_dir, exist_ok=True)
+    for name in DATA_FILES:
+        shutil.copy(os.path.join(work_dir, name), cold_dir)
+    bundle_path = os.path.join(cold_dir, data_bundle.BUNDLE_NAME)
+
+    def parse_json():
+        for file_name, _ in data_bundle.SOURCES.values():
+            with open(os.path.join(work_dir, file_name), "r", encoding="utf-8") as f:
+                json.load(f)
+
+    def bundle_cold():
+        if os.path.exists(bundle_path):
+            os.remove(bundle_path)
+        data_bundle.load_game_data(cold_dir)
+
+    def bundle_warm():
+        data_bundle.load_game_data(cold_dir)
+
+    def import_engine():
+        # A fresh interpreter: what every start of the app or the CLI pays before any data is read
+        subprocess.run([sys.executable, "-c", "import engine"], cwd=work_dir, check=True)
+
+    bundle_cold()
+    pokemon = data_bundle.load_game_data(cold_dir)["pokemon"]
+    return {
+        "startup.import_engine": (1, import_engine),
+        "load.parse_json": (1, parse_json),
+        "load.bundle_cold": (1, bundle_cold),
+        "load.bundle_warm": (1, bundle_warm),
+        "load.pokemon_index": (1, lambda: PokemonIndex(pokemon)),
+    }
+
+
+@benchmark
+def encounters(scale, work_dir):
+    import random
+    from area_store import load_areas
+    from engine import load_pokemon_index, pick_random_pokemon
+
+    areas = load_areas(os.path.join(work_dir, "areas.json"))
+    pokemon_index = load_pokemon_index()
+    count = 1000 * scale
+
+    def picks(area):
+        def run():
+            rng = random.Random(SEED)
+            with contextlib.redirect_stderr(io.StringIO()):
+                for _ in range(count):
+                    pick_random_pokemon(area, pokemon_index, rng)
+        return run
+
+    return {f"pick_random_pokemon[{name}]": (count, picks(area))
+            for name, area in areas.items()}
+
+
+def sample_pokemon(count):
+    """Fixed Pokémon at levels 1, 10 and 17 to attack with"""
+    import random
+    from area_store import load_areas
+    from engine import load_pokemon_index, pick_random_pokemon
+
+    rng = random.Random(SEED)
+    areas = list(load_areas().values())
+    pokemon_index = load_pokemon_index()
+    chosen = []
+    with contextlib.redirect_stderr(io.StringIO()):
+        while len(chosen) < count:
+            pokemon = pick_random_pokemon(rng.choice(areas), pokemon_index, rng)
+            if pokemon:
+                chosen.append(pokemon)
+    for pokemon, level in zip(chosen, itertools.cycle((1, 10, 17))):
+        pokemon.level = level
+    return chosen
+
+
+@benchmark
+def combat(scale, work_dir):
+    import random
+    from engine import MOVE_LOOKUP, attack_roll, calculate_move_damage
+
+    attackers = sample_pokemon(3 * scale)
+    move_ids = sorted(MOVE_LOOKUP)
+    moves = [MOVE_LOOKUP[move_id] for move_id in move_ids]
+
+    def attack_rolls():
+        rng = random.Random(SEED)
+        for pokemon in attackers:
+            for move_id in move_ids:
+                attack_roll(pokemon, move_id, rng)
+
+    def damage_rolls():
+        rng = random.Random(SEED)
+        for pokemon in attackers:
+            for move_data in moves:
+                calculate_move_damage(pokemon, move_data, 3, False, rng)
+
+    operations = len(attackers) * len(move_ids)
+    return {
+        "attack_roll.all_moves": (operations, attack_rolls),
+        "calculate_move_damage.all_moves": (operations, damage_rolls),
+    }
+
+
+@benchmark
+def type_profiles(scale, work_dir):
+    from engine import POKEMON_TYPE_CHART, POKEMON_TYPES, PokemonType
+    from type_chart import TypeChart
+
+    combos = [[t] for t in POKEMON_TYPES] + [
+        list(pair) for pair in itertools.combinations(POKEMON_TYPES, 2)]
+
+    def profiles():
+        for _ in range(10 * scale):
+            for types in combos:
+                PokemonType(types).vulnerabilities()
+
+    return {
+        "type_chart.build": (1, lambda: TypeChart(POKEMON_TYPE_CHART)),
+        "PokemonType.all_combos": (10 * scale * len(combos), profiles),
+    }
+
+
+@benchmark
+def asi(scale, work_dir):
+    import random
+    from bulk import distribute_asi_batch, np
+    from engine import distribute_asi
+
+    attributes = {"str": 12, "dex": 14, "con": 10, "int": 8, "wis": 13, "cha": 19}
+    count = 10000 * scale
+
+    def draws(points):
+        def run():
+            rng = random.Random(SEED)
+            for _ in range(count):
+                distribute_asi(attributes, points, rng)
+        return run
+
+    cases = {f"distribute_asi[{points}]": (count, draws(points)) for points in (4, 16)}
+    if np is not None:
+        scores = np.tile(list(attributes.values()), (count, 1))
+        points = np.full(count, 16)
+        cases["distribute_asi_batch[16]"] = (
+            count, lambda: distribute_asi_batch(np.random.default_rng(SEED), scores, points))
+    return cases
+
+
+def large_areas(area_count, entries_per_area, species):
+    return {
+        f"Campaign Area {i}": {
+            "name": f"Campaign Area {i}",
+            "pokemon": [{"name": species[(i + j) % len(species)], "min_level": 1,
+                         "max_level": 1 + j % 20, "rarity": "common"}
+                        for j in range(entries_per_area)],
+        }
+        for i in range(area_count)
+    }
+
+
+@benchmark
+def area_files(scale, work_dir):
+    from area_store import AreaStore, change_log_path, format_areas, write_atomic
+    from engine import load_pokemon_index
+
+    species = [s.name for s in load_pokemon_index()]
+    areas = large_areas(2000 * scale, 30, species)
+    path = os.path.join(work_dir, "large_areas.json")
+    write_atomic(path, format_areas(areas))
+    puts = 100
+    store = AreaStore(path)
+
+    def put_changes():
+        for i in range(puts):
+            name = f"Campaign Area {i}"
+            store.put(name, store.areas[name])
+        # Start the next run from an empty log, without paying for a reload
+        os.remove(change_log_path(path))
+        store._log_offset = store.pending = 0
+
+    def compact():
+        store.pending = 1
+        store.compact()
+
+    return {
+        "areas.format_large": (1, lambda: format_areas(areas)),
+        "areas.load_large": (1, lambda: AreaStore(path)),
+        "areas.put_large": (puts, put_changes),
+        "areas.compact_large": (1, compact),
+    }
+
+
+# ---------------- Runner ----------------
+
+def measure(operations, run, repeat):
+    run()  # warm-up: caches, bundles, lazily built tables
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    return {
+        "operations": operations,
+        "median_s": statistics.median(times),
+        "best_s": best,
+        "per_op_us": best / operations * 1e6,
+        "ops_per_s": operations / best if best else None,
+    }
+
+
+def run_benchmarks(scale=1, repeat=5, only=None, data_dir=DATA_DIR):
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="wilran-bench-") as work_dir:
+        stage(work_dir, data_dir)
+        for func in BENCHMARKS:
+            for name, (operations, run) in func(scale, work_dir).items():
+                if only and not any(part in name for part in only):
+                    continue
+                results[name] = measure(operations, run, repeat)
+                print(f"{name:<60} {results[name]['per_op_us']:>12.2f} us/op", file=sys.stderr)
+    return {
+        "meta": {
+            "seed": SEED,
+            "scale": scale,
+            "repeat": repeat,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold):
+    """Print each case against the baseline; returns the regressed case names"""
+    regressions = []
+    for name, result in report["results"].items():
+        base = baseline["results"].get(name)
+        if not base:
+            continue
+        ratio = result["per_op_us"] / base["per_op_us"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  ❌ REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 / (1 + threshold):
+            flag = "  ✅ faster"
+        print(f"{name:<60} {ratio:>6.2f}x baseline{flag}", file=sys.stderr)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="write the JSON results here instead of stdout")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before a case fails (default 0.25 = 25%%)")
+    parser.add_argument("--save-baseline", metavar="PATH",
+                        help="also write the results as a new baseline")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    parser.add_argument("--scale", type=int, default=1, help="multiply the workload")
+    parser.add_argument("--only", action="append",
+                        help="run cases whose name contains this (repeatable)")
+    parser.add_argument("--data", default=DATA_DIR, help="folder with the data JSON files")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.scale, args.repeat, args.only, args.data)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("scale") != args.scale:
+            print("❌ Baseline was recorded with a different --scale", file=sys.stderr)
+            return 2
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} case(s) slower than baseline by more than "
+                  f"{args.threshold:.0%}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Check that area_sampler follows edits to an area's entries
+
+    python bench/sampling_check.py
+
+Edits an entry's rarity in place, the way the area builder and a store
+reload do, and checks that area_sampler draws with the new weights instead
+of returning the tables built for the old ones. Also checks that the table
+cache stays within AREA_SAMPLER_CACHE. Exits with 1 if anything fails.
+"""
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCES_DIR = os.path.join(ROOT, "WilranV1.1", "Sources")
+
+SAMPLES = 100_000
+# Allowed distance between the drawn and the expected share of an entry
+TOLERANCE = 0.01
+
+
+def share_of_first(sampler, seed):
+    rng = random.Random(seed)
+    return sum(sampler.sample_index(rng) == 0 for _ in range(SAMPLES)) / SAMPLES
+
+
+def main():
+    sys.path.insert(0, SOURCES_DIR)
+    from sampling import AREA_SAMPLER_CACHE, RARITY_WEIGHTS, _area_samplers, area_sampler
+
+    checks = []
+    area = {"pokemon": [
+        {"name": "Pidgey", "min_level": 1, "max_level": 3, "rarity": "common"},
+        {"name": "Pikachu", "min_level": 1, "max_level": 3, "rarity": "common"},
+    ]}
+    before = share_of_first(area_sampler(area), 1)
+    checks.append(("equal rarities draw evenly", abs(before - 0.5) < TOLERANCE))
+
+    area["pokemon"][1]["rarity"] = "rare"
+    common, rare = RARITY_WEIGHTS["common"], RARITY_WEIGHTS["rare"]
+    sampler = area_sampler(area)
+    after = share_of_first(sampler, 1)
+    checks.append(("editing a rarity in place changes the draw",
+                   abs(after - common / (common + rare)) < TOLERANCE))
+    checks.append(("the sampler draws the current entries", sampler.items is area["pokemon"]))
+
+    for weight in range(1, AREA_SAMPLER_CACHE + 10):
+        area_sampler({"pokemon": [{"name": "Mew", "weight": weight}, {"name": "Mew", "weight": 1}]})
+    checks.append(("the table cache is bounded", len(_area_samplers) <= AREA_SAMPLER_CACHE))
+
+    for name, ok in checks:
+        print(f"{'✅' if ok else '❌'} {name}")
+    return 0 if all(ok for _, ok in checks) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())